@@ -16,17 +16,20 @@ if (!admin.apps.length) {
 import { authMiddleware } from './middleware/authMiddleware';
 import { rateLimitMiddleware } from './middleware/rateLimitMiddleware';
 import { usageMiddleware } from './middleware/usageMiddleware';
+import { decompressionMiddleware, SUPPORTED_REQUEST_ENCODINGS } from './middleware/decompressionMiddleware';
 
 // Import route handlers
 import { parseHandler } from './routes/parseRoutes';
 import { userRoutes } from './routes/userRoutes';
+import { schemaRoutes, SUPPORTED_SCHEMA_TYPES } from './routes/schemaRoutes';
 
 // Create Express app
 const app = express();
 
 // Basic middleware
 app.use(cors({ origin: true }));
-app.use(express.json({ limit: '10mb' }));
+app.use(decompressionMiddleware); // zstd bodies and 415 negotiation
+app.use(express.json({ limit: '10mb', inflate: true })); // gzip/deflate bodies
 
 // Global error handler
 app.use((err: Error, req: Request, res: Response, next: NextFunction) => {
@@ -62,6 +65,7 @@ app.get('/', (req, res) => {
       'GET /health': 'Health check',
       'GET /v1/info': 'API information',
       'POST /v1/parse': 'Parse data with authentication',
+      'POST /v1/schemas': 'Register an output schema for use as outputSchemaRef',
       'POST /v1/user/keys': 'Generate API keys',
       'GET /v1/user/usage': 'Get usage statistics'
     }
@@ -79,6 +83,8 @@ app.get('/v1/info', (req, res) => {
       keyFormat: 'pk_test_* or pk_live_*',
       anonymous: 'Limited trial access available'
     },
+    requestEncodings: SUPPORTED_REQUEST_ENCODINGS,
+    schemaTypes: SUPPORTED_SCHEMA_TYPES,
     limits: {
       anonymous: '10 requests/day',
       free: '50 requests/day', 
@@ -94,12 +100,17 @@ app.use('/v1/parse', authMiddleware);
 app.use('/v1/parse', rateLimitMiddleware);
 app.use('/v1/parse', usageMiddleware);
 
+// Schema registration shares the parse quota
+app.use('/v1/schemas', authMiddleware);
+app.use('/v1/schemas', rateLimitMiddleware);
+
 // Apply authentication to user management routes
 app.use('/v1/user', authMiddleware);
 app.use('/v1/user', rateLimitMiddleware);
 
 // Route handlers
 app.post('/v1/parse', parseHandler);
+app.use('/v1/schemas', schemaRoutes);
 app.use('/v1/user', userRoutes);
 
 // 404 handler
@@ -108,7 +119,7 @@ app.use('*', (req, res) => {
     error: 'Not found',
     path: req.path,
     method: req.method,
-    availableEndpoints: ['/health', '/v1/info', '/v1/parse', '/v1/user/keys', '/v1/user/usage']
+    availableEndpoints: ['/health', '/v1/info', '/v1/parse', '/v1/schemas', '/v1/user/keys', '/v1/user/usage']
   });
 });
 
@@ -0,0 +1,59 @@
+import { decompressionMiddleware, SUPPORTED_REQUEST_ENCODINGS } from './decompressionMiddleware';
+import { Request, Response } from 'express';
+import { Readable } from 'stream';
+import * as zlib from 'zlib';
+
+function mockRequest(body: Buffer, encoding?: string): Request {
+  const req = Readable.from([body]) as any;
+  req.headers = encoding ? { 'content-encoding': encoding } : {};
+  return req as Request;
+}
+
+describe('decompressionMiddleware', () => {
+  let mockRes: Partial<Response>;
+  let next: jest.Mock;
+
+  beforeEach(() => {
+    mockRes = {
+      status: jest.fn().mockReturnThis(),
+      json: jest.fn(),
+      setHeader: jest.fn(),
+      headersSent: false,
+    };
+    next = jest.fn();
+  });
+
+  it('passes identity and gzip bodies through to express.json', () => {
+    decompressionMiddleware(mockRequest(Buffer.from('{}')), mockRes as Response, next);
+    decompressionMiddleware(mockRequest(zlib.gzipSync('{}'), 'gzip'), mockRes as Response, next);
+
+    expect(next).toHaveBeenCalledTimes(2);
+    expect(mockRes.status).not.toHaveBeenCalled();
+  });
+
+  it('rejects unknown encodings with 415 and advertises supported ones', () => {
+    decompressionMiddleware(mockRequest(Buffer.from('{}'), 'br'), mockRes as Response, next);
+
+    expect(next).not.toHaveBeenCalled();
+    expect(mockRes.status).toHaveBeenCalledWith(415);
+    expect(mockRes.setHeader).toHaveBeenCalledWith('Accept-Encoding', SUPPORTED_REQUEST_ENCODINGS.join(', '));
+    expect(mockRes.json).toHaveBeenCalledWith(expect.objectContaining({
+      success: false,
+      error: expect.objectContaining({ code: 'UNSUPPORTED_CONTENT_ENCODING' }),
+    }));
+  });
+
+  const zstdCompress = (zlib as any).zstdCompressSync;
+  (zstdCompress ? it : it.skip)('decodes zstd bodies into req.body', async () => {
+    const payload = { inputData: 'x'.repeat(1000), outputSchema: { name: 'string' } };
+    const req = mockRequest(zstdCompress(Buffer.from(JSON.stringify(payload))), 'zstd');
+
+    await new Promise<void>((resolve) => {
+      next.mockImplementation(() => resolve());
+      decompressionMiddleware(req, mockRes as Response, next);
+    });
+
+    expect(req.body).toEqual(payload);
+    expect((req as any)._body).toBe(true);
+  });
+});
@@ -0,0 +1,81 @@
+/**
+ * Request Decompression Middleware
+ * Negotiates Content-Encoding for compressed request bodies
+ */
+
+import { Request, Response, NextFunction } from 'express';
+import * as zlib from 'zlib';
+
+// Encodings that express.json() inflates on its own
+const BODY_PARSER_ENCODINGS = ['identity', 'gzip', 'deflate'];
+
+// zstd decompression only ships with newer Node releases
+const createZstdDecompress: (() => NodeJS.ReadWriteStream) | undefined =
+  (zlib as any).createZstdDecompress;
+
+export const SUPPORTED_REQUEST_ENCODINGS = createZstdDecompress
+  ? [...BODY_PARSER_ENCODINGS, 'zstd']
+  : BODY_PARSER_ENCODINGS;
+
+// Same ceiling as the express.json() body limit, applied after decompression
+const MAX_DECOMPRESSED_BYTES = 10 * 1024 * 1024;
+
+function sendError(res: Response, status: number, code: string, message: string) {
+  if (res.headersSent) {
+    return;
+  }
+  res.status(status).json({
+    success: false,
+    error: { code, message }
+  });
+}
+
+export const decompressionMiddleware = (req: Request, res: Response, next: NextFunction) => {
+  const encoding = (req.headers['content-encoding'] || 'identity').toLowerCase().trim();
+
+  if (BODY_PARSER_ENCODINGS.includes(encoding)) {
+    return next();
+  }
+
+  if (encoding !== 'zstd' || !createZstdDecompress) {
+    // RFC 7694: advertise the request encodings we do accept
+    res.setHeader('Accept-Encoding', SUPPORTED_REQUEST_ENCODINGS.join(', '));
+    return sendError(res, 415, 'UNSUPPORTED_CONTENT_ENCODING',
+      `Content-Encoding "${encoding}" is not supported`);
+  }
+
+  const chunks: Buffer[] = [];
+  let size = 0;
+  let failed = false;
+  const stream = req.pipe(createZstdDecompress());
+
+  stream.on('data', (chunk: Buffer) => {
+    size += chunk.length;
+    if (size > MAX_DECOMPRESSED_BYTES) {
+      failed = true;
+      req.unpipe();
+      sendError(res, 413, 'PAYLOAD_TOO_LARGE', 'Decompressed request body exceeds 10MB');
+      return;
+    }
+    chunks.push(chunk);
+  });
+
+  stream.on('error', () => {
+    failed = true;
+    sendError(res, 400, 'INVALID_CONTENT_ENCODING', 'Request body could not be decompressed');
+  });
+
+  stream.on('end', () => {
+    if (failed) {
+      return;
+    }
+    try {
+      req.body = JSON.parse(Buffer.concat(chunks).toString('utf-8'));
+    } catch (e) {
+      return sendError(res, 400, 'INVALID_JSON', 'Decompressed request body is not valid JSON');
+    }
+    // Tell express.json() the body has already been parsed
+    (req as any)._body = true;
+    next();
+  });
+};
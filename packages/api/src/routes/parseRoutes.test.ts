@@ -1,4 +1,4 @@
-import { parseHandler } from './parseRoutes'; // Adjust path as needed
+import { DEADLINE_HEADER, isReusablePlan, parseHandler, requestDeadline } from './parseRoutes'; // Adjust path as needed
 import { AuthenticatedRequest } from '../middleware/authMiddleware'; // Adjust path as needed
 import { Response } from 'express';
 
@@ -130,6 +130,93 @@ describe('parseHandler', () => {
     });
   });
 
+  describe('Schema References', () => {
+    it('should return 422 SCHEMA_NOT_FOUND for an unknown outputSchemaRef', async () => {
+      mockReq.body = {
+        inputData: 'Valid input',
+        outputSchemaRef: 'ffffffffffffffff',
+      };
+
+      await parseHandler(mockReq as AuthenticatedRequest, mockRes as Response);
+
+      expect(mockRes.status).toHaveBeenCalledWith(422);
+      expect(mockRes.json).toHaveBeenCalledWith(
+        expect.objectContaining({
+          success: false,
+          error: expect.objectContaining({ code: 'SCHEMA_NOT_FOUND' }),
+        })
+      );
+      expect(mockGetGenerativeModel).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('Client Deadlines', () => {
+    it('should read the remaining budget from the deadline header', () => {
+      const withHeader = (value?: string) => ({ headers: value === undefined ? {} : { [DEADLINE_HEADER]: value } }) as any;
+
+      expect(requestDeadline(withHeader('250'), 1000)).toBe(1250);
+      expect(requestDeadline(withHeader(), 1000)).toBeNull();
+      expect(requestDeadline(withHeader('soon'), 1000)).toBeNull();
+      expect(requestDeadline(withHeader('-5'), 1000)).toBeNull();
+    });
+
+    it('should return 408 DEADLINE_EXCEEDED without calling Gemini once the deadline has passed', async () => {
+      mockReq.headers = { [DEADLINE_HEADER]: '0' };
+      mockReq.body = {
+        inputData: 'Valid input',
+        outputSchema: { data: 'string' },
+      };
+
+      await parseHandler(mockReq as AuthenticatedRequest, mockRes as Response);
+
+      expect(mockRes.status).toHaveBeenCalledWith(408);
+      expect(mockRes.json).toHaveBeenCalledWith(
+        expect.objectContaining({
+          success: false,
+          error: expect.objectContaining({ code: 'DEADLINE_EXCEEDED' }),
+        })
+      );
+      expect(mockGenerateContent).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('Architect Plan Replay', () => {
+    const plan = {
+      steps: [{ field: 'data', instruction: 'Find data', pattern: '.*', validation: 'string' }],
+      confidence: 0.9,
+      strategy: 'field-by-field extraction',
+    };
+
+    it('should accept only plans with one well-formed step per schema field', () => {
+      expect(isReusablePlan(plan, { data: 'string' })).toBe(true);
+      expect(isReusablePlan(plan, { data: 'string', other: 'number' })).toBe(false);
+      expect(isReusablePlan(plan, { other: 'string' })).toBe(false);
+      expect(isReusablePlan({ ...plan, steps: [{ field: 'data' }] }, { data: 'string' })).toBe(false);
+      expect(isReusablePlan(undefined, { data: 'string' })).toBe(false);
+    });
+
+    it('should skip the Architect stage when a valid plan is supplied', async () => {
+      mockGenerateContent.mockReset().mockResolvedValueOnce({
+        response: { text: () => JSON.stringify({ data: null }) },
+      });
+      mockReq.body = {
+        inputData: 'Valid input',
+        outputSchema: { data: 'string' },
+        architectPlan: plan,
+      };
+
+      await parseHandler(mockReq as AuthenticatedRequest, mockRes as Response);
+
+      expect(mockGenerateContent).toHaveBeenCalledTimes(1);
+      expect(mockRes.json).toHaveBeenCalledWith(
+        expect.objectContaining({
+          success: true,
+          metadata: expect.objectContaining({ planReused: true, confidence: 0 }),
+        })
+      );
+    });
+  });
+
   describe('Malformed JSON Error Handling', () => {
     beforeEach(() => {
         process.env.NODE_ENV = 'development'; // For checking 'details' field
@@ -6,6 +6,7 @@
 import { Response } from 'express';
 import { AuthenticatedRequest } from '../middleware/authMiddleware';
 import { GoogleGenerativeAI, SchemaType } from '@google/generative-ai';
+import { resolveSchemaRef } from './schemaRoutes';
 
 // Define structured output schemas for Gemini
 const architectSchema = {
@@ -73,12 +74,101 @@ function createExtractorSchema(outputSchema: Record<string, any>) {
   };
 }
 
+// Largest client-supplied SearchPlan accepted for replay
+const MAX_REPLAYED_PLAN_BYTES = 16 * 1024;
+
+/**
+ * Check that a client-supplied SearchPlan can stand in for the Architect stage:
+ * it must be well formed and have exactly one step per schema field
+ */
+export function isReusablePlan(plan: any, outputSchema: Record<string, any>): boolean {
+  if (!plan || typeof plan !== 'object' || !Array.isArray(plan.steps)) {
+    return false;
+  }
+  if (typeof plan.confidence !== 'number' || typeof plan.strategy !== 'string') {
+    return false;
+  }
+  if (Buffer.byteLength(JSON.stringify(plan), 'utf-8') > MAX_REPLAYED_PLAN_BYTES) {
+    return false;
+  }
+
+  const fields = new Set(Object.keys(outputSchema));
+  const covered = new Set<string>();
+  for (const step of plan.steps) {
+    const wellFormed = step && ['field', 'instruction', 'pattern', 'validation']
+      .every(key => typeof step[key] === 'string');
+    if (!wellFormed || !fields.has(step.field)) {
+      return false;
+    }
+    covered.add(step.field);
+  }
+  return covered.size === fields.size;
+}
+
+/**
+ * Fraction of schema fields the Extractor filled in
+ */
+function fieldCoverage(parsedData: Record<string, any>, outputSchema: Record<string, any>): number {
+  const fields = Object.keys(outputSchema);
+  const filled = fields.filter(field => parsedData[field] !== null && parsedData[field] !== undefined && parsedData[field] !== '');
+  return fields.length ? filled.length / fields.length : 1;
+}
+
+// Remaining client budget in milliseconds, sent by SDKs that set a deadline
+export const DEADLINE_HEADER = 'x-parserator-deadline-ms';
+
+/**
+ * Absolute time (ms since epoch) after which the caller has given up,
+ * or null when the request carries no valid deadline header
+ */
+export function requestDeadline(req: AuthenticatedRequest, receivedAt: number): number | null {
+  const raw = req.headers ? req.headers[DEADLINE_HEADER] : undefined;
+  const budget = Number(Array.isArray(raw) ? raw[0] : raw);
+  if (raw === undefined || raw === '' || !Number.isFinite(budget) || budget < 0) {
+    return null;
+  }
+  return receivedAt + budget;
+}
+
+function deadlineExceeded(res: Response, stage: string, startTime: number) {
+  console.log(`⏱️ Client deadline passed before ${stage}, abandoning request`);
+  return res.status(408).json({
+    success: false,
+    error: {
+      code: 'DEADLINE_EXCEEDED',
+      message: `Client deadline passed before the ${stage} stage`
+    },
+    metadata: {
+      processingTimeMs: Date.now() - startTime,
+      requestId: `req_${Date.now()}`,
+      timestamp: new Date().toISOString(),
+      version: '2.0.0'
+    }
+  });
+}
+
 export const parseHandler = async (req: AuthenticatedRequest, res: Response) => {
   const startTime = Date.now();
+  const deadline = requestDeadline(req, startTime);
   
   try {
     // Validate input
-    const { inputData, outputSchema } = req.body;
+    const { inputData, outputSchemaRef, architectPlan } = req.body;
+    let { outputSchema } = req.body;
+
+    // Registered schemas may be referenced by hash instead of sent in full
+    if (!outputSchema && typeof outputSchemaRef === 'string') {
+      outputSchema = await resolveSchemaRef(outputSchemaRef);
+      if (!outputSchema) {
+        return res.status(422).json({
+          success: false,
+          error: {
+            code: 'SCHEMA_NOT_FOUND',
+            message: `Unknown outputSchemaRef ${outputSchemaRef}; send outputSchema or register it via POST /v1/schemas`
+          }
+        });
+      }
+    }
     
     if (!inputData || !outputSchema) {
       return res.status(400).json({
@@ -128,17 +218,27 @@ export const parseHandler = async (req: AuthenticatedRequest, res: Response) =>
     // Initialize Gemini with structured output support
     const genAI = new GoogleGenerativeAI(apiKey);
     
-    // STAGE 1: ARCHITECT with structured output
-    const architectModel = genAI.getGenerativeModel({
-      model: 'gemini-1.5-flash',
-      generationConfig: {
-        responseMimeType: 'application/json',
-        responseSchema: architectSchema
-      }
-    });
+    // STAGE 1: ARCHITECT with structured output, unless the client replayed a plan
+    let searchPlan: any;
+    let architectPrompt = '';
+    const planReused = isReusablePlan(architectPlan, outputSchema);
+    if (deadline !== null && Date.now() >= deadline) {
+      return deadlineExceeded(res, planReused ? 'Extractor' : 'Architect', startTime);
+    }
+    if (planReused) {
+      console.log('♻️ Reusing client-supplied SearchPlan, skipping Architect');
+      searchPlan = architectPlan;
+    } else {
+      const architectModel = genAI.getGenerativeModel({
+        model: 'gemini-1.5-flash',
+        generationConfig: {
+          responseMimeType: 'application/json',
+          responseSchema: architectSchema
+        }
+      });
 
-    const sample = inputData.substring(0, 1000); // First 1KB for planning
-    const architectPrompt = `You are the Architect in a two-stage parsing system. Create a detailed SearchPlan for extracting data.
+      const sample = inputData.substring(0, 1000); // First 1KB for planning
+      architectPrompt = `You are the Architect in a two-stage parsing system. Create a detailed SearchPlan for extracting data.
 
 SAMPLE DATA:
 ${sample}
@@ -159,42 +259,45 @@ INSTRUCTIONS:
 
 Create a comprehensive SearchPlan that the Extractor can follow exactly.`;
 
-    console.log('🏗️ Calling Architect with structured output...');
-    const architectResult = await architectModel.generateContent(architectPrompt);
-    const architectResponse = architectResult.response.text();
-    
-    let searchPlan;
-    try {
-      const parsedArchitect = JSON.parse(architectResponse);
-      // Ensure searchPlan is correctly extracted, even if the root object is the plan itself
-      searchPlan = parsedArchitect.searchPlan || parsedArchitect;
-      if (!searchPlan || typeof searchPlan !== 'object' || !searchPlan.steps) {
-        // Basic validation that searchPlan looks like a plan
-        console.error('❌ Architect response parsed, but searchPlan structure is invalid:', parsedArchitect);
+      console.log('🏗️ Calling Architect with structured output...');
+      const architectResult = await architectModel.generateContent(architectPrompt);
+      const architectResponse = architectResult.response.text();
+      
+      try {
+        const parsedArchitect = JSON.parse(architectResponse);
+        // Ensure searchPlan is correctly extracted, even if the root object is the plan itself
+        searchPlan = parsedArchitect.searchPlan || parsedArchitect;
+        if (!searchPlan || typeof searchPlan !== 'object' || !searchPlan.steps) {
+          // Basic validation that searchPlan looks like a plan
+          console.error('❌ Architect response parsed, but searchPlan structure is invalid:', parsedArchitect);
+          return res.status(422).json({
+              success: false,
+              error: {
+                  code: 'ARCHITECT_INVALID_RESPONSE_STRUCTURE',
+                  message: 'Failed to parse valid SearchPlan structure from Architect service.',
+                  details: process.env.NODE_ENV === 'development' ? { rawResponse: architectResponse } : undefined,
+              },
+          });
+        }
+        console.log('✅ Architect structured output success');
+      } catch (e) {
+        const errorMessage = e instanceof Error ? e.message : String(e);
+        console.error('❌ Architect JSON parsing failed:', errorMessage);
         return res.status(422).json({
-            success: false,
-            error: {
-                code: 'ARCHITECT_INVALID_RESPONSE_STRUCTURE',
-                message: 'Failed to parse valid SearchPlan structure from Architect service.',
-                details: process.env.NODE_ENV === 'development' ? { rawResponse: architectResponse } : undefined,
-            },
+          success: false,
+          error: {
+            code: 'ARCHITECT_PARSE_FAILED',
+            message: 'Failed to parse response from Architect service. The input data may have caused an issue.',
+            details: process.env.NODE_ENV === 'development' ? { error: errorMessage, rawResponse: architectResponse } : undefined,
+          },
         });
       }
-      console.log('✅ Architect structured output success');
-    } catch (e) {
-      const errorMessage = e instanceof Error ? e.message : String(e);
-      console.error('❌ Architect JSON parsing failed:', errorMessage);
-      return res.status(422).json({
-        success: false,
-        error: {
-          code: 'ARCHITECT_PARSE_FAILED',
-          message: 'Failed to parse response from Architect service. The input data may have caused an issue.',
-          details: process.env.NODE_ENV === 'development' ? { error: errorMessage, rawResponse: architectResponse } : undefined,
-        },
-      });
     }
 
     // STAGE 2: EXTRACTOR with dynamic structured output
+    if (!planReused && deadline !== null && Date.now() >= deadline) {
+      return deadlineExceeded(res, 'Extractor', startTime);
+    }
     const extractorSchema = createExtractorSchema(outputSchema);
     const extractorModel = genAI.getGenerativeModel({
       model: 'gemini-1.5-flash',
@@ -260,6 +363,10 @@ Execute the plan and return the extracted data.`;
     const processingTime = Date.now() - startTime;
     const tokensUsed = Math.floor((architectPrompt.length + extractorPrompt.length) / 4);
     const requestId = `req_${Date.now()}`;
+    // A replayed plan's own confidence says nothing about this input, so scale it by how much was found
+    const confidence = planReused
+      ? (searchPlan.confidence || 0.85) * fieldCoverage(parsedData, outputSchema)
+      : searchPlan.confidence || 0.85;
 
     // Return successful response (usage tracking happens in middleware)
     res.json({
@@ -267,13 +374,14 @@ Execute the plan and return the extracted data.`;
       parsedData: parsedData,
       metadata: {
         architectPlan: searchPlan,
-        confidence: searchPlan.confidence || 0.85,
+        confidence: confidence,
+        planReused: planReused,
         tokensUsed: tokensUsed,
         processingTimeMs: processingTime,
         requestId: requestId,
         timestamp: new Date().toISOString(),
         version: '2.0.0',
-        features: ['structured-outputs', 'express-architecture', 'api-key-auth'],
+        features: ['structured-outputs', 'express-architecture', 'api-key-auth', 'plan-replay'],
         userTier: req.isAnonymous ? 'anonymous' : req.user!.tier,
         billing: req.isAnonymous ? 'trial_usage' : 'api_key_usage',
         userId: req.isAnonymous ? null : req.user!.id
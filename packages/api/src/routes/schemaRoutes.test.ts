@@ -0,0 +1,25 @@
+import { canonicalizeSchema, resolveSchemaRef, schemaRef, validateSchema } from './schemaRoutes';
+
+describe('schema registry helpers', () => {
+  it('canonicalizes field order and type case', () => {
+    expect(canonicalizeSchema({ name: 'String ', amount: 'NUMBER' })).toEqual({ amount: 'number', name: 'string' });
+    expect(Object.keys(canonicalizeSchema({ b: 'string', a: 'string' }))).toEqual(['a', 'b']);
+  });
+
+  it('hashes schemas the same way as the Python SDK fingerprint', () => {
+    // Values from parserator.cache.schema_fingerprint
+    expect(schemaRef({ amount: 'number', name: 'string' })).toBe('e866abeb6fc48a21');
+    expect(schemaRef({ 'név': 'string' })).toBe('7761cc950baba0ca');
+  });
+
+  it('reports unsupported types and empty schemas', () => {
+    expect(validateSchema({ name: 'string', total: 'number' })).toEqual([]);
+    expect(validateSchema({})).toHaveLength(1);
+    expect(validateSchema(['string'])).toHaveLength(1);
+    expect(validateSchema({ name: 'strng', count: 3 })).toHaveLength(2);
+  });
+
+  it('returns null for unknown references when Firestore is unavailable', async () => {
+    await expect(resolveSchemaRef('0000000000000000')).resolves.toBeNull();
+  });
+});
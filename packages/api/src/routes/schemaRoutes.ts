@@ -0,0 +1,151 @@
+/**
+ * Schema Registry Routes
+ * Register output schemas once and reference them by hash in parse requests
+ */
+
+import { Router, Response } from 'express';
+import { createHash } from 'crypto';
+import * as admin from 'firebase-admin';
+import { AuthenticatedRequest } from '../middleware/authMiddleware';
+
+export const SUPPORTED_SCHEMA_TYPES = [
+  'string', 'number', 'boolean', 'array', 'object', 'date', 'email', 'phone', 'url'
+];
+
+// Recently used schemas kept in memory per instance; Firestore is the source of truth
+const MAX_CACHED_SCHEMAS = 1000;
+const schemaCache = new Map<string, Record<string, string>>();
+
+const router = Router();
+
+function schemasCollection(): admin.firestore.CollectionReference | null {
+  try {
+    return admin.firestore().collection('schemas');
+  } catch (error) {
+    return null; // Firebase not initialised (tests, local tools)
+  }
+}
+
+function remember(ref: string, schema: Record<string, string>): void {
+  schemaCache.delete(ref);
+  schemaCache.set(ref, schema);
+  if (schemaCache.size > MAX_CACHED_SCHEMAS) {
+    schemaCache.delete(schemaCache.keys().next().value as string);
+  }
+}
+
+/**
+ * Validate an output schema, returning a list of problems (empty if valid)
+ */
+export function validateSchema(schema: unknown): string[] {
+  if (!schema || typeof schema !== 'object' || Array.isArray(schema) || Object.keys(schema).length === 0) {
+    return ['schema must be a non-empty object of field name to type'];
+  }
+
+  const problems: string[] = [];
+  for (const [field, type] of Object.entries(schema as Record<string, unknown>)) {
+    if (!field.trim()) {
+      problems.push('field names must be non-empty');
+    } else if (typeof type !== 'string' || !SUPPORTED_SCHEMA_TYPES.includes(type.trim().toLowerCase())) {
+      problems.push(`field '${field}' has unsupported type ${JSON.stringify(type)}`);
+    }
+  }
+  return problems;
+}
+
+/**
+ * Sort fields and normalise type names so equal schemas hash equally
+ */
+export function canonicalizeSchema(schema: Record<string, string>): Record<string, string> {
+  const canonical: Record<string, string> = {};
+  for (const field of Object.keys(schema).sort()) {
+    canonical[field] = schema[field].trim().toLowerCase();
+  }
+  return canonical;
+}
+
+/**
+ * Content hash of a canonical schema; matches the Python SDK's schema fingerprint
+ */
+export function schemaRef(canonical: Record<string, string>): string {
+  return createHash('sha256').update(JSON.stringify(canonical), 'utf8').digest('hex').slice(0, 16);
+}
+
+/**
+ * Look up a registered schema by reference
+ */
+export async function resolveSchemaRef(ref: string): Promise<Record<string, string> | null> {
+  const cached = schemaCache.get(ref);
+  if (cached) {
+    remember(ref, cached);
+    return cached;
+  }
+
+  const collection = schemasCollection();
+  if (!collection) {
+    return null;
+  }
+  try {
+    const doc = await collection.doc(ref).get();
+    const schema = doc.exists ? (doc.data()!.outputSchema as Record<string, string>) : null;
+    if (schema) {
+      remember(ref, schema);
+    }
+    return schema;
+  } catch (error) {
+    console.error('❌ Schema lookup failed:', error);
+    return null;
+  }
+}
+
+// Register an output schema
+router.post('/', async (req: AuthenticatedRequest, res: Response) => {
+  const { outputSchema } = req.body;
+  const problems = validateSchema(outputSchema);
+  if (problems.length > 0) {
+    return res.status(400).json({
+      success: false,
+      error: {
+        code: 'INVALID_SCHEMA',
+        message: problems.join('; ')
+      }
+    });
+  }
+
+  const canonical = canonicalizeSchema(outputSchema);
+  const ref = schemaRef(canonical);
+  remember(ref, canonical);
+
+  const collection = schemasCollection();
+  if (collection) {
+    try {
+      await collection.doc(ref).set({ outputSchema: canonical, created: new Date() }, { merge: true });
+    } catch (error) {
+      // Still usable on this instance; other instances answer SCHEMA_NOT_FOUND and clients resend
+      console.error('❌ Schema persistence failed:', error);
+    }
+  }
+
+  res.json({
+    success: true,
+    schemaRef: ref,
+    outputSchema: canonical
+  });
+});
+
+// Fetch a registered schema
+router.get('/:ref', async (req: AuthenticatedRequest, res: Response) => {
+  const schema = await resolveSchemaRef(req.params.ref);
+  if (!schema) {
+    return res.status(404).json({
+      success: false,
+      error: {
+        code: 'SCHEMA_NOT_FOUND',
+        message: `No schema registered as ${req.params.ref}`
+      }
+    });
+  }
+  res.json({ success: true, schemaRef: req.params.ref, outputSchema: schema });
+});
+
+export { router as schemaRoutes };
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the Parserator Python SDK
+
+Every scenario runs against :class:`parserator.testing.StubAPI`, so no API
+key or network access is needed and results are comparable between runs.
+Each scenario reports throughput, p50/p99 latency, CPU time per request and
+peak Python memory, and the whole run is written as JSON so results can be
+diffed or tracked in CI.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --quick --output results.json
+    python benchmarks/run.py --scenario sync_parse_many --latency 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from parserator import AsyncParserator, Instrumentation, Parserator, __version__
+from parserator.instrumentation import LatencyHistogram
+from parserator.testing import StubAPI
+
+SCHEMA = {
+    "name": "string",
+    "email": "email",
+    "phone": "phone",
+    "company": "string",
+}
+
+SAMPLE = "Jane Doe, Senior Engineer at Acme Corp, jane.doe@acme.example, +1 (555) 010-2030"
+
+
+class Scenario:
+    """One benchmark: builds a client, runs ``requests`` parse calls"""
+
+    def __init__(self, name: str, run: Callable[[StubAPI, Instrumentation, int], int]):
+        self.name = name
+        self.run = run
+
+
+def _client(stub: StubAPI, instrumentation: Instrumentation, **kwargs: Any) -> Parserator:
+    return Parserator(
+        api_key="pk_test_bench",
+        transport=stub.transport(),
+        instrumentation=instrumentation,
+        **kwargs
+    )
+
+
+def _async_client(stub: StubAPI, instrumentation: Instrumentation, **kwargs: Any) -> AsyncParserator:
+    return AsyncParserator(
+        api_key="pk_test_bench",
+        transport=stub.async_transport(),
+        instrumentation=instrumentation,
+        **kwargs
+    )
+
+
+def sync_sequential(stub: StubAPI, instrumentation: Instrumentation, requests: int) -> int:
+    errors = 0
+    with _client(stub, instrumentation) as client:
+        for i in range(requests):
+            result = client.parse(f"{SAMPLE} #{i}", SCHEMA)
+            errors += not result["success"]
+    return errors
+
+
+def sync_parse_many(stub: StubAPI, instrumentation: Instrumentation, requests: int) -> int:
+    inputs = [f"{SAMPLE} #{i}" for i in range(requests)]
+    errors = 0
+    with _client(stub, instrumentation) as client:
+        for _, result in client.parse_many(inputs, SCHEMA, concurrency=16):
+            errors += not result["success"]
+    return errors
+
+
+def async_parse_many(stub: StubAPI, instrumentation: Instrumentation, requests: int) -> int:
+    inputs = [f"{SAMPLE} #{i}" for i in range(requests)]
+
+    async def main() -> int:
+        errors = 0
+        async with _async_client(stub, instrumentation, max_concurrency=64) as client:
+            async for _, result in client.parse_many(inputs, SCHEMA):
+                errors += not result["success"]
+        return errors
+
+    return asyncio.run(main())
+
+
+def _large_payload(compression: Any) -> Callable[[StubAPI, Instrumentation, int], int]:
+    document = (SAMPLE + "\n") * (1024 * 1024 // (len(SAMPLE) + 1))
+
+    def run(stub: StubAPI, instrumentation: Instrumentation, requests: int) -> int:
+        errors = 0
+        with _client(stub, instrumentation, compression=compression) as client:
+            for i in range(requests):
+                result = client.parse(f"#{i}\n{document}", SCHEMA)
+                errors += not result["success"]
+        return errors
+
+    return run
+
+
+def http_loopback(stub: StubAPI, instrumentation: Instrumentation, requests: int) -> int:
+    errors = 0
+    with stub.serve() as base_url:
+        with Parserator(api_key="pk_test_bench", base_url=base_url,
+                        instrumentation=instrumentation) as client:
+            for i in range(requests):
+                result = client.parse(f"{SAMPLE} #{i}", SCHEMA)
+                errors += not result["success"]
+    return errors
+
+
+SCENARIOS = [
+    Scenario("sync_sequential", sync_sequential),
+    Scenario("sync_parse_many", sync_parse_many),
+    Scenario("async_parse_many", async_parse_many),
+    Scenario("large_payload", _large_payload(None)),
+    Scenario("large_payload_gzip", _large_payload("gzip")),
+    Scenario("http_loopback", http_loopback),
+]
+
+# Large payload scenarios run this fraction of the requested calls
+LARGE_PAYLOAD_FRACTION = 0.05
+
+
+def measure(scenario: Scenario, requests: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run a scenario twice: once for timing, once under tracemalloc for memory"""
+    if scenario.name.startswith("large_payload"):
+        requests = max(1, int(requests * LARGE_PAYLOAD_FRACTION))
+
+    def stub() -> StubAPI:
+        return StubAPI(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            response_bytes=args.response_bytes,
+            seed=args.seed
+        )
+
+    latencies = LatencyHistogram(window=requests)
+    instrumentation = Instrumentation(on_response=lambda event: latencies.record(event.total_ms))
+
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    errors = scenario.run(stub(), instrumentation, requests)
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    peak_kb = None
+    if not args.no_memory:
+        tracemalloc.start()
+        try:
+            scenario.run(stub(), Instrumentation(), requests)
+            peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "scenario": scenario.name,
+        "requests": requests,
+        "errors": errors,
+        "wall_s": round(wall, 4),
+        "requests_per_s": round(requests / wall, 1) if wall else None,
+        "p50_ms": _round(latencies.percentile(50)),
+        "p99_ms": _round(latencies.percentile(99)),
+        "cpu_ms_per_request": round(cpu * 1000 / requests, 4),
+        "peak_memory_kb": _round(peak_kb),
+    }
+
+
+def _round(value: Any) -> Any:
+    return round(value, 3) if value is not None else None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run offline Parserator SDK benchmarks")
+    parser.add_argument("--requests", type=int, default=500, help="parse calls per scenario")
+    parser.add_argument("--quick", action="store_true", help="run 50 calls per scenario")
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS],
+                        help="run only the named scenario (repeatable)")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of injected errors")
+    parser.add_argument("--response-bytes", type=int, default=0, help="padding per parsed field")
+    parser.add_argument("--seed", type=int, default=1234, help="stub random seed")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    requests = 50 if args.quick else args.requests
+    selected = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+
+    results = []
+    for scenario in selected:
+        result = measure(scenario, requests, args)
+        results.append(result)
+        print(
+            f"{result['scenario']:<20} {result['requests_per_s']!s:>10} req/s  "
+            f"p50 {result['p50_ms']!s:>8} ms  p99 {result['p99_ms']!s:>8} ms",
+            file=sys.stderr
+        )
+
+    report = {
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "config": {
+            "requests": requests,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "response_bytes": args.response_bytes,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
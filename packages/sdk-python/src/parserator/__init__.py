@@ -1,9 +1,95 @@
 """
 Parserator Python SDK - Official client for Parserator API
+
+Public names are imported on first access (PEP 562), so ``import
+parserator`` stays cheap: httpx is loaded with the clients and pydantic
+only when the ``types`` models are used.
 """
 
-from .client import Parserator
-from .types import ParseRequest, ParseResponse
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
 __version__ = "1.0.0"
-__all__ = ["Parserator", "ParseRequest", "ParseResponse"]
\ No newline at end of file
+
+# Public name -> submodule defining it
+_EXPORTS: Dict[str, str] = {
+    "Parserator": "client",
+    "AsyncParserator": "client",
+    "MemoryCache": "cache",
+    "ResultCache": "cache",
+    "AdaptiveLimiter": "concurrency",
+    "ConcurrencyLimiter": "concurrency",
+    "SQLiteCache": "cache",
+    "PlanCache": "plans",
+    "SimilarityIndex": "similarity",
+    "LocalExtractor": "local",
+    "MicroBatcher": "microbatch",
+    "AsyncMicroBatcher": "microbatch",
+    "RetryPolicy": "retry",
+    "CircuitBreaker": "retry",
+    "RateLimiter": "ratelimit",
+    "FileRateLimiter": "ratelimit",
+    "SingleFlight": "singleflight",
+    "AsyncSingleFlight": "singleflight",
+    "HedgePolicy": "hedging",
+    "Ticket": "scheduling",
+    "DeadlineExceeded": "scheduling",
+    "ParseResult": "decoding",
+    "ResultMetadata": "decoding",
+    "Instrumentation": "instrumentation",
+    "RequestEvent": "instrumentation",
+    "InMemorySpanExporter": "instrumentation",
+    "JsonLinesSpanExporter": "instrumentation",
+    "CompiledSchema": "schema",
+    "SchemaError": "schema",
+    "SchemaRegistry": "schema",
+    "compile_schema": "schema",
+    "IngestRunner": "ingestion",
+    "IngestStats": "ingestion",
+    "ingest": "ingestion",
+    "parse_dataframe": "dataframe",
+    "parse_polars": "dataframe",
+    "parse_arrow": "dataframe",
+    "ParseRequest": "types",
+    "ParseResponse": "types",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .cache import MemoryCache, ResultCache, SQLiteCache
+    from .client import AsyncParserator, Parserator
+    from .concurrency import AdaptiveLimiter, ConcurrencyLimiter
+    from .dataframe import parse_arrow, parse_dataframe, parse_polars
+    from .decoding import ParseResult, ResultMetadata
+    from .hedging import HedgePolicy
+    from .ingestion import IngestRunner, IngestStats, ingest
+    from .instrumentation import (
+        InMemorySpanExporter,
+        Instrumentation,
+        JsonLinesSpanExporter,
+        RequestEvent,
+    )
+    from .local import LocalExtractor
+    from .microbatch import AsyncMicroBatcher, MicroBatcher
+    from .plans import PlanCache
+    from .ratelimit import FileRateLimiter, RateLimiter
+    from .retry import CircuitBreaker, RetryPolicy
+    from .scheduling import DeadlineExceeded, Ticket
+    from .schema import CompiledSchema, SchemaError, SchemaRegistry, compile_schema
+    from .similarity import SimilarityIndex
+    from .singleflight import AsyncSingleFlight, SingleFlight
+    from .types import ParseRequest, ParseResponse
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
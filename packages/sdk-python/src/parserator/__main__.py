@@ -0,0 +1,9 @@
+"""
+Allow ``python -m parserator`` as an alias of the ``parserator`` command
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
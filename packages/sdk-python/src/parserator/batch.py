@@ -0,0 +1,173 @@
+"""
+Bounded concurrent mapping helpers used by the batch APIs
+"""
+
+import asyncio
+import itertools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int,
+    ordered: bool = True
+) -> Iterator[Tuple[int, R]]:
+    """
+    Run ``fn`` over ``items`` on a thread pool and yield ``(index, result)``
+
+    At most ``2 * concurrency`` items are pulled from ``items`` ahead of the
+    consumer, so arbitrarily large (or infinite) iterables are never
+    materialized in memory.
+
+    Args:
+        fn: Function applied to each item
+        items: Input iterable, consumed lazily
+        concurrency: Number of worker threads
+        ordered: Yield in input order if True, otherwise in completion order
+
+    Yields:
+        Tuples of input index and result
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    window = concurrency * 2
+    source = enumerate(items)
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    queue: Deque[Tuple[int, "Future[R]"]] = deque()
+    pending: Dict["Future[R]", int] = {}
+
+    def submit_next() -> bool:
+        for index, item in source:
+            future = pool.submit(fn, item)
+            if ordered:
+                queue.append((index, future))
+            else:
+                pending[future] = index
+            return True
+        return False
+
+    try:
+        while len(queue) + len(pending) < window and submit_next():
+            pass
+
+        if ordered:
+            while queue:
+                index, future = queue.popleft()
+                result = future.result()
+                submit_next()
+                yield index, result
+        else:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    submit_next()
+                    yield index, future.result()
+    finally:
+        for _, future in queue:
+            future.cancel()
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+async def aiter_in_thread(items: Iterator[T]) -> AsyncIterator[T]:
+    """Yield from a blocking iterator, advancing it on the default executor"""
+    loop = asyncio.get_event_loop()
+    done = object()
+    while True:
+        item = await loop.run_in_executor(None, next, items, done)
+        if item is done:
+            return
+        yield cast(T, item)
+
+
+async def _aiter_sync(items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+async def abounded_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    concurrency: int,
+    ordered: bool = True
+) -> AsyncIterator[Tuple[int, R]]:
+    """
+    Async counterpart of :func:`bounded_map` running ``fn`` as tasks
+
+    Args:
+        fn: Coroutine function applied to each item
+        items: Input iterable or async iterable, consumed lazily
+        concurrency: Maximum number of tasks in flight
+        ordered: Yield in input order if True, otherwise in completion order
+
+    Yields:
+        Tuples of input index and result
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    source = items.__aiter__() if isinstance(items, AsyncIterable) else _aiter_sync(items)
+    indices = itertools.count()
+    queue: Deque[Tuple[int, "asyncio.Task[R]"]] = deque()
+    pending: Dict["asyncio.Task[R]", int] = {}
+
+    async def submit_next() -> bool:
+        try:
+            item = await source.__anext__()
+        except StopAsyncIteration:
+            return False
+        index = next(indices)
+        task = asyncio.ensure_future(fn(item))
+        if ordered:
+            queue.append((index, task))
+        else:
+            pending[task] = index
+        return True
+
+    try:
+        while len(queue) + len(pending) < concurrency and await submit_next():
+            pass
+
+        if ordered:
+            while queue:
+                index, task = queue.popleft()
+                result = await task
+                await submit_next()
+                yield index, result
+        else:
+            while pending:
+                done: Set[Any]
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    await submit_next()
+                    yield index, task.result()
+    finally:
+        for _, task in queue:
+            task.cancel()
+        for task in pending:
+            task.cancel()
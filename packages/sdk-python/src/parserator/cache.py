@@ -0,0 +1,264 @@
+"""
+Client-side result caches for Parserator parse calls
+"""
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+def make_cache_key(
+    input_data: str,
+    output_schema: Dict[str, Any],
+    confidence_threshold: Optional[float] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Build a stable cache key for a parse request
+
+    The schema and options are canonicalized (sorted keys, compact
+    separators) so that logically identical requests share a key regardless
+    of dict ordering.
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        [input_data, output_schema, confidence_threshold, options or None],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(output_schema: Dict[str, Any]) -> str:
+    """Return a short stable fingerprint of a canonicalized output schema"""
+    canonical = json.dumps(output_schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss/eviction counters for a result cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary"""
+        data = asdict(self)
+        data["hit_rate"] = self.hit_rate
+        return data
+
+
+class ResultCache:
+    """
+    Base class for parse result caches
+
+    Subclasses implement :meth:`get` and :meth:`set`; both must be safe to
+    call from multiple threads.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``key`` or None"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store ``value`` under ``key``"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        raise NotImplementedError
+
+
+class MemoryCache(ResultCache):
+    """
+    In-memory LRU cache with optional time-to-live
+
+    Results are deep-copied on the way in and out so callers can mutate
+    what they get back without corrupting the cache.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize memory cache
+
+        Args:
+            max_entries: Maximum number of results kept before evicting the
+                least recently used one
+            ttl: Optional lifetime of an entry in seconds
+        """
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResultCache):
+    """
+    SQLite-backed result cache that survives process restarts
+
+    The database runs in WAL mode so several worker processes on one host
+    can share the same file. Counters in :attr:`stats` are per process.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None
+    ):
+        """
+        Initialize SQLite cache
+
+        Args:
+            path: Database file path (created if missing)
+            max_entries: Optional bound on stored results; least recently
+                used entries are evicted beyond it
+            ttl: Optional lifetime of an entry in seconds
+        """
+        super().__init__()
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, field: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self._count("misses")
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= now:
+            with conn:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._count("expirations")
+            self._count("misses")
+            return None
+
+        with conn:
+            conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        self._count("hits")
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        conn = self._connection()
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, separators=(",", ":")), expires_at, now)
+            )
+            if self.max_entries is not None:
+                excess = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM results WHERE key IN "
+                        "(SELECT key FROM results ORDER BY accessed_at LIMIT ?)",
+                        (excess,)
+                    )
+                    with self._stats_lock:
+                        self.stats.evictions += excess
+
+    def clear(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Close this thread's database connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
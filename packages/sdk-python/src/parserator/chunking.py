@@ -0,0 +1,108 @@
+"""
+Incremental file chunking strategies for streaming parse_file
+"""
+
+import csv
+from typing import IO, Iterator, Optional
+
+STRATEGIES = ("line", "delimiter", "window", "csv")
+
+# Block size used when scanning for delimiters
+READ_BLOCK_SIZE = 64 * 1024
+
+# Rough characters-per-token ratio, matching the API's own token estimate
+CHARS_PER_TOKEN = 4
+
+
+def check_chunking(
+    strategy: str,
+    delimiter: Optional[str] = None,
+    chunk_size: int = 4000,
+    overlap: int = 0
+) -> None:
+    """
+    Validate :func:`iter_chunks` arguments
+
+    Raises:
+        ValueError: If the strategy is unknown or its options are invalid
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown chunking strategy {strategy!r}, expected one of {STRATEGIES}")
+    if strategy == "delimiter" and not delimiter:
+        raise ValueError("delimiter strategy requires a delimiter")
+    if strategy == "window" and not 0 <= overlap < chunk_size:
+        raise ValueError("overlap must be non-negative and smaller than chunk_size")
+
+
+def iter_chunks(
+    f: IO[str],
+    strategy: str = "line",
+    delimiter: Optional[str] = None,
+    chunk_size: int = 4000,
+    overlap: int = 0
+) -> Iterator[str]:
+    """
+    Split an open text file into parse-sized chunks without reading it whole
+
+    Strategies:
+        line: one chunk per non-blank line (JSONL, logs)
+        delimiter: one chunk per record separated by ``delimiter``
+        window: fixed windows of ``chunk_size`` characters, each sharing
+            ``overlap`` characters with the previous one
+        csv: one chunk per CSV row, rendered as ``column: value`` lines
+
+    Whitespace-only chunks are skipped. The file is closed once exhausted.
+
+    Args:
+        f: Text file object opened for reading
+        strategy: One of ``STRATEGIES``
+        delimiter: Record separator for the ``delimiter`` strategy
+        chunk_size: Window length in characters for the ``window`` strategy
+            (about ``CHARS_PER_TOKEN`` characters per model token)
+        overlap: Characters shared between consecutive windows
+
+    Yields:
+        Text chunks
+    """
+    check_chunking(strategy, delimiter, chunk_size, overlap)
+
+    with f:
+        if strategy == "line":
+            chunks = (line.rstrip("\r\n") for line in f)
+        elif strategy == "delimiter":
+            chunks = _split_delimited(f, delimiter)
+        elif strategy == "window":
+            chunks = _split_windows(f, chunk_size, overlap)
+        else:
+            chunks = _split_csv_rows(f)
+
+        for chunk in chunks:
+            if chunk.strip():
+                yield chunk
+
+
+def _split_delimited(f: IO[str], delimiter: str) -> Iterator[str]:
+    buffer = ""
+    for block in iter(lambda: f.read(READ_BLOCK_SIZE), ""):
+        buffer += block
+        *records, buffer = buffer.split(delimiter)
+        yield from records
+    yield buffer
+
+
+def _split_windows(f: IO[str], chunk_size: int, overlap: int) -> Iterator[str]:
+    buffer = ""
+    while True:
+        block = f.read(chunk_size - len(buffer))
+        if not block:
+            return
+        buffer += block
+        yield buffer
+        if len(buffer) < chunk_size:
+            return
+        buffer = buffer[chunk_size - overlap:] if overlap else ""
+
+
+def _split_csv_rows(f: IO[str]) -> Iterator[str]:
+    for row in csv.DictReader(f):
+        yield "\n".join(f"{column}: {value}" for column, value in row.items() if column is not None)
@@ -0,0 +1,182 @@
+"""
+``parserator`` command-line interface
+
+Reads records from stdin or files, parses each one against a schema file
+and streams one JSON line per record to stdout::
+
+    cat contacts.txt | parserator --schema contact.json
+    parserator --schema invoice.json --format csv --concurrency 16 invoices.csv
+    parserator --schema s.json --format jsonl --field body --unordered < mail.jsonl
+
+Each output line is ``{"index": n, "result": {...}}`` where ``index`` is the
+record's position in the input. The SDK client, caches and retry policy
+are only imported once the arguments have been parsed, so ``--help`` and
+usage errors return immediately.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+FORMATS = ("lines", "jsonl", "csv")
+
+# Exit status when at least one record failed to parse
+EXIT_PARSE_FAILURES = 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for the ``parserator`` command"""
+    parser = argparse.ArgumentParser(
+        prog="parserator",
+        description="Parse records from files or stdin into JSON lines on stdout",
+    )
+    parser.add_argument("files", nargs="*", metavar="FILE",
+                        help="input files; '-' or none reads stdin")
+    parser.add_argument("-s", "--schema", required=True,
+                        help="JSON file mapping field names to types, or an inline JSON object")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="lines",
+                        help="record format: one per line, JSON lines or CSV rows (default: lines)")
+    parser.add_argument("--field", default="text",
+                        help="key holding the input text in JSONL objects (default: text)")
+    parser.add_argument("-c", "--concurrency", type=int, default=8,
+                        help="requests in flight at once (default: 8)")
+    parser.add_argument("-u", "--unordered", action="store_true",
+                        help="write results as they complete instead of in input order")
+    parser.add_argument("--threshold", type=float, help="minimum confidence required")
+    parser.add_argument("--cache", metavar="PATH",
+                        help="cache results in a SQLite file, or in memory with 'memory'")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="retries for transient failures, 0 to disable (default: 3)")
+    parser.add_argument("--local", action="store_true",
+                        help="fill pattern-shaped fields locally before calling the API")
+    parser.add_argument("--base-url", default=os.environ.get("PARSERATOR_BASE_URL"),
+                        help="API base URL (default: $PARSERATOR_BASE_URL or the hosted API)")
+    parser.add_argument("--api-key", default=os.environ.get("PARSERATOR_API_KEY"),
+                        help="API key (default: $PARSERATOR_API_KEY)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="request timeout in seconds")
+    return parser
+
+
+def load_schema(value: str) -> Dict[str, str]:
+    """Read a schema from a JSON file, or from ``value`` itself if it is a JSON object"""
+    if value.lstrip().startswith("{"):
+        return json.loads(value)
+    with open(value, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _open_inputs(files: List[str], newline: Optional[str]) -> Iterator[IO[str]]:
+    for name in files or ["-"]:
+        if name == "-":
+            yield open(sys.stdin.fileno(), "r", encoding="utf-8", newline=newline, closefd=False)
+        else:
+            yield open(name, "r", encoding="utf-8", newline=newline)
+
+
+def _jsonl_records(f: IO[str], field: str) -> Iterator[str]:
+    with f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict):
+                if field not in record:
+                    raise ValueError(f"{f.name}:{number}: missing field {field!r}")
+                record = record[field]
+            yield record if isinstance(record, str) else json.dumps(record)
+
+
+def iter_records(files: List[str], fmt: str, field: str = "text") -> Iterator[str]:
+    """
+    Yield input texts from ``files`` (stdin when empty) lazily
+
+    Args:
+        files: Input paths; ``-`` stands for stdin
+        fmt: ``lines``, ``jsonl`` or ``csv`` (rendered as ``column: value`` lines)
+        field: Key holding the text in JSONL objects; strings are used as-is
+            and other values are re-serialized as JSON
+    """
+    from .chunking import iter_chunks
+
+    for f in _open_inputs(files, "" if fmt == "csv" else None):
+        if fmt == "jsonl":
+            yield from _jsonl_records(f, field)
+        else:
+            yield from iter_chunks(f, "csv" if fmt == "csv" else "line")
+
+
+def _client(args: argparse.Namespace) -> Any:
+    from .client import DEFAULT_BASE_URL, Parserator
+
+    kwargs: Dict[str, Any] = {}
+    if args.cache == "memory":
+        from .cache import MemoryCache
+        kwargs["cache"] = MemoryCache()
+    elif args.cache:
+        from .cache import SQLiteCache
+        kwargs["cache"] = SQLiteCache(args.cache)
+    if args.retries > 0:
+        from .retry import RetryPolicy
+        kwargs["retry"] = RetryPolicy(max_attempts=args.retries + 1)
+    if args.local:
+        from .local import LocalExtractor
+        kwargs["local_extractor"] = LocalExtractor()
+
+    return Parserator(
+        base_url=args.base_url or DEFAULT_BASE_URL,
+        api_key=args.api_key,
+        timeout=args.timeout,
+        **kwargs
+    )
+
+
+def run(args: argparse.Namespace, records: Iterable[str], out: IO[bytes]) -> int:
+    """
+    Parse ``records`` and write one JSON line per record to ``out``
+
+    Returns:
+        Number of records that failed to parse
+    """
+    from .compression import encode_json
+
+    schema = load_schema(args.schema)
+    failures = 0
+    with _client(args) as client:
+        results = client.parse_many(
+            records, schema,
+            concurrency=args.concurrency,
+            ordered=not args.unordered,
+            confidence_threshold=args.threshold
+        )
+        for index, result in results:
+            if not result.get("success"):
+                failures += 1
+            out.write(encode_json({"index": index, "result": result}) + b"\n")
+            out.flush()
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``parserator`` command"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    try:
+        failures = run(args, iter_records(args.files, args.format, args.field), sys.stdout.buffer)
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`): not a failure, and
+        # silence the flush at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"parserator: error: {e}\n")
+    return EXIT_PARSE_FAILURES if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
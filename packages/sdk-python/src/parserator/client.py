@@ -2,166 +2,1662 @@
 Parserator Python SDK Client
 """
 
+import asyncio
+import threading
+import time
 import httpx
-from typing import Dict, Any, Optional
-from .types import ParseRequest, ParseResponse, HealthResponse
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Any, Iterable, Iterator, Optional, Sized, Tuple, Union
+from .batch import abounded_map, aiter_in_thread, bounded_map
+from .cache import ResultCache, make_cache_key, schema_fingerprint
+from .chunking import check_chunking, iter_chunks
+from .concurrency import OVERLOAD_STATUSES, AdaptiveLimiter, ConcurrencyLimiter
+from .compression import acompress_chunks, check_encoding, compress_chunks, encode_json, negotiate
+from .decoding import ParseResult, loads
+from .hedging import HedgePolicy
+from .instrumentation import Instrumentation, RequestEvent
+from .local import LocalExtraction, LocalExtractor
+from .plans import PlanCache
+from .pool import AsyncRequestTrace, PoolStats, RequestTrace
+from .ratelimit import RateLimiter, estimate_request_tokens
+from .retry import CircuitOpenError, RetryPolicy, parse_retry_after
+from .scheduling import DEFAULT_TICKET, DeadlineExceeded, Ticket
+from .schema import CompiledSchema, SchemaLike, SchemaRegistry
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .similarity import SimilarityIndex
+
+
+DEFAULT_BASE_URL = "https://app-5108296280.us-central1.run.app"
+USER_AGENT = "parserator-python-sdk/1.0.0"
+
+# Worker threads parse_many starts by default with a concurrency limiter;
+# the limiter, not the thread count, decides how many requests are sent
+_MAX_LIMITER_WORKERS = 32
+
+# Replacement sender for one parse request, see Parserator._parse_routed
+_Send = Callable[[str, Dict[str, str], Ticket], Optional[Dict[str, Any]]]
+_AsyncSend = Callable[[str, Dict[str, str], Ticket], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def _build_headers(api_key: Optional[str]) -> Dict[str, str]:
+    """Build the default request headers for a client"""
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": USER_AGENT
+    }
+
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    return headers
+
+
+def _build_payload(
+    input_data: str,
+    output_schema: Dict[str, str],
+    confidence_threshold: Optional[float] = None,
+    options: Optional[Dict[str, Any]] = None,
+    schema_ref: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the JSON body for a /v1/parse request
+
+    The full schema stays in the payload even when ``schema_ref`` is set so
+    token estimates and fallbacks can use it; :func:`_wire_payload` strips
+    it before sending.
+    """
+    payload: Dict[str, Any] = {
+        "inputData": input_data,
+        "outputSchema": output_schema
+    }
+
+    if schema_ref is not None:
+        payload["outputSchemaRef"] = schema_ref
+
+    if confidence_threshold is not None:
+        payload["confidenceThreshold"] = confidence_threshold
+
+    if options:
+        payload["options"] = options
+
+    return payload
+
+
+def _wire_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the full schema from payloads that reference a registered one"""
+    if "outputSchemaRef" not in payload:
+        return payload
+    return {key: value for key, value in payload.items() if key != "outputSchema"}
+
+
+def _schema_ref_rejected(response: httpx.Response, payload: Dict[str, Any]) -> bool:
+    """True if the server did not recognize the payload's schema reference"""
+    if response.status_code != 422 or "outputSchemaRef" not in payload:
+        return False
+    try:
+        error = loads(response.content).get("error") or {}
+    except ValueError:
+        return False
+    return error.get("code") == "SCHEMA_NOT_FOUND"
+
+
+def _attach_plan(plans: Optional[PlanCache], payload: Dict[str, Any]) -> Optional[str]:
+    """Add a cached Architect plan to ``payload`` and return its plan key"""
+    if plans is None:
+        return None
+    key = plans.key(payload["outputSchema"], payload["inputData"])
+    plan = plans.get(key)
+    if plan is not None:
+        payload["architectPlan"] = plan
+    return key
+
+
+def _learn_plan(
+    plans: Optional[PlanCache],
+    plan_key: Optional[str],
+    replayed: bool,
+    result: Dict[str, Any]
+) -> None:
+    """Store a fresh Architect plan, or re-check a replayed one, from a result"""
+    if plans is None or plan_key is None:
+        return
+    if not result.get("success"):
+        if replayed:
+            plans.invalidate(plan_key)
+        return
+
+    metadata = result.get("metadata") or {}
+    confidence = metadata.get("confidence")
+    if replayed and metadata.get("planReused"):
+        plans.record(plan_key, confidence)
+    else:
+        plans.put(plan_key, metadata.get("architectPlan"), confidence)
+
+
+def _attach_similar_plan(
+    index: Optional["SimilarityIndex"],
+    payload: Dict[str, Any]
+) -> Optional[Tuple[str, Any]]:
+    """
+    Add the plan of the most similar earlier input to ``payload``
+
+    Only used when no plan is attached yet. Returns the schema fingerprint
+    and input signature for :func:`_learn_similar`.
+    """
+    if index is None:
+        return None
+    schema = schema_fingerprint(payload["outputSchema"])
+    signature = index.signature(payload["inputData"])
+    if "architectPlan" not in payload:
+        match = index.lookup(schema, payload["inputData"], signature)
+        if match is not None:
+            payload["architectPlan"] = match.value
+    return schema, signature
+
+
+def _learn_similar(
+    index: Optional["SimilarityIndex"],
+    similar_key: Optional[Tuple[str, Any]],
+    payload: Dict[str, Any],
+    result: Dict[str, Any]
+) -> None:
+    """Index the Architect plan of a confident result under its input"""
+    if index is None or similar_key is None or not result.get("success"):
+        return
+    metadata = result.get("metadata") or {}
+    plan = metadata.get("architectPlan")
+    confidence = metadata.get("confidence")
+    if isinstance(plan, dict) and (confidence is None or confidence >= index.min_confidence):
+        schema, signature = similar_key
+        index.add(schema, payload["inputData"], plan, signature)
+
+
+def _local_pass(
+    extractor: Optional[LocalExtractor],
+    input_data: str,
+    output_schema: SchemaLike
+) -> Optional[LocalExtraction]:
+    """Run the local fast path; None if disabled or the input cannot be handled"""
+    if extractor is None:
+        return None
+    try:
+        return extractor.extract(input_data, output_schema)
+    except Exception:
+        return None
+
+
+def _error_response(code: str, message: str) -> Dict[str, Any]:
+    """Build the error dictionary returned by parse operations"""
+    return {
+        "success": False,
+        "error": {
+            "code": code,
+            "message": message
+        },
+        "metadata": {
+            "processing_time_ms": 0
+        }
+    }
+
+
+def _finish_result(
+    result: Dict[str, Any],
+    typed: bool,
+    strict: bool
+) -> Union[Dict[str, Any], ParseResult]:
+    """Apply the client's result type and validation settings"""
+    if not typed and not strict:
+        return result
+
+    wrapped = ParseResult(result)
+    if strict and result.get("success"):
+        try:
+            wrapped.validate()
+        except Exception as e:
+            wrapped = ParseResult(_error_response("VALIDATION_ERROR", str(e)))
+    return wrapped if typed else wrapped.raw
+
+
+def _read_file(file_path: str) -> str:
+    """Read a whole text file"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _open_chunks(
+    file_path: str,
+    strategy: str,
+    delimiter: Optional[str],
+    chunk_size: int,
+    overlap: int
+) -> Iterator[str]:
+    """
+    Open ``file_path`` eagerly and return a lazy chunk iterator over it
+
+    The chunking options are checked before the file is opened, so invalid
+    ones raise ValueError without leaking a file handle.
+    """
+    check_chunking(strategy, delimiter, chunk_size, overlap)
+    f = open(file_path, 'r', encoding='utf-8', newline='' if strategy == "csv" else None)
+    return iter_chunks(f, strategy, delimiter, chunk_size, overlap)
+
+
+def _start_ticket(priority: int, deadline: Optional[float]) -> Ticket:
+    """Return the ticket for a parse call, sharing the default when unset"""
+    if priority == 0 and deadline is None:
+        return DEFAULT_TICKET
+    return Ticket.start(priority, deadline)
+
+
+def _flight_key(key: str, ticket: Ticket) -> str:
+    """
+    Return the coalescing key of a call
+
+    Calls only share a flight with the same priority and deadline, so none
+    waits behind a lower-priority request or past its own deadline, and
+    none inherits another call's DEADLINE_EXCEEDED.
+    """
+    if ticket.priority == 0 and ticket.expires_at is None:
+        return key
+    return f"{key}:{ticket.priority}:{ticket.expires_at!r}"
+
+
+def _release_slot(
+    limiter: ConcurrencyLimiter,
+    started: float,
+    response: Optional[httpx.Response],
+    error: Optional[BaseException] = None
+) -> None:
+    """Return a concurrency slot with the request's outcome"""
+    if response is not None:
+        if response.status_code in OVERLOAD_STATUSES:
+            limiter.release(overloaded=True)
+        else:
+            limiter.release(time.perf_counter() - started)
+    else:
+        limiter.release(overloaded=isinstance(error, httpx.TimeoutException))
+
+
+def _close_abandoned(future: "Future[httpx.Response]") -> None:
+    """Close the response of a hedged request that lost the race"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class _SendClock:
+    """``on_send`` hook recording when a request's first attempt went on the wire"""
+
+    def __init__(self, notify: Optional[Callable[[], None]] = None):
+        self.started: Optional[float] = None
+        self._notify = notify
+
+    def __call__(self) -> None:
+        if self.started is None:
+            self.started = time.perf_counter()
+            if self._notify is not None:
+                self._notify()
+
+    def elapsed(self) -> float:
+        """Seconds since the first attempt was sent"""
+        return time.perf_counter() - (self.started or time.perf_counter())
+
+
+def _in_thread(send: Callable[[], httpx.Response]) -> "Future[httpx.Response]":
+    """Run ``send`` on a thread of its own and return its future"""
+    future: "Future[httpx.Response]" = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(send())
+        except BaseException as e:
+            future.set_exception(e)
+
+    future.set_running_or_notify_cancel()
+    threading.Thread(target=run, name="parserator-hedged", daemon=True).start()
+    return future
+
+
+async def _aiter_one(item: Any) -> AsyncIterator[Any]:
+    """Async iterator yielding a single item"""
+    yield item
 
 
 class Parserator:
     """
     Parserator Python SDK Client
-    
+
     Provides access to the Parserator API for intelligent data parsing
     using the Architect-Extractor pattern with structured outputs.
     """
-    
+
     def __init__(
-        self, 
-        base_url: str = "https://app-5108296280.us-central1.run.app",
+        self,
+        base_url: str = DEFAULT_BASE_URL,
         api_key: Optional[str] = None,
-        timeout: int = 30
+        timeout: Union[float, httpx.Timeout] = 30,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache: Optional[ResultCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        prewarm: int = 0,
+        typed_results: bool = False,
+        strict_validation: bool = False,
+        compression: Optional[str] = None,
+        compression_threshold: int = 32 * 1024,
+        instrumentation: Optional[Instrumentation] = None,
+        plan_cache: Optional[PlanCache] = None,
+        local_extractor: Optional[LocalExtractor] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        hedge: Optional[HedgePolicy] = None,
+        max_in_flight: Optional[int] = None,
+        similarity: Optional["SimilarityIndex"] = None
     ):
         """
         Initialize Parserator client
-        
+
         Args:
             base_url: API base URL
             api_key: Optional API key for authentication
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, or an ``httpx.Timeout`` with
+                separate connect/read/write/pool timeouts
+            transport: Optional custom httpx transport (e.g. for testing)
+            cache: Optional result cache consulted before each parse request
+            retry: Optional retry policy for transient failures
+            rate_limiter: Optional client-side rate limiter, may be shared
+                between clients
+            coalesce: Share one HTTP call between identical concurrent
+                parse requests
+            limits: Connection pool limits (max connections, keep-alive
+                connections and expiry); httpx defaults when omitted
+            http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra)
+            prewarm: Number of connections to open on construction
+            typed_results: Return lightweight ``ParseResult`` objects
+                instead of dictionaries
+            strict_validation: Validate successful responses against the
+                pydantic models, turning mismatches into VALIDATION_ERROR
+            compression: Compress request bodies with ``gzip`` or ``zstd``
+                (requires ``zstandard``); falls back to whatever the server
+                accepts if it answers 415
+            compression_threshold: Minimum body size in bytes to compress
+            instrumentation: Optional request hooks, latency breakdown and
+                per-schema percentiles
+            plan_cache: Optional Architect plan cache; cached plans are sent
+                with requests so the API can skip the planning stage
+            local_extractor: Optional in-process extractor for
+                pattern-shaped fields; requests it fully answers never
+                reach the network
+            concurrency_limiter: Optional adaptive in-flight limit that
+                grows while latency stays flat and shrinks on 429/503
+                responses, timeouts or latency inflation; may be shared
+                between clients
+            hedge: Optional hedging policy; a parse request still running
+                at the policy's latency percentile is duplicated and the
+                first response wins (the slower one is abandoned)
+            max_in_flight: Optional cap on requests in flight at once;
+                callers beyond it queue by priority and give up when
+                their deadline passes
+            similarity: Optional near-duplicate index; when no cached plan
+                applies, the plan of the most similar earlier input is
+                replayed for the API to verify
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
-        
-        # Configure HTTP client
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "parserator-python-sdk/1.0.0"
-        }
-        
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
-            
+        self.cache = cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.typed_results = typed_results
+        if compression is not None:
+            check_encoding(compression)
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.instrumentation = instrumentation
+        self.plan_cache = plan_cache
+        self.similarity = similarity
+        self.local_extractor = local_extractor
+        self.concurrency_limiter = concurrency_limiter
+        self.in_flight_limiter = ConcurrencyLimiter(max_in_flight) if max_in_flight is not None else None
+        self.hedge = hedge
+        self._hedge_pool = (
+            ThreadPoolExecutor(max_workers=hedge.max_workers, thread_name_prefix="parserator-hedge")
+            if hedge is not None else None
+        )
+        self.strict_validation = strict_validation
+        self.singleflight = SingleFlight() if coalesce else None
+        self.schemas = SchemaRegistry()
+        self._pool_stats = PoolStats()
+
         self.client = httpx.Client(
             base_url=self.base_url,
-            headers=headers,
-            timeout=timeout
+            headers=_build_headers(api_key),
+            timeout=timeout,
+            limits=limits or httpx.Limits(),
+            http2=http2,
+            transport=transport
         )
-    
+
+        if prewarm:
+            self.prewarm(prewarm)
+
+    def prewarm(self, connections: int = 1) -> int:
+        """
+        Open pooled connections ahead of the first parse request
+
+        Issues ``connections`` concurrent health checks so the TCP and TLS
+        handshakes are paid up front.
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            Number of health checks that succeeded
+        """
+        if connections <= 0:
+            return 0
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            results = list(pool.map(lambda _: self.health_check(), range(connections)))
+        return sum(1 for r in results if r.get("status") != "error")
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Report connection pool statistics
+
+        Returns:
+            Dictionary with request, new/reused connection and pool-wait
+            counters plus current active/idle connection counts
+        """
+        return self._pool_stats.as_dict(self.client._transport)
+
+    def _body_encoding(self, body: bytes) -> Optional[str]:
+        """Return the compression to use for ``body``, if any"""
+        if self.compression is not None and len(body) >= self.compression_threshold:
+            return self.compression
+        return None
+
+    def _send_body(
+        self,
+        path: str,
+        body: bytes,
+        encoding: Optional[str],
+        ticket: Ticket = DEFAULT_TICKET
+    ) -> httpx.Response:
+        """POST an encoded JSON body, compressing it on the fly if asked"""
+        trace = RequestTrace()
+        headers = ticket.headers()
+        if encoding is None:
+            response = self.client.post(path, content=body, headers=headers, extensions={"trace": trace})
+        else:
+            headers["Content-Encoding"] = encoding
+            response = self.client.post(
+                path,
+                content=compress_chunks(body, encoding),
+                headers=headers,
+                extensions={"trace": trace}
+            )
+        self._pool_stats.record(trace)
+        return response
+
+    def _send(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+        ticket: Ticket = DEFAULT_TICKET,
+        on_send: Optional[Callable[[], None]] = None
+    ) -> httpx.Response:
+        """Send a single POST attempt once the rate and in-flight limiters allow it"""
+        if event is not None:
+            event.attempts += 1
+
+        limiter = self.rate_limiter
+        if limiter is not None:
+            limiter.acquire(estimate_request_tokens(payload))
+
+        body = encode_json(_wire_payload(payload))
+        encoding = self._body_encoding(body)
+        gates = [gate for gate in (self.concurrency_limiter, self.in_flight_limiter) if gate is not None]
+        held = []
+        try:
+            for gate in gates:
+                gate.acquire(ticket)
+                held.append(gate)
+            ticket.check()
+        except BaseException:
+            for gate in held:
+                gate.release()
+            raise
+        if on_send is not None:
+            on_send()
+        started = time.perf_counter()
+        try:
+            response = self._send_body(path, body, encoding, ticket)
+            if response.status_code == 415 and encoding is not None:
+                # Server cannot decode this encoding; switch to one it accepts
+                self.compression = negotiate(response.headers.get("Accept-Encoding"))
+                response.close()
+                response = self._send_body(path, body, self._body_encoding(body), ticket)
+            if _schema_ref_rejected(response, payload):
+                # Server lost the registered schema; send it in full instead
+                self.schemas.forget_ref(payload.pop("outputSchemaRef"))
+                response.close()
+                body = encode_json(payload)
+                response = self._send_body(path, body, self._body_encoding(body), ticket)
+        except BaseException as e:
+            for gate in gates:
+                _release_slot(gate, started, None, e)
+            raise
+        for gate in gates:
+            _release_slot(gate, started, response)
+
+        if event is not None:
+            event.status_code = response.status_code
+            event.trace = response.request.extensions.get("trace")
+
+        if limiter is not None and response.status_code == 429:
+            limiter.pause(parse_retry_after(response.headers.get("Retry-After")) or 1.0)
+        return response
+
+    def _post(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+        ticket: Ticket = DEFAULT_TICKET,
+        on_send: Optional[Callable[[], None]] = None
+    ) -> httpx.Response:
+        """
+        POST ``payload`` to ``path``, applying the retry policy if any
+
+        ``on_send`` is called as each attempt goes on the wire, after any
+        limiter waits.
+        """
+        policy = self.retry
+        if policy is None:
+            return self._send(path, payload, event, ticket, on_send)
+
+        breaker = policy.circuit_breaker
+        host = self.client.base_url.host
+        state = policy.start()
+        while True:
+            if breaker is not None and not breaker.allow(host):
+                raise CircuitOpenError(f"Circuit open for {host}; failing fast")
+
+            try:
+                response = self._send(path, payload, event, ticket, on_send)
+            except BaseException as e:
+                if not policy.is_retryable_exception(e):
+                    # Says nothing about the host (deadline, cancellation, ...)
+                    if breaker is not None:
+                        breaker.release(host)
+                    raise
+                if breaker is not None:
+                    breaker.record_failure(host)
+                delay = state.next_delay()
+                if delay is None or not ticket.outlasts(delay):
+                    raise
+                time.sleep(delay)
+                continue
+
+            if not policy.is_retryable_response(response):
+                if breaker is not None:
+                    breaker.record_success(host)
+                return response
+
+            if breaker is not None:
+                breaker.record_failure(host)
+            delay = state.next_delay(response)
+            if delay is None or not ticket.outlasts(delay):
+                return response
+            response.close()
+            time.sleep(delay)
+
+    def _post_parse(
+        self,
+        payload: Dict[str, Any],
+        event: Optional[RequestEvent],
+        ticket: Ticket = DEFAULT_TICKET
+    ) -> httpx.Response:
+        """POST a parse payload, sending a hedge if it runs past the policy's percentile"""
+        policy = self.hedge
+        if policy is None:
+            return self._post("/v1/parse", payload, event, ticket)
+
+        schema = schema_fingerprint(payload.get("outputSchema") or {})
+        delay = policy.delay(schema)
+        if delay is None:
+            clock = _SendClock()
+            response = self._post("/v1/parse", payload, event, ticket, clock)
+            policy.record(schema, clock.elapsed())
+            return response
+
+        # The original gets a thread of its own so the caller can return
+        # whichever response arrives first; only hedges use the pool, so it
+        # does not cap how many requests are in flight
+        sent = threading.Event()
+        clock = _SendClock(sent.set)
+        primary = _in_thread(lambda: self._post("/v1/parse", payload, event, ticket, clock))
+        primary.add_done_callback(lambda _: sent.set())
+        futures = [primary]
+        returned = None
+        try:
+            # The hedge delay counts from when the original goes on the wire
+            sent.wait()
+            if not primary.done():
+                wait([primary], timeout=max(0.0, delay - clock.elapsed()))
+            if primary.done() or not policy.try_hedge():
+                response = primary.result()
+                returned = primary
+                policy.record(schema, clock.elapsed())
+                return response
+
+            # The hedge gets its own payload copy; _send may drop a rejected schema ref
+            hedge = self._hedge_pool.submit(self._post, "/v1/parse", dict(payload), None, ticket)
+            futures.append(hedge)
+            pending = set(futures)
+            winner = None
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                winner = next(
+                    (future for future in futures if future in done and future.exception() is None), None
+                )
+            if winner is None:
+                return primary.result()
+
+            returned = winner
+            policy.record(schema, clock.elapsed())
+            if winner is hedge:
+                policy.hedge_won()
+            response = winner.result()
+            if event is not None:
+                event.status_code = response.status_code
+            return response
+        finally:
+            for future in futures:
+                if future is not returned:
+                    future.cancel()
+                    future.add_done_callback(_close_abandoned)
+
     def parse(
-        self, 
-        input_data: str, 
-        output_schema: Dict[str, str],
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
         confidence_threshold: Optional[float] = None,
-        options: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None
+    ) -> Any:
         """
         Parse unstructured data into structured JSON
-        
+
         Args:
             input_data: Raw text data to parse
-            output_schema: Target schema defining expected fields and types
+            output_schema: Target schema defining expected fields and types,
+                or a ``CompiledSchema`` (sent by reference once registered)
             confidence_threshold: Minimum confidence level required
             options: Additional parsing options
-            
+            priority: Larger values are sent first when the client's
+                in-flight limit is saturated
+            deadline: Seconds the caller will wait; once passed, queued or
+                retrying requests are abandoned with a DEADLINE_EXCEEDED
+                error, and the time left is sent to the API
+
         Returns:
-            Dictionary containing parsing results
+            Dictionary containing parsing results, or a ``ParseResult``
+            when the client was created with ``typed_results=True``
+        """
+        return self._parse_routed(
+            input_data, output_schema, confidence_threshold, options,
+            _start_ticket(priority, deadline)
+        )
+
+    def _parse_routed(
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]],
+        ticket: Ticket = DEFAULT_TICKET,
+        send: Optional[_Send] = None,
+        local: bool = True
+    ) -> Any:
+        """
+        Run a parse call through the local fast path, cache and result settings
+
+        This is the hook micro-batchers use. ``send(input_data, fields,
+        ticket)`` is called for whatever the local pass and the cache leave
+        unresolved, in place of a request of its own; it returns a plain
+        result dict, or None to have the client send the request after all.
+        Pass ``local=False`` for inputs the local pass must not see, such as
+        packed batches.
         """
+        extraction = _local_pass(self.local_extractor, input_data, output_schema) if local else None
+        if extraction is not None and extraction.complete:
+            return _finish_result(extraction.as_result(), self.typed_results, self.strict_validation)
+        if extraction is not None and extraction.values:
+            output_schema = extraction.remaining
+
+        result = self._parse_dict(
+            input_data, output_schema, confidence_threshold, options, ticket, send
+        )
+        if extraction is not None and extraction.values:
+            result = extraction.merge(result)
+        return _finish_result(result, self.typed_results, self.strict_validation)
+
+    def _parse_dict(
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]],
+        ticket: Ticket = DEFAULT_TICKET,
+        send: Optional[_Send] = None
+    ) -> Dict[str, Any]:
+        """Run a parse request through cache and coalescing as a plain dict"""
         try:
-            payload = {
-                "inputData": input_data,
-                "outputSchema": output_schema
-            }
-            
-            if confidence_threshold is not None:
-                payload["confidenceThreshold"] = confidence_threshold
-                
-            if options:
-                payload["options"] = options
-            
-            response = self.client.post("/v1/parse", json=payload)
+            schema_ref = None
+            if isinstance(output_schema, CompiledSchema):
+                schema_ref = self.schemas.server_ref(output_schema.fingerprint)
+                output_schema = output_schema.fields
+
+            key = None
+            if self.cache is not None or self.singleflight is not None:
+                key = make_cache_key(
+                    input_data, output_schema, confidence_threshold, options
+                )
+
+            if self.cache is not None:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+
+            payload = _build_payload(
+                input_data, output_schema, confidence_threshold, options, schema_ref
+            )
+
+            def request() -> Dict[str, Any]:
+                if send is not None:
+                    try:
+                        result = send(input_data, payload["outputSchema"], ticket)
+                    except DeadlineExceeded as e:
+                        return _error_response("DEADLINE_EXCEEDED", str(e))
+                    if result is not None:
+                        if self.cache is not None and result.get("success"):
+                            self.cache.set(key, result)
+                        return result
+                return self._parse_payload(payload, key, ticket)
+
+            if self.singleflight is not None:
+                return self.singleflight.do(_flight_key(key, ticket), request)
+            return request()
+
+        except Exception as e:
+            return _error_response("CLIENT_ERROR", str(e))
+
+    def _parse_payload(
+        self,
+        payload: Dict[str, Any],
+        key: Optional[str],
+        ticket: Ticket = DEFAULT_TICKET
+    ) -> Dict[str, Any]:
+        """Send a parse payload and return the decoded result or error dict"""
+        plan_key = _attach_plan(self.plan_cache, payload)
+        replayed = "architectPlan" in payload
+        similar_key = _attach_similar_plan(self.similarity, payload)
+        instrumentation = self.instrumentation
+        event = instrumentation.start(payload) if instrumentation is not None else None
+        try:
+            response = self._post_parse(payload, event, ticket)
             response.raise_for_status()
-            
-            return response.json()
-            
+
+            decode_started = time.perf_counter()
+            result = loads(response.content)
+            if event is not None:
+                event.decode_ms = (time.perf_counter() - decode_started) * 1000
+
+            if self.cache is not None and result.get("success"):
+                self.cache.set(key, result)
+
+        except CircuitOpenError as e:
+            result = _error_response("CIRCUIT_OPEN", str(e))
+        except DeadlineExceeded as e:
+            result = _error_response("DEADLINE_EXCEEDED", str(e))
         except httpx.HTTPError as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "HTTP_ERROR",
-                    "message": str(e)
-                },
-                "metadata": {
-                    "processing_time_ms": 0
-                }
-            }
+            result = _error_response("HTTP_ERROR", str(e))
         except Exception as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "CLIENT_ERROR", 
-                    "message": str(e)
-                },
-                "metadata": {
-                    "processing_time_ms": 0
-                }
-            }
-    
+            result = _error_response("CLIENT_ERROR", str(e))
+
+        _learn_plan(self.plan_cache, plan_key, replayed, result)
+        _learn_similar(self.similarity, similar_key, payload, result)
+        if event is not None:
+            instrumentation.finish(event, result)
+        return result
+
+    def parse_many(
+        self,
+        inputs: Iterable[str],
+        output_schema: SchemaLike,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        confidence_threshold: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Parse many inputs concurrently against the same schema
+
+        Requests run on a pool of ``concurrency`` worker threads sharing this
+        client's connection pool. ``inputs`` is consumed lazily, so only a
+        small window of items is held in memory at any time. Failed items
+        yield the same error dictionaries as :meth:`parse` and do not abort
+        the batch. With a ``concurrency_limiter`` the threads only cap the
+        window; the limiter decides how many requests are actually sent.
+
+        Args:
+            inputs: Iterable of raw text inputs
+            output_schema: Target schema defining expected fields and types
+            concurrency: Number of worker threads (defaults to 8, or the
+                limiter's ``max_limit`` up to 32 when a concurrency limiter
+                is set, and never more than the number of inputs)
+            ordered: Yield results in input order if True, otherwise as
+                they complete
+            confidence_threshold: Minimum confidence level required
+            options: Additional parsing options
+            priority: Priority of every item (see :meth:`parse`)
+            deadline: Seconds from now by which the whole batch must
+                finish; items still queued then yield DEADLINE_EXCEEDED
+
+        Yields:
+            Tuples of ``(input_index, result)``
+        """
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+
+        def parse_one(input_data: str) -> Dict[str, Any]:
+            remaining = expires_at - time.monotonic() if expires_at is not None else None
+            return self.parse(input_data, output_schema, confidence_threshold, options, priority, remaining)
+
+        if concurrency is None:
+            limiter = self.concurrency_limiter
+            concurrency = min(limiter.max_limit, _MAX_LIMITER_WORKERS) if limiter is not None else 8
+            if isinstance(inputs, Sized):
+                concurrency = max(1, min(concurrency, len(inputs)))
+        return bounded_map(parse_one, inputs, concurrency, ordered)
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check API health status
-        
+
         Returns:
             Dictionary containing health status
         """
         try:
             response = self.client.get("/health")
             response.raise_for_status()
-            return response.json()
-            
+            return loads(response.content)
+
         except Exception as e:
             return {
                 "status": "error",
                 "message": str(e)
             }
-    
-    def parse_file(self, file_path: str, output_schema: Dict[str, str]) -> Dict[str, Any]:
+
+    def register_schema(self, output_schema: SchemaLike) -> CompiledSchema:
+        """
+        Validate a schema locally and register it with the server
+
+        Later parse calls given the returned schema send only its
+        reference instead of the full schema.
+
+        Args:
+            output_schema: Schema dict or compiled schema
+
+        Returns:
+            The compiled schema
+
+        Raises:
+            SchemaError: If the schema fails local validation
+            httpx.HTTPError: If the server rejects the registration
+        """
+        compiled = self.schemas.compile(output_schema)
+        response = self._post("/v1/schemas", {"outputSchema": compiled.fields})
+        response.raise_for_status()
+        self.schemas.mark_registered(compiled, loads(response.content)["schemaRef"])
+        return compiled
+
+    def parse_file(self, file_path: str, output_schema: SchemaLike) -> Dict[str, Any]:
         """
         Parse data from a file
-        
+
         Args:
             file_path: Path to file containing data to parse
             output_schema: Target schema defining expected fields and types
-            
+
         Returns:
             Dictionary containing parsing results
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            return self.parse(content, output_schema)
-            
+            content = _read_file(file_path)
         except IOError as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "FILE_ERROR",
-                    "message": f"Could not read file: {str(e)}"
-                },
-                "metadata": {
-                    "processing_time_ms": 0
-                }
-            }
-    
+            return _error_response("FILE_ERROR", f"Could not read file: {str(e)}")
+
+        return self.parse(content, output_schema)
+
+    def parse_file_stream(
+        self,
+        file_path: str,
+        output_schema: SchemaLike,
+        strategy: str = "line",
+        delimiter: Optional[str] = None,
+        chunk_size: int = 4000,
+        overlap: int = 0,
+        concurrency: int = 8,
+        ordered: bool = True
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Parse a large or multi-record file chunk by chunk
+
+        The file is read incrementally and split according to ``strategy``
+        (see :func:`parserator.chunking.iter_chunks`); chunks are submitted
+        concurrently through :meth:`parse_many`, so memory use stays flat
+        regardless of file size.
+
+        Args:
+            file_path: Path to file containing data to parse
+            output_schema: Target schema applied to every chunk
+            strategy: ``line``, ``delimiter``, ``window`` or ``csv``
+            delimiter: Record separator for the ``delimiter`` strategy
+            chunk_size: Window length in characters for the ``window`` strategy
+            overlap: Characters shared between consecutive windows
+            concurrency: Number of chunk requests in flight at once
+            ordered: Yield results in file order if True, otherwise as
+                they complete
+
+        Yields:
+            Tuples of ``(chunk_index, result)``; a file that cannot be
+            opened yields a single ``FILE_ERROR`` result
+
+        Raises:
+            ValueError: If the chunking options are invalid, before the
+                file is opened
+        """
+        try:
+            chunks = _open_chunks(file_path, strategy, delimiter, chunk_size, overlap)
+        except IOError as e:
+            return iter([(0, _error_response("FILE_ERROR", f"Could not read file: {str(e)}"))])
+
+        return self.parse_many(chunks, output_schema, concurrency=concurrency, ordered=ordered)
+
     def close(self):
         """Close the HTTP client"""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
         self.client.close()
-    
+
     def __enter__(self):
         """Context manager entry"""
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+class AsyncParserator:
+    """
+    Asynchronous Parserator Python SDK Client
+
+    Same surface as :class:`Parserator`, built on ``httpx.AsyncClient`` so a
+    single event loop can keep many parse requests in flight. The number of
+    concurrent requests is bounded by ``max_concurrency``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        api_key: Optional[str] = None,
+        timeout: Union[float, httpx.Timeout] = 30,
+        max_concurrency: int = 100,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ResultCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        typed_results: bool = False,
+        strict_validation: bool = False,
+        compression: Optional[str] = None,
+        compression_threshold: int = 32 * 1024,
+        instrumentation: Optional[Instrumentation] = None,
+        plan_cache: Optional[PlanCache] = None,
+        local_extractor: Optional[LocalExtractor] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        hedge: Optional[HedgePolicy] = None,
+        similarity: Optional["SimilarityIndex"] = None
+    ):
+        """
+        Initialize async Parserator client
+
+        Args:
+            base_url: API base URL
+            api_key: Optional API key for authentication
+            timeout: Request timeout in seconds, or an ``httpx.Timeout`` with
+                separate connect/read/write/pool timeouts
+            max_concurrency: Maximum number of requests in flight at once;
+                callers beyond it queue by priority and give up when their
+                deadline passes
+            transport: Optional custom httpx async transport (e.g. for testing)
+            cache: Optional result cache consulted before each parse request
+            retry: Optional retry policy for transient failures
+            rate_limiter: Optional client-side rate limiter, may be shared
+                between clients
+            coalesce: Share one HTTP call between identical concurrent
+                parse requests
+            limits: Connection pool limits; defaults to ``max_concurrency``
+                connections, all kept alive
+            http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra)
+            typed_results: Return lightweight ``ParseResult`` objects
+                instead of dictionaries
+            strict_validation: Validate successful responses against the
+                pydantic models, turning mismatches into VALIDATION_ERROR
+            compression: Compress request bodies with ``gzip`` or ``zstd``
+                (requires ``zstandard``); falls back to whatever the server
+                accepts if it answers 415
+            compression_threshold: Minimum body size in bytes to compress
+            instrumentation: Optional request hooks, latency breakdown and
+                per-schema percentiles
+            plan_cache: Optional Architect plan cache; cached plans are sent
+                with requests so the API can skip the planning stage
+            local_extractor: Optional in-process extractor for
+                pattern-shaped fields; requests it fully answers never
+                reach the network
+            concurrency_limiter: Optional adaptive in-flight limit that
+                grows while latency stays flat and shrinks on 429/503
+                responses, timeouts or latency inflation; may be shared
+                between clients
+            hedge: Optional hedging policy; a parse request still running
+                at the policy's latency percentile is duplicated, the first
+                response wins and the slower request is cancelled
+            similarity: Optional near-duplicate index; when no cached plan
+                applies, the plan of the most similar earlier input is
+                replayed for the API to verify
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = timeout
+        self.cache = cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.typed_results = typed_results
+        if compression is not None:
+            check_encoding(compression)
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.instrumentation = instrumentation
+        self.plan_cache = plan_cache
+        self.similarity = similarity
+        self.local_extractor = local_extractor
+        self.concurrency_limiter = concurrency_limiter
+        self.hedge = hedge
+        self.strict_validation = strict_validation
+        self.singleflight = AsyncSingleFlight() if coalesce else None
+        self.schemas = SchemaRegistry()
+        self._pool_stats = PoolStats()
+        self.max_concurrency = max_concurrency
+        self.in_flight_limiter = ConcurrencyLimiter(max_concurrency)
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=_build_headers(api_key),
+            timeout=timeout,
+            limits=limits or httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency
+            ),
+            http2=http2,
+            transport=transport
+        )
+
+    async def prewarm(self, connections: int = 1) -> int:
+        """
+        Open pooled connections ahead of the first parse request
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            Number of health checks that succeeded
+        """
+        if connections <= 0:
+            return 0
+        results = await asyncio.gather(*(self.health_check() for _ in range(connections)))
+        return sum(1 for r in results if r.get("status") != "error")
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Report connection pool statistics
+
+        Returns:
+            Dictionary with request, new/reused connection and pool-wait
+            counters plus current active/idle connection counts
+        """
+        return self._pool_stats.as_dict(self.client._transport)
+
+    def _body_encoding(self, body: bytes) -> Optional[str]:
+        """Return the compression to use for ``body``, if any"""
+        if self.compression is not None and len(body) >= self.compression_threshold:
+            return self.compression
+        return None
+
+    async def _send_body(
+        self,
+        path: str,
+        body: bytes,
+        encoding: Optional[str],
+        ticket: Ticket = DEFAULT_TICKET
+    ) -> httpx.Response:
+        """POST an encoded JSON body, compressing it on the fly if asked"""
+        trace = AsyncRequestTrace()
+        headers = ticket.headers()
+        if encoding is None:
+            response = await self.client.post(path, content=body, headers=headers, extensions={"trace": trace})
+        else:
+            headers["Content-Encoding"] = encoding
+            response = await self.client.post(
+                path,
+                content=acompress_chunks(body, encoding),
+                headers=headers,
+                extensions={"trace": trace}
+            )
+        self._pool_stats.record(trace)
+        return response
+
+    async def _send(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+        ticket: Ticket = DEFAULT_TICKET,
+        on_send: Optional[Callable[[], None]] = None
+    ) -> httpx.Response:
+        """
+        Send a single POST attempt once the rate and in-flight limiters allow it
+
+        Rate-limit waits happen before taking an in-flight slot.
+        """
+        if event is not None:
+            event.attempts += 1
+
+        limiter = self.rate_limiter
+        if limiter is not None:
+            await limiter.acquire_async(estimate_request_tokens(payload))
+
+        body = encode_json(_wire_payload(payload))
+        encoding = self._body_encoding(body)
+        gates = [gate for gate in (self.concurrency_limiter, self.in_flight_limiter) if gate is not None]
+        held = []
+        try:
+            for gate in gates:
+                await gate.acquire_async(ticket)
+                held.append(gate)
+            ticket.check()
+        except BaseException:
+            for gate in held:
+                gate.release()
+            raise
+        if on_send is not None:
+            on_send()
+        started = time.perf_counter()
+        try:
+            response = await self._send_body(path, body, encoding, ticket)
+            if response.status_code == 415 and encoding is not None:
+                # Server cannot decode this encoding; switch to one it accepts
+                self.compression = negotiate(response.headers.get("Accept-Encoding"))
+                await response.aclose()
+                response = await self._send_body(path, body, self._body_encoding(body), ticket)
+            if _schema_ref_rejected(response, payload):
+                # Server lost the registered schema; send it in full instead
+                self.schemas.forget_ref(payload.pop("outputSchemaRef"))
+                await response.aclose()
+                body = encode_json(payload)
+                response = await self._send_body(path, body, self._body_encoding(body), ticket)
+        except BaseException as e:
+            for gate in gates:
+                _release_slot(gate, started, None, e)
+            raise
+        for gate in gates:
+            _release_slot(gate, started, response)
+
+        if event is not None:
+            event.status_code = response.status_code
+            event.trace = response.request.extensions.get("trace")
+
+        if limiter is not None and response.status_code == 429:
+            limiter.pause(parse_retry_after(response.headers.get("Retry-After")) or 1.0)
+        return response
+
+    async def _post(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+        ticket: Ticket = DEFAULT_TICKET,
+        on_send: Optional[Callable[[], None]] = None
+    ) -> httpx.Response:
+        """
+        POST ``payload`` to ``path``, applying the retry policy if any
+
+        The in-flight limit is held only while a request is on the wire,
+        not while backing off between attempts. ``on_send`` is called as
+        each attempt goes on the wire.
+        """
+        policy = self.retry
+        if policy is None:
+            return await self._send(path, payload, event, ticket, on_send)
+
+        breaker = policy.circuit_breaker
+        host = self.client.base_url.host
+        state = policy.start()
+        while True:
+            if breaker is not None and not breaker.allow(host):
+                raise CircuitOpenError(f"Circuit open for {host}; failing fast")
+
+            try:
+                response = await self._send(path, payload, event, ticket, on_send)
+            except BaseException as e:
+                if not policy.is_retryable_exception(e):
+                    # Says nothing about the host (deadline, cancellation, ...)
+                    if breaker is not None:
+                        breaker.release(host)
+                    raise
+                if breaker is not None:
+                    breaker.record_failure(host)
+                delay = state.next_delay()
+                if delay is None or not ticket.outlasts(delay):
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            if not policy.is_retryable_response(response):
+                if breaker is not None:
+                    breaker.record_success(host)
+                return response
+
+            if breaker is not None:
+                breaker.record_failure(host)
+            delay = state.next_delay(response)
+            if delay is None or not ticket.outlasts(delay):
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _post_parse(
+        self,
+        payload: Dict[str, Any],
+        event: Optional[RequestEvent],
+        ticket: Ticket = DEFAULT_TICKET
+    ) -> httpx.Response:
+        """POST a parse payload, sending a hedge if it runs past the policy's percentile"""
+        policy = self.hedge
+        if policy is None:
+            return await self._post("/v1/parse", payload, event, ticket)
+
+        schema = schema_fingerprint(payload.get("outputSchema") or {})
+        delay = policy.delay(schema)
+        if delay is None:
+            clock = _SendClock()
+            response = await self._post("/v1/parse", payload, event, ticket, clock)
+            policy.record(schema, clock.elapsed())
+            return response
+
+        sent = asyncio.Event()
+        clock = _SendClock(sent.set)
+        primary = asyncio.ensure_future(self._post("/v1/parse", payload, event, ticket, clock))
+        waiter = asyncio.ensure_future(sent.wait())
+        tasks = [primary]
+        try:
+            # The hedge delay counts from when the original goes on the wire
+            await asyncio.wait([primary, waiter], return_when=asyncio.FIRST_COMPLETED)
+            if not primary.done():
+                await asyncio.wait([primary], timeout=delay - clock.elapsed())
+            if primary.done() or not policy.try_hedge():
+                response = await primary
+                policy.record(schema, clock.elapsed())
+                return response
+
+            # The hedge gets its own payload copy; _send may drop a rejected schema ref
+            hedge = asyncio.ensure_future(self._post("/v1/parse", dict(payload), None, ticket))
+            tasks.append(hedge)
+            pending = set(tasks)
+            winner = None
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next(
+                    (task for task in tasks if task in done and task.exception() is None), None
+                )
+            if winner is None:
+                return primary.result()
+
+            policy.record(schema, clock.elapsed())
+            if winner is hedge:
+                policy.hedge_won()
+            response = winner.result()
+            if event is not None:
+                event.status_code = response.status_code
+            return response
+        finally:
+            waiter.cancel()
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def parse(
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
+        confidence_threshold: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None
+    ) -> Any:
+        """
+        Parse unstructured data into structured JSON
+
+        Args:
+            input_data: Raw text data to parse
+            output_schema: Target schema defining expected fields and types,
+                or a ``CompiledSchema`` (sent by reference once registered)
+            confidence_threshold: Minimum confidence level required
+            options: Additional parsing options
+            priority: Larger values are sent first when the client's
+                in-flight limit is saturated
+            deadline: Seconds the caller will wait; once passed, queued or
+                retrying requests are abandoned with a DEADLINE_EXCEEDED
+                error, and the time left is sent to the API
+
+        Returns:
+            Dictionary containing parsing results, or a ``ParseResult``
+            when the client was created with ``typed_results=True``
+        """
+        return await self._parse_routed(
+            input_data, output_schema, confidence_threshold, options,
+            _start_ticket(priority, deadline)
+        )
+
+    async def _parse_routed(
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]],
+        ticket: Ticket = DEFAULT_TICKET,
+        send: Optional[_AsyncSend] = None,
+        local: bool = True
+    ) -> Any:
+        """
+        Run a parse call through the local fast path, cache and result settings
+
+        This is the hook micro-batchers use. ``send(input_data, fields,
+        ticket)`` is called for whatever the local pass and the cache leave
+        unresolved, in place of a request of its own; it returns a plain
+        result dict, or None to have the client send the request after all.
+        Pass ``local=False`` for inputs the local pass must not see, such as
+        packed batches.
+        """
+        extraction = _local_pass(self.local_extractor, input_data, output_schema) if local else None
+        if extraction is not None and extraction.complete:
+            return _finish_result(extraction.as_result(), self.typed_results, self.strict_validation)
+        if extraction is not None and extraction.values:
+            output_schema = extraction.remaining
+
+        result = await self._parse_dict(
+            input_data, output_schema, confidence_threshold, options, ticket, send
+        )
+        if extraction is not None and extraction.values:
+            result = extraction.merge(result)
+        return _finish_result(result, self.typed_results, self.strict_validation)
+
+    async def _parse_dict(
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]],
+        ticket: Ticket = DEFAULT_TICKET,
+        send: Optional[_AsyncSend] = None
+    ) -> Dict[str, Any]:
+        """Run a parse request through cache and coalescing as a plain dict"""
+        try:
+            schema_ref = None
+            if isinstance(output_schema, CompiledSchema):
+                schema_ref = self.schemas.server_ref(output_schema.fingerprint)
+                output_schema = output_schema.fields
+
+            key = None
+            if self.cache is not None or self.singleflight is not None:
+                key = make_cache_key(
+                    input_data, output_schema, confidence_threshold, options
+                )
+
+            if self.cache is not None:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+
+            payload = _build_payload(
+                input_data, output_schema, confidence_threshold, options, schema_ref
+            )
+
+            async def request() -> Dict[str, Any]:
+                if send is not None:
+                    try:
+                        result = await send(input_data, payload["outputSchema"], ticket)
+                    except DeadlineExceeded as e:
+                        return _error_response("DEADLINE_EXCEEDED", str(e))
+                    if result is not None:
+                        if self.cache is not None and result.get("success"):
+                            self.cache.set(key, result)
+                        return result
+                return await self._parse_payload(payload, key, ticket)
+
+            if self.singleflight is not None:
+                return await self.singleflight.do(_flight_key(key, ticket), request)
+            return await request()
+
+        except Exception as e:
+            return _error_response("CLIENT_ERROR", str(e))
+
+    async def _parse_payload(
+        self,
+        payload: Dict[str, Any],
+        key: Optional[str],
+        ticket: Ticket = DEFAULT_TICKET
+    ) -> Dict[str, Any]:
+        """Send a parse payload and return the decoded result or error dict"""
+        plan_key = _attach_plan(self.plan_cache, payload)
+        replayed = "architectPlan" in payload
+        similar_key = _attach_similar_plan(self.similarity, payload)
+        instrumentation = self.instrumentation
+        event = instrumentation.start(payload) if instrumentation is not None else None
+        try:
+            response = await self._post_parse(payload, event, ticket)
+            response.raise_for_status()
+
+            decode_started = time.perf_counter()
+            result = loads(response.content)
+            if event is not None:
+                event.decode_ms = (time.perf_counter() - decode_started) * 1000
+
+            if self.cache is not None and result.get("success"):
+                self.cache.set(key, result)
+
+        except CircuitOpenError as e:
+            result = _error_response("CIRCUIT_OPEN", str(e))
+        except DeadlineExceeded as e:
+            result = _error_response("DEADLINE_EXCEEDED", str(e))
+        except httpx.HTTPError as e:
+            result = _error_response("HTTP_ERROR", str(e))
+        except Exception as e:
+            result = _error_response("CLIENT_ERROR", str(e))
+
+        _learn_plan(self.plan_cache, plan_key, replayed, result)
+        _learn_similar(self.similarity, similar_key, payload, result)
+        if event is not None:
+            instrumentation.finish(event, result)
+        return result
+
+    def parse_many(
+        self,
+        inputs: Union[Iterable[str], AsyncIterable[str]],
+        output_schema: SchemaLike,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        confidence_threshold: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Parse many inputs concurrently against the same schema
+
+        Async counterpart of :meth:`Parserator.parse_many`; use with
+        ``async for``.
+
+        Args:
+            inputs: Iterable or async iterable of raw text inputs
+            output_schema: Target schema defining expected fields and types
+            concurrency: Number of requests in flight at once (defaults to
+                ``max_concurrency``)
+            ordered: Yield results in input order if True, otherwise as
+                they complete
+            confidence_threshold: Minimum confidence level required
+            options: Additional parsing options
+            priority: Priority of every item (see :meth:`parse`)
+            deadline: Seconds from now by which the whole batch must
+                finish; items still queued then yield DEADLINE_EXCEEDED
+
+        Yields:
+            Tuples of ``(input_index, result)``
+        """
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+
+        async def parse_one(input_data: str) -> Dict[str, Any]:
+            remaining = expires_at - time.monotonic() if expires_at is not None else None
+            return await self.parse(input_data, output_schema, confidence_threshold, options, priority, remaining)
+
+        return abounded_map(parse_one, inputs, concurrency or self.max_concurrency, ordered)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Check API health status
+
+        Returns:
+            Dictionary containing health status
+        """
+        try:
+            response = await self.client.get("/health")
+            response.raise_for_status()
+            return loads(response.content)
+
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+
+    async def register_schema(self, output_schema: SchemaLike) -> CompiledSchema:
+        """
+        Validate a schema locally and register it with the server
+
+        Async counterpart of :meth:`Parserator.register_schema`.
+        """
+        compiled = self.schemas.compile(output_schema)
+        response = await self._post("/v1/schemas", {"outputSchema": compiled.fields})
+        response.raise_for_status()
+        self.schemas.mark_registered(compiled, loads(response.content)["schemaRef"])
+        return compiled
+
+    async def parse_file(self, file_path: str, output_schema: SchemaLike) -> Dict[str, Any]:
+        """
+        Parse data from a file
+
+        The file is read in the default executor so the event loop is not
+        blocked on disk I/O.
+
+        Args:
+            file_path: Path to file containing data to parse
+            output_schema: Target schema defining expected fields and types
+
+        Returns:
+            Dictionary containing parsing results
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            content = await loop.run_in_executor(None, _read_file, file_path)
+        except IOError as e:
+            return _error_response("FILE_ERROR", f"Could not read file: {str(e)}")
+
+        return await self.parse(content, output_schema)
+
+    def parse_file_stream(
+        self,
+        file_path: str,
+        output_schema: SchemaLike,
+        strategy: str = "line",
+        delimiter: Optional[str] = None,
+        chunk_size: int = 4000,
+        overlap: int = 0,
+        concurrency: Optional[int] = None,
+        ordered: bool = True
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Parse a large or multi-record file chunk by chunk
+
+        Async counterpart of :meth:`Parserator.parse_file_stream`; use with
+        ``async for``. Chunks are read from disk on the default executor as
+        the window advances, so reads do not block the event loop.
+
+        Args:
+            file_path: Path to file containing data to parse
+            output_schema: Target schema applied to every chunk
+            strategy: ``line``, ``delimiter``, ``window`` or ``csv``
+            delimiter: Record separator for the ``delimiter`` strategy
+            chunk_size: Window length in characters for the ``window`` strategy
+            overlap: Characters shared between consecutive windows
+            concurrency: Number of chunk requests in flight at once
+            ordered: Yield results in file order if True, otherwise as
+                they complete
+
+        Yields:
+            Tuples of ``(chunk_index, result)``
+
+        Raises:
+            ValueError: If the chunking options are invalid, before the
+                file is opened
+        """
+        try:
+            chunks = _open_chunks(file_path, strategy, delimiter, chunk_size, overlap)
+        except IOError as e:
+            return _aiter_one((0, _error_response("FILE_ERROR", f"Could not read file: {str(e)}")))
+
+        return self.parse_many(aiter_in_thread(chunks), output_schema, concurrency=concurrency, ordered=ordered)
+
+    async def aclose(self):
+        """Close the HTTP client"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
@@ -0,0 +1,81 @@
+"""
+Request body encoding and streaming compression
+
+The JSON body is serialized once; compression then runs over it in
+fixed-size slices and the compressed output is streamed to the socket, so
+the payload is never held in memory in both forms at once.
+"""
+
+import json
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+
+ENCODINGS = ("gzip", "zstd")
+
+# Size of the uncompressed slices fed to the compressor
+COMPRESS_CHUNK_SIZE = 64 * 1024
+
+
+def encode_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def check_encoding(encoding: str) -> None:
+    """Raise ValueError if ``encoding`` cannot be produced here"""
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unsupported compression {encoding!r}, expected one of {ENCODINGS}")
+    if encoding == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requires the 'zstandard' package")
+
+
+def _compressor(encoding: str, level: Optional[int]) -> Any:
+    if encoding == "gzip":
+        return zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+
+
+def compress_chunks(body: bytes, encoding: str, level: Optional[int] = None) -> Iterator[bytes]:
+    """Yield ``body`` compressed with ``encoding`` in streaming slices"""
+    compressor = _compressor(encoding, level)
+    view = memoryview(body)
+    for start in range(0, len(view), COMPRESS_CHUNK_SIZE):
+        chunk = compressor.compress(view[start:start + COMPRESS_CHUNK_SIZE])
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+async def acompress_chunks(body: bytes, encoding: str, level: Optional[int] = None) -> AsyncIterator[bytes]:
+    """Async iterator version of :func:`compress_chunks` for async clients"""
+    for chunk in compress_chunks(body, encoding, level):
+        yield chunk
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a request encoding the server advertised in ``Accept-Encoding``
+
+    Returns:
+        A supported encoding, or None to send uncompressed bodies
+    """
+    if not accept_encoding:
+        return None
+    offered: List[str] = [part.split(";")[0].strip().lower() for part in accept_encoding.split(",")]
+    for encoding in ENCODINGS:
+        if encoding in offered and (encoding != "zstd" or zstandard is not None):
+            return encoding
+    return None
@@ -0,0 +1,360 @@
+"""
+Concurrency limiting
+
+:class:`ConcurrencyLimiter` caps the requests a client has in flight. When
+it is full, waiters are admitted by ticket priority and then in arrival
+order, and a waiter whose deadline passes gives up without being sent.
+
+:class:`AdaptiveLimiter` replaces the fixed cap with one discovered at run
+time, in the style of TCP Vegas and gradient limiters. While latency stays
+close to the lowest recently observed latency, the limit grows by about
+one slot per round trip. When the server answers 429 or 503, a request
+times out, or smoothed latency inflates past ``tolerance`` times the
+baseline, the limit is cut multiplicatively, at most once per round trip.
+The limit therefore settles just below the point where the backend starts
+queueing.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from .scheduling import DEFAULT_TICKET, DeadlineExceeded, Ticket
+
+# Response statuses that mean the backend is overloaded
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+# Waiter states
+_WAITING, _GRANTED, _ABANDONED = range(3)
+
+
+@dataclass
+class LimiterStats:
+    """Concurrency limiter counters"""
+    acquired: int = 0
+    waited: int = 0
+    expired: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary"""
+        return asdict(self)
+
+
+@dataclass
+class AdaptiveLimiterStats(LimiterStats):
+    """Adaptive limiter counters"""
+    samples: int = 0
+    overloads: int = 0
+    increases: int = 0
+    decreases: int = 0
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Waiter:
+    __slots__ = ("signal", "state")
+
+    def __init__(self, signal: Union[threading.Event, "asyncio.Future[None]"]):
+        self.signal = signal
+        self.state = _WAITING
+
+
+class ConcurrencyLimiter:
+    """
+    Thread-safe in-flight cap with priority- and deadline-aware waiting
+
+    Sync callers use :meth:`acquire`, async callers :meth:`acquire_async`;
+    both must be paired with :meth:`release`. One limiter may be shared by
+    sync and async clients.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize concurrency limiter
+
+        Args:
+            limit: Maximum requests in flight at once
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.stats = self._new_stats()
+        self._limit = float(limit)
+        self._in_flight = 0
+        self._waiting = 0
+        self._queue: List[Any] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def _new_stats(self) -> LimiterStats:
+        return LimiterStats()
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot"""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Callers queued for a slot"""
+        return self._waiting
+
+    def _try_acquire_locked(self) -> bool:
+        if self._waiting or self._in_flight >= int(self._limit):
+            return False
+        self._in_flight += 1
+        self.stats.acquired += 1
+        return True
+
+    def _enqueue_locked(self, ticket: Ticket, waiter: _Waiter) -> None:
+        heapq.heappush(self._queue, (-ticket.priority, next(self._sequence), waiter))
+        self._waiting += 1
+        self.stats.waited += 1
+
+    def _abandon_locked(self, waiter: _Waiter) -> bool:
+        """Withdraw a waiter; False if it was already granted a slot"""
+        if waiter.state == _GRANTED:
+            return False
+        waiter.state = _ABANDONED
+        self._waiting -= 1
+        return True
+
+    def acquire(self, ticket: Ticket = DEFAULT_TICKET) -> None:
+        """
+        Block until a request may be sent
+
+        Raises:
+            DeadlineExceeded: If the ticket's deadline passes while waiting
+        """
+        with self._lock:
+            if self._try_acquire_locked():
+                return
+            waiter = _Waiter(threading.Event())
+            self._enqueue_locked(ticket, waiter)
+
+        remaining = ticket.remaining()
+        if waiter.signal.wait(max(0.0, remaining) if remaining is not None else None):
+            return
+        with self._lock:
+            if not self._abandon_locked(waiter):
+                return
+            self.stats.expired += 1
+        raise DeadlineExceeded("Deadline exceeded while queued for an in-flight slot")
+
+    async def acquire_async(self, ticket: Ticket = DEFAULT_TICKET) -> None:
+        """
+        Wait without blocking the event loop until a request may be sent
+
+        Raises:
+            DeadlineExceeded: If the ticket's deadline passes while waiting
+        """
+        with self._lock:
+            if self._try_acquire_locked():
+                return
+            waiter = _Waiter(asyncio.get_running_loop().create_future())
+            self._enqueue_locked(ticket, waiter)
+
+        remaining = ticket.remaining()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.signal), max(0.0, remaining) if remaining is not None else None)
+            return
+        except asyncio.TimeoutError:
+            with self._lock:
+                if not self._abandon_locked(waiter):
+                    return
+                self.stats.expired += 1
+            raise DeadlineExceeded("Deadline exceeded while queued for an in-flight slot")
+        except asyncio.CancelledError:
+            with self._lock:
+                if not self._abandon_locked(waiter):
+                    # The slot was handed over just before cancellation; give it back
+                    self._in_flight -= 1
+                    self._grant_locked()
+            raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Return a slot
+
+        Args:
+            latency: Seconds the request took (used by adaptive limiters)
+            overloaded: True for 429/503 responses and timeouts (used by
+                adaptive limiters)
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._grant_locked()
+
+    def _grant_locked(self) -> None:
+        queue = self._queue
+        while queue and self._in_flight < int(self._limit):
+            waiter = heapq.heappop(queue)[2]
+            if waiter.state != _WAITING:
+                continue
+            waiter.state = _GRANTED
+            self._waiting -= 1
+            self._in_flight += 1
+            self.stats.acquired += 1
+            signal = waiter.signal
+            if isinstance(signal, threading.Event):
+                signal.set()
+            else:
+                signal.get_loop().call_soon_threadsafe(_resolve, signal)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the current limit, occupancy and counters"""
+        with self._lock:
+            data = self.stats.as_dict()
+            data["limit"] = int(self._limit)
+            data["in_flight"] = self._in_flight
+            data["waiting"] = self._waiting
+        return data
+
+
+class AdaptiveLimiter(ConcurrencyLimiter):
+    """
+    In-flight limit that adapts to latency and overload signals
+
+    Waiting, priorities and deadlines work as in :class:`ConcurrencyLimiter`.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff: float = 0.7,
+        tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        rtt_window: int = 500,
+        history_size: int = 1000
+    ):
+        """
+        Initialize adaptive limiter
+
+        Args:
+            initial_limit: In-flight limit before any samples arrive
+            min_limit: Lowest limit the controller may choose
+            max_limit: Highest limit the controller may choose
+            backoff: Factor the limit is multiplied by on overload
+            tolerance: Smoothed latency above ``tolerance`` times the
+                baseline counts as latency inflation
+            smoothing: Weight of each new sample in the smoothed latency
+            rtt_window: Samples after which the baseline (lowest) latency
+                is re-measured, so it follows slow backend drift
+            history_size: Number of limit changes kept for :meth:`history`
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be in (0, 1)")
+        if tolerance <= 1:
+            raise ValueError("tolerance must be greater than 1")
+
+        super().__init__(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.rtt_window = rtt_window
+
+        self._min_rtt: Optional[float] = None
+        self._window_min: Optional[float] = None
+        self._window_samples = 0
+        self._smoothed: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._record_locked("initial")
+
+    def _new_stats(self) -> AdaptiveLimiterStats:
+        return AdaptiveLimiterStats()
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Return a slot and feed the controller
+
+        Args:
+            latency: Seconds the request took, or None if it failed without
+                telling anything about backend load
+            overloaded: True for 429/503 responses and timeouts
+        """
+        with self._lock:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            if overloaded:
+                self.stats.overloads += 1
+                self._decrease_locked("overload")
+            elif latency is not None:
+                self._sample_locked(latency, in_flight)
+            self._grant_locked()
+
+    def _sample_locked(self, latency: float, in_flight: int) -> None:
+        self.stats.samples += 1
+        if self._min_rtt is None or latency < self._min_rtt:
+            self._min_rtt = latency
+        if self._window_min is None or latency < self._window_min:
+            self._window_min = latency
+        self._window_samples += 1
+        if self._window_samples >= self.rtt_window:
+            self._min_rtt = self._window_min
+            self._window_min = None
+            self._window_samples = 0
+
+        if self._smoothed is None:
+            self._smoothed = latency
+        else:
+            self._smoothed += self.smoothing * (latency - self._smoothed)
+
+        if self._smoothed > self._min_rtt * self.tolerance:
+            self._decrease_locked("latency")
+        elif in_flight * 2 >= self._limit and self._limit < self.max_limit:
+            # Only grow when the window is actually used, not when callers are idle
+            before = int(self._limit)
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            if int(self._limit) > before:
+                self.stats.increases += 1
+                self._record_locked("increase")
+
+    def _decrease_locked(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < (self._smoothed or 0.0):
+            return
+        self._last_decrease = now
+        limit = max(float(self.min_limit), self._limit * self.backoff)
+        if int(limit) == int(self._limit):
+            return
+        self._limit = limit
+        self.stats.decreases += 1
+        self._record_locked(reason)
+
+    def _record_locked(self, reason: str) -> None:
+        self._history.append({"time": time.time(), "limit": int(self._limit), "reason": reason})
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Return recent limit changes, oldest first, as ``time``/``limit``/``reason`` dicts"""
+        with self._lock:
+            return list(self._history)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the current limit, occupancy, latency estimates and counters"""
+        with self._lock:
+            data = self.stats.as_dict()
+            data["limit"] = int(self._limit)
+            data["in_flight"] = self._in_flight
+            data["waiting"] = self._waiting
+            data["min_rtt_ms"] = self._min_rtt * 1000 if self._min_rtt is not None else None
+            data["smoothed_rtt_ms"] = self._smoothed * 1000 if self._smoothed is not None else None
+        return data
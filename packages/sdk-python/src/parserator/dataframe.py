@@ -0,0 +1,262 @@
+"""
+Parse DataFrame columns into typed columns
+
+:func:`parse_dataframe` (pandas), :func:`parse_polars` and
+:func:`parse_arrow` send each distinct cell of a text column to the API
+once, concurrently through :meth:`Parserator.parse_many`, and scatter the
+results back to every row with a single vectorized ``take``. Schema fields
+become typed columns: ``number`` → float64, ``boolean`` → bool, ``array``
+→ list, anything else → string (``object`` fields keep the parsed value).
+Per-row confidence is returned as its own column; rows whose parse failed
+or whose cell was null get missing values.
+
+pandas, numpy, polars and pyarrow are imported on first use and come with
+the ``data-science`` extra.
+"""
+
+import importlib
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from .schema import SchemaLike, schema_fields
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import Parserator
+
+DEFAULT_CONFIDENCE_COLUMN = "confidence"
+
+_TRUE = frozenset({"true", "yes", "y", "1"})
+_FALSE = frozenset({"false", "no", "n", "0"})
+
+
+def _require(module: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"{module} is required for DataFrame parsing; "
+            "install it with: pip install 'parserator-sdk[data-science]'"
+        ) from exc
+
+
+def _field_kind(field_type: Any) -> str:
+    kind = str(field_type).lower()
+    return kind if kind in ("number", "boolean", "array", "object") else "string"
+
+
+def _to_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace(",", "").strip())
+        except ValueError:
+            return None
+    return None
+
+
+def _to_boolean(value: Any) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    return None
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+_COERCE = {
+    "number": _to_number,
+    "boolean": _to_boolean,
+    "array": lambda value: value if isinstance(value, list) else None,
+    "object": lambda value: value,
+    "string": _to_string,
+}
+
+
+def _parse_uniques(
+    client: "Parserator",
+    uniques: Sequence[str],
+    output_schema: SchemaLike,
+    confidence_column: str,
+    concurrency: int,
+    confidence_threshold: Optional[float],
+    options: Optional[Dict[str, Any]]
+) -> Dict[str, List[Any]]:
+    """
+    Parse each distinct input once and lay results out column-wise
+
+    Returns:
+        Mapping of output column to one coerced value per unique input
+    """
+    fields = schema_fields(output_schema)
+    if confidence_column in fields:
+        raise ValueError(f"confidence column {confidence_column!r} clashes with a schema field")
+
+    coercers = {name: _COERCE[_field_kind(kind)] for name, kind in fields.items()}
+    columns: Dict[str, List[Any]] = {name: [None] * len(uniques) for name in fields}
+    confidence: List[Optional[float]] = [None] * len(uniques)
+
+    results = client.parse_many(
+        uniques, output_schema,
+        concurrency=concurrency,
+        ordered=False,
+        confidence_threshold=confidence_threshold,
+        options=options
+    )
+    for index, result in results:
+        if not result.get("success"):
+            continue
+        parsed = result.get("parsedData") or {}
+        for name, coerce in coercers.items():
+            columns[name][index] = coerce(parsed.get(name))
+        confidence[index] = _to_number((result.get("metadata") or {}).get("confidence"))
+
+    columns[confidence_column] = confidence
+    return columns
+
+
+def parse_dataframe(
+    client: "Parserator",
+    df: Any,
+    column: str,
+    output_schema: SchemaLike,
+    concurrency: int = 8,
+    confidence_column: str = DEFAULT_CONFIDENCE_COLUMN,
+    confidence_threshold: Optional[float] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> Any:
+    """
+    Parse a pandas text column into typed columns
+
+    Args:
+        client: Sync Parserator client used for the requests
+        df: Source ``pandas.DataFrame``
+        column: Name of the text column to parse
+        output_schema: Target schema defining expected fields and types
+        concurrency: Number of requests in flight at once
+        confidence_column: Name of the per-row confidence column
+        confidence_threshold: Minimum confidence level required
+        options: Additional parsing options
+
+    Returns:
+        A ``pandas.DataFrame`` with one column per schema field plus the
+        confidence column, indexed like ``df`` so it can be joined back
+    """
+    np = _require("numpy")
+    pd = _require("pandas")
+
+    codes, uniques = pd.factorize(df[column], use_na_sentinel=True)
+    uniques = [str(value) for value in uniques]
+    columns = _parse_uniques(
+        client, uniques, output_schema, confidence_column,
+        concurrency, confidence_threshold, options
+    )
+
+    # Null cells map to a trailing missing slot in every unique-level array
+    missing = len(uniques)
+    codes = np.where(codes < 0, missing, codes)
+    kinds = {name: _field_kind(kind) for name, kind in schema_fields(output_schema).items()}
+    kinds[confidence_column] = "number"
+
+    data = {}
+    for name, values in columns.items():
+        kind = kinds[name]
+        if kind == "number":
+            unique_array = np.array(values + [None], dtype=np.float64)
+            data[name] = unique_array.take(codes)
+        elif kind == "boolean":
+            mask = np.array([value is None for value in values] + [True])
+            unique_array = np.array([bool(value) for value in values] + [False])
+            row_mask = mask.take(codes)
+            row_values = unique_array.take(codes)
+            data[name] = pd.arrays.BooleanArray(row_values, row_mask) if row_mask.any() else row_values
+        else:
+            unique_array = np.empty(missing + 1, dtype=object)
+            for index, value in enumerate(values):
+                unique_array[index] = value
+            data[name] = unique_array.take(codes)
+
+    return pd.DataFrame(data, index=df.index)
+
+
+def parse_arrow(
+    client: "Parserator",
+    table: Any,
+    column: str,
+    output_schema: SchemaLike,
+    concurrency: int = 8,
+    confidence_column: str = DEFAULT_CONFIDENCE_COLUMN,
+    confidence_threshold: Optional[float] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> Any:
+    """
+    Parse a text column of a ``pyarrow.Table`` into typed columns
+
+    Arguments match :func:`parse_dataframe`.
+
+    Returns:
+        A ``pyarrow.Table`` with one column per schema field plus the
+        confidence column, row-aligned with ``table``
+    """
+    pa = _require("pyarrow")
+    pc = _require("pyarrow.compute")
+
+    source = pc.cast(table.column(column), pa.string())
+    encoded = pc.dictionary_encode(source).combine_chunks()
+    indices = encoded.indices
+    uniques = encoded.dictionary.to_pylist()
+    columns = _parse_uniques(
+        client, uniques, output_schema, confidence_column,
+        concurrency, confidence_threshold, options
+    )
+
+    types = {"number": pa.float64(), "boolean": pa.bool_(), "string": pa.string()}
+    kinds = {name: _field_kind(kind) for name, kind in schema_fields(output_schema).items()}
+    kinds[confidence_column] = "number"
+
+    arrays = []
+    for name, values in columns.items():
+        unique_array = pa.array(values, type=types.get(kinds[name]))
+        # Null indices (null cells) come out as nulls
+        arrays.append(unique_array.take(indices))
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def parse_polars(
+    client: "Parserator",
+    df: Any,
+    column: str,
+    output_schema: SchemaLike,
+    concurrency: int = 8,
+    confidence_column: str = DEFAULT_CONFIDENCE_COLUMN,
+    confidence_threshold: Optional[float] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> Any:
+    """
+    Parse a text column of a ``polars.DataFrame`` into typed columns
+
+    Arguments match :func:`parse_dataframe`. The column goes through Arrow
+    without copying; see :func:`parse_arrow`.
+
+    Returns:
+        A ``polars.DataFrame`` with one column per schema field plus the
+        confidence column, row-aligned with ``df``
+    """
+    pl = _require("polars")
+
+    table = parse_arrow(
+        client, df.select(column).to_arrow(), column, output_schema,
+        concurrency, confidence_column, confidence_threshold, options
+    )
+    return pl.from_arrow(table)
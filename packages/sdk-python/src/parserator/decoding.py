@@ -0,0 +1,157 @@
+"""
+Fast response decoding and lightweight result objects
+
+``loads`` uses orjson when it is installed and falls back to the standard
+library otherwise. :class:`ParseResult` wraps a decoded response dict
+without copying or validating it; fields are read on access. Use
+:meth:`ParseResult.validate` (or the client's ``strict_validation`` flag)
+when full pydantic validation is wanted.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON using the fastest available backend"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _snake_case_keys(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {_CAMEL_BOUNDARY.sub("_", key).lower(): value for key, value in data.items()}
+
+
+class ResultMetadata:
+    """Read-only view over a response's ``metadata`` dictionary"""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+
+    def _get(self, camel: str, snake: str, default: Any = None) -> Any:
+        raw = self.raw
+        if camel in raw:
+            return raw[camel]
+        return raw.get(snake, default)
+
+    @property
+    def confidence(self) -> Optional[float]:
+        return self.raw.get("confidence")
+
+    @property
+    def processing_time_ms(self) -> Optional[int]:
+        return self._get("processingTimeMs", "processing_time_ms")
+
+    @property
+    def tokens_used(self) -> Optional[int]:
+        return self._get("tokensUsed", "tokens_used")
+
+    @property
+    def request_id(self) -> Optional[str]:
+        return self._get("requestId", "request_id")
+
+    @property
+    def timestamp(self) -> Optional[str]:
+        return self.raw.get("timestamp")
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.raw.get("version")
+
+    @property
+    def features(self) -> List[str]:
+        return self.raw.get("features") or []
+
+    @property
+    def architect_plan(self) -> Optional[Dict[str, Any]]:
+        return self._get("architectPlan", "architect_plan")
+
+    @property
+    def plan_reused(self) -> bool:
+        return bool(self._get("planReused", "plan_reused", False))
+
+    def __repr__(self) -> str:
+        return f"ResultMetadata({self.raw!r})"
+
+
+class ParseResult:
+    """
+    Lightweight, lazily read parse result
+
+    Wraps the decoded response dict; attribute access reads straight from
+    it and item access (``result["parsedData"]``) keeps dict-style callers
+    working.
+    """
+
+    __slots__ = ("raw", "_metadata")
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self._metadata: Optional[ResultMetadata] = None
+
+    @property
+    def success(self) -> bool:
+        return bool(self.raw.get("success"))
+
+    @property
+    def parsed_data(self) -> Optional[Dict[str, Any]]:
+        raw = self.raw
+        if "parsedData" in raw:
+            return raw["parsedData"]
+        return raw.get("parsed_data")
+
+    @property
+    def error(self) -> Optional[Dict[str, Any]]:
+        return self.raw.get("error")
+
+    @property
+    def recovery(self) -> Optional[Dict[str, Any]]:
+        return self.raw.get("recovery")
+
+    @property
+    def metadata(self) -> ResultMetadata:
+        if self._metadata is None:
+            self._metadata = ResultMetadata(self.raw.get("metadata") or {})
+        return self._metadata
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the underlying response dictionary"""
+        return self.raw
+
+    def validate(self) -> Any:
+        """
+        Fully validate the response against the pydantic models
+
+        Returns:
+            A ``types.ParseResponse`` instance
+
+        Raises:
+            pydantic.ValidationError: If the response does not match
+        """
+        from .types import ParseResponse
+
+        data = _snake_case_keys(self.raw)
+        if isinstance(data.get("metadata"), dict):
+            data["metadata"] = _snake_case_keys(data["metadata"])
+        return ParseResponse.model_validate(data)
+
+    def __repr__(self) -> str:
+        return f"ParseResult(success={self.success!r}, parsed_data={self.parsed_data!r})"
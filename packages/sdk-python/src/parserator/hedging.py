@@ -0,0 +1,137 @@
+"""
+Hedged parse requests
+
+Most parse calls finish quickly but a few take several times longer, and
+those set the tail latency. With a :class:`HedgePolicy` attached, a client
+that has not heard back from ``/v1/parse`` after the ``percentile``-th
+latency of recent calls for the same schema sends a duplicate, timed from
+when the original went on the wire rather than from any wait for a
+limiter. Both clients return the first successful response and abandon
+the other. The sync client sends the original from a thread of its own
+and hedges from a pool, so the pool size caps hedges but not requests.
+The latency of the returned response is what feeds the percentile.
+Duplicates are paid for, so hedges draw from a budget that refills by
+``budget`` per request (0.05 means at most about 5% extra requests).
+"""
+
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from .instrumentation import LatencyHistogram
+
+
+@dataclass
+class HedgeStats:
+    """Hedging counters"""
+    requests: int = 0
+    hedges: int = 0
+    hedges_won: int = 0
+    budget_exhausted: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Extra requests sent as a fraction of all requests"""
+        return self.hedges / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that answered before the original request"""
+        return self.hedges_won / self.hedges if self.hedges else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary"""
+        data = asdict(self)
+        data["hedge_rate"] = self.hedge_rate
+        data["win_rate"] = self.win_rate
+        return data
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate parse request, and how many to allow
+
+    Thread-safe; may be shared between clients, in which case the budget
+    and latency statistics are shared too.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+        window: int = 1024,
+        max_workers: int = 32
+    ):
+        """
+        Initialize hedge policy
+
+        Args:
+            percentile: Latency percentile (0-100) after which to hedge
+            budget: Hedges earned per request, i.e. the maximum long-run
+                fraction of extra requests
+            burst: Maximum unused hedges that may accumulate
+            min_samples: Latencies needed for a schema before hedging it
+            min_delay: Shortest wait in seconds before hedging
+            window: Number of recent latencies kept per schema
+            max_workers: Threads the sync client uses to send hedges
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be in (0, 100)")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.window = window
+        self.max_workers = max_workers
+        self.stats = HedgeStats()
+        self._credit = 0.0
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, schema: str) -> LatencyHistogram:
+        """Return the rolling latency histogram for a schema fingerprint"""
+        histogram = self._histograms.get(schema)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(schema, LatencyHistogram(self.window))
+        return histogram
+
+    def delay(self, schema: str) -> Optional[float]:
+        """
+        Count a request and return how long to wait before hedging it
+
+        Returns:
+            Seconds to wait, or None if the schema has too few samples
+        """
+        with self._lock:
+            self.stats.requests += 1
+            self._credit = min(self.burst, self._credit + self.budget)
+        histogram = self.histogram(schema)
+        if len(histogram) < self.min_samples:
+            return None
+        return max(self.min_delay, histogram.percentile(self.percentile) / 1000)
+
+    def record(self, schema: str, seconds: float) -> None:
+        """Record the latency of the response a call returned"""
+        self.histogram(schema).record(seconds * 1000)
+
+    def try_hedge(self) -> bool:
+        """Take one hedge from the budget; False if it is exhausted"""
+        with self._lock:
+            if self._credit < 1.0:
+                self.stats.budget_exhausted += 1
+                return False
+            self._credit -= 1.0
+            self.stats.hedges += 1
+            return True
+
+    def hedge_won(self) -> None:
+        """Count a hedge that answered first"""
+        with self._lock:
+            self.stats.hedges_won += 1
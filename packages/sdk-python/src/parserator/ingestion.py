@@ -0,0 +1,415 @@
+"""
+Resumable bulk ingestion of many files
+
+:class:`IngestRunner` generalizes ``Parserator.parse_file`` to a directory,
+glob pattern or manifest of files. Files are read, decoded and hashed in a
+process pool that sends back only the hash; files still to parse are read
+again on a pool of threads, parsed through the client, and each result is
+appended to a JSONL output as soon as it arrives. Once a result is on disk
+the hash of its input is appended to a journal and fsync'd, so a restarted
+run skips every file that already finished and only pays for the rest.
+
+A crash between writing a result and journaling it can leave one
+duplicate line per in-flight file in the output after a restart. Failed
+files are not journaled, so they are retried on the next run; they go to a
+separate errors file that every run rewrites, so it only lists the
+failures of the latest run.
+"""
+
+import glob
+import gzip
+import hashlib
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .batch import bounded_map
+from .cache import schema_fingerprint
+from .client import Parserator, _error_response
+from .compression import encode_json
+from .decoding import ParseResult
+from .schema import SchemaLike, schema_fields
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def discover_inputs(source: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Resolve an ingestion source to a sorted list of file paths
+
+    Args:
+        source: A directory (searched recursively), a glob pattern
+            (``**`` is recursive), a manifest file listing one path per line
+            (relative paths are resolved against the manifest's directory,
+            blank lines and ``#`` comments are ignored), or an iterable of
+            paths
+
+    Returns:
+        File paths in a stable order
+
+    Raises:
+        FileNotFoundError: If ``source`` is a path that does not exist
+    """
+    if not isinstance(source, str):
+        return list(source)
+
+    if _GLOB_CHARS.intersection(source):
+        return sorted(path for path in glob.glob(source, recursive=True) if os.path.isfile(path))
+
+    if os.path.isdir(source):
+        paths = []
+        for root, dirs, files in os.walk(source):
+            dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+            paths.extend(os.path.join(root, name) for name in files if not name.startswith("."))
+        return sorted(paths)
+
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    return [
+        line if os.path.isabs(line) else os.path.join(base, line)
+        for line in lines
+        if line and not line.startswith("#")
+    ]
+
+
+def read_input(path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Read and decode one input file
+
+    Gzip files (``.gz``) are decompressed; text is decoded as UTF-8 with an
+    optional byte order mark. Runs in worker processes, so it never raises.
+
+    Returns:
+        Tuple of ``(path, text, error)``; ``text`` is None if the file could
+        not be read or decoded
+    """
+    try:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            data = f.read()
+        return path, data.decode("utf-8-sig"), None
+    except (OSError, UnicodeDecodeError) as e:
+        return path, None, f"Could not read file: {e}"
+
+
+def input_hash(text: str, fingerprint: str) -> str:
+    """Journal key of an input: its content hash combined with the schema's"""
+    digest = hashlib.sha256(fingerprint.encode("utf-8"))
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def scan_input(path: str, fingerprint: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Read one input file and return its journal key instead of its text
+
+    Runs in worker processes, so only the key is sent back to the parent.
+
+    Returns:
+        Tuple of ``(path, key, error)``; ``key`` is None if the file could
+        not be read or decoded
+    """
+    path, text, error = read_input(path)
+    return path, input_hash(text, fingerprint) if text is not None else None, error
+
+
+def trim_partial_line(path: str, block_size: int = 65536) -> None:
+    """Truncate an append-only line file after its last complete line"""
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
+
+
+class IngestJournal:
+    """
+    Append-only, fsync'd record of completed input hashes
+
+    Each line holds one hash followed by a tab and the input's path. A
+    truncated final line left by a crash is ignored when the journal is
+    reopened.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open or create a journal
+
+        Args:
+            path: Journal file location
+        """
+        self.path = path
+        self.completed: Set[str] = set()
+        if os.path.exists(path):
+            trim_partial_line(path)
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self.completed.add(line.split("\t", 1)[0])
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.completed
+
+    def __len__(self) -> int:
+        return len(self.completed)
+
+    def record(self, key: str, path: str) -> None:
+        """Durably mark ``key`` as completed"""
+        self._file.write(f"{key}\t{path}\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.completed.add(key)
+
+    def close(self) -> None:
+        """Close the journal file"""
+        self._file.close()
+
+
+@dataclass
+class IngestStats:
+    """Bulk ingestion progress and throughput"""
+    files: int = 0
+    skipped: int = 0
+    parsed: int = 0
+    failed: int = 0
+    input_bytes: int = 0
+    tokens: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def done(self) -> int:
+        """Files skipped, parsed or failed so far"""
+        return self.skipped + self.parsed + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started"""
+        return time.monotonic() - self.started_at
+
+    @property
+    def files_per_second(self) -> float:
+        """Files parsed or failed per second, excluding skipped ones"""
+        elapsed = self.elapsed
+        return (self.parsed + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Input bytes sent per second"""
+        elapsed = self.elapsed
+        return self.input_bytes / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters and rates as a plain dictionary"""
+        data = asdict(self)
+        del data["started_at"]
+        data["done"] = self.done
+        data["elapsed"] = self.elapsed
+        data["files_per_second"] = self.files_per_second
+        data["bytes_per_second"] = self.bytes_per_second
+        return data
+
+
+class IngestRunner:
+    """
+    Parse every file of a source into a JSONL output, resumably
+
+    Each output line is ``{"path": ..., "hash": ..., "result": ...}`` where
+    ``result`` is the parse result dictionary. Failed files get the same
+    lines in the errors file instead. Run the same source, schema and
+    output again to resume an interrupted run.
+    """
+
+    def __init__(
+        self,
+        client: Parserator,
+        output_schema: SchemaLike,
+        output: str,
+        journal: Optional[str] = None,
+        errors: Optional[str] = None,
+        workers: Optional[int] = None,
+        concurrency: int = 8,
+        confidence_threshold: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        progress: Optional[Callable[[IngestStats], None]] = None,
+        progress_interval: float = 1.0
+    ):
+        """
+        Initialize ingestion runner
+
+        Args:
+            client: Client used for parse requests
+            output_schema: Schema applied to every file
+            output: JSONL file results are appended to
+            journal: Journal path (defaults to ``output + ".journal"``)
+            errors: JSONL file listing this run's failures, rewritten on
+                every run (defaults to ``output + ".errors"``)
+            workers: Processes reading and hashing files (defaults to the
+                CPU count; 0 reads files on the calling thread)
+            concurrency: Number of parse requests in flight at once
+            confidence_threshold: Minimum confidence level required
+            options: Additional parsing options
+            progress: Called with the live stats at most every
+                ``progress_interval`` seconds and once at the end
+            progress_interval: Seconds between progress callbacks
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.client = client
+        self.output_schema = output_schema
+        self.output = output
+        self.journal_path = journal if journal is not None else output + ".journal"
+        self.errors = errors if errors is not None else output + ".errors"
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.concurrency = concurrency
+        self.confidence_threshold = confidence_threshold
+        self.options = options
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.stats = IngestStats()
+        self._fingerprint = schema_fingerprint(schema_fields(output_schema))
+
+    def run(self, source: Union[str, Iterable[str]]) -> IngestStats:
+        """
+        Ingest every file of ``source``
+
+        Args:
+            source: Directory, glob pattern, manifest file or iterable of
+                paths (see :func:`discover_inputs`)
+
+        Returns:
+            Final stats of this run
+        """
+        paths = discover_inputs(source)
+        self.stats = IngestStats(files=len(paths))
+        journal = IngestJournal(self.journal_path)
+        pool: Optional[Executor] = None
+        reads: Set["Future[Tuple[str, Optional[str], Optional[str]]]"] = set()
+        if self.workers > 0:
+            pool = ProcessPoolExecutor(max_workers=self.workers)
+        if os.path.exists(self.output):
+            trim_partial_line(self.output)
+        try:
+            with open(self.output, "ab") as out, open(self.errors, "wb") as failures:
+                pending = self._pending(self._load(paths, pool, reads), journal)
+                results = bounded_map(self._parse, pending, self.concurrency, ordered=False)
+                last_report = time.monotonic()
+                for _, (path, key, size, result) in results:
+                    self._write(out, failures, journal, path, key, size, result)
+                    if self.progress is not None and time.monotonic() - last_report >= self.progress_interval:
+                        last_report = time.monotonic()
+                        self.progress(self.stats)
+        finally:
+            journal.close()
+            if pool is not None:
+                # shutdown(cancel_futures=True) needs Python 3.9
+                for future in list(reads):
+                    future.cancel()
+                pool.shutdown(wait=True)
+
+        if self.progress is not None:
+            self.progress(self.stats)
+        return self.stats
+
+    def _load(
+        self,
+        paths: List[str],
+        pool: Optional[Executor],
+        reads: Set["Future[Tuple[str, Optional[str], Optional[str]]]"]
+    ) -> Iterator[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+        """Yield ``(path, text, key, error)``; ``text`` is None when read by a worker"""
+        fingerprint = self._fingerprint
+        if pool is None:
+            for path, text, error in map(read_input, paths):
+                yield path, text, input_hash(text, fingerprint) if text is not None else None, error
+            return
+
+        def scan(path: str) -> Tuple[str, Optional[str], Optional[str]]:
+            future = pool.submit(scan_input, path, fingerprint)
+            reads.add(future)
+            future.add_done_callback(reads.discard)
+            return future.result()
+
+        # Keep a bounded window of files in flight rather than hashing the whole source
+        for _, (path, key, error) in bounded_map(scan, paths, self.workers):
+            yield path, None, key, error
+
+    def _pending(
+        self,
+        loaded: Iterable[Tuple[str, Optional[str], Optional[str], Optional[str]]],
+        journal: IngestJournal
+    ) -> Iterator[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+        for item in loaded:
+            key = item[2]
+            if key is not None and key in journal:
+                self.stats.skipped += 1
+                continue
+            yield item
+
+    def _parse(
+        self,
+        item: Tuple[str, Optional[str], Optional[str], Optional[str]]
+    ) -> Tuple[str, Optional[str], int, Dict[str, Any]]:
+        path, text, key, error = item
+        if text is None and error is None:
+            # Hashed in a worker; read again here rather than passing the text back
+            path, text, error = read_input(path)
+            key = input_hash(text, self._fingerprint) if text is not None else None
+        if text is None:
+            return path, key, 0, _error_response("FILE_ERROR", error or "Could not read file")
+        result = self.client.parse(text, self.output_schema, self.confidence_threshold, self.options)
+        if isinstance(result, ParseResult):
+            result = result.raw
+        return path, key, len(text.encode("utf-8")), result
+
+    def _write(
+        self,
+        out: Any,
+        failures: Any,
+        journal: IngestJournal,
+        path: str,
+        key: Optional[str],
+        size: int,
+        result: Dict[str, Any]
+    ) -> None:
+        line = encode_json({"path": path, "hash": key, "result": result}) + b"\n"
+        stats = self.stats
+        stats.input_bytes += size
+        if result.get("success"):
+            out.write(line)
+            out.flush()
+            os.fsync(out.fileno())
+            journal.record(key, path)
+            stats.parsed += 1
+            tokens = (result.get("metadata") or {}).get("tokensUsed")
+            if isinstance(tokens, int):
+                stats.tokens += tokens
+        else:
+            failures.write(line)
+            failures.flush()
+            stats.failed += 1
+
+
+def ingest(
+    client: Parserator,
+    source: Union[str, Iterable[str]],
+    output_schema: SchemaLike,
+    output: str,
+    **kwargs: Any
+) -> IngestStats:
+    """
+    Parse every file of ``source`` into ``output``, resuming a previous run
+
+    Shorthand for ``IngestRunner(client, output_schema, output, **kwargs).run(source)``.
+    """
+    return IngestRunner(client, output_schema, output, **kwargs).run(source)
@@ -0,0 +1,320 @@
+"""
+Per-request instrumentation for Parserator clients
+
+An :class:`Instrumentation` object attached to a client receives a
+:class:`RequestEvent` before and after every parse request. Events carry a
+latency breakdown built from httpcore trace timestamps (pool wait, connect,
+TLS, upload, server wait, download), the client-side decode time, retry
+count, and the server-reported processing time and token use. Latencies
+are folded into rolling per-schema percentiles, and events can be exported
+as OpenTelemetry-style spans without any collector running.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Deque, Dict, List, Optional
+
+from .cache import schema_fingerprint
+from .pool import RequestTrace
+
+logger = logging.getLogger(__name__)
+
+# (phase name, start event, end event) measured on the final attempt
+_PHASES = (
+    ("connect", "connection.connect_tcp.started", "connection.connect_tcp.complete"),
+    ("tls", "connection.start_tls.started", "connection.start_tls.complete"),
+    ("upload", "send_request_headers.started", "send_request_body.complete"),
+    ("server_wait", "send_request_body.complete", "receive_response_headers.complete"),
+    ("download", "receive_response_headers.complete", "receive_response_body.complete"),
+)
+
+
+@dataclass
+class RequestEvent:
+    """Timing and outcome of one logical parse request (all times in ms)"""
+    schema: str
+    input_bytes: int
+    started_at: float = field(default_factory=time.perf_counter)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    attempts: int = 0
+    status_code: Optional[int] = None
+    success: Optional[bool] = None
+    error_code: Optional[str] = None
+    total_ms: float = 0.0
+    decode_ms: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    server_processing_ms: Optional[float] = None
+    tokens_used: Optional[int] = None
+    trace: Optional[RequestTrace] = field(default=None, repr=False)
+
+    @property
+    def network_ms(self) -> float:
+        """Wall time of the final attempt on the wire, including pool wait"""
+        trace = self.trace
+        if trace is None or not trace.events:
+            return 0.0
+        return (max(trace.events.values()) - trace.started_at) * 1000
+
+    @property
+    def client_overhead_ms(self) -> float:
+        """Time spent outside the final attempt: retries, backoff, rate limits, decoding"""
+        return max(0.0, self.total_ms - self.network_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the event as a JSON-serializable dictionary"""
+        return {
+            "schema": self.schema,
+            "input_bytes": self.input_bytes,
+            "attempts": self.attempts,
+            "status_code": self.status_code,
+            "success": self.success,
+            "error_code": self.error_code,
+            "total_ms": self.total_ms,
+            "network_ms": self.network_ms,
+            "client_overhead_ms": self.client_overhead_ms,
+            "decode_ms": self.decode_ms,
+            "phases": dict(self.phases),
+            "server_processing_ms": self.server_processing_ms,
+            "tokens_used": self.tokens_used,
+        }
+
+
+def _nearest_rank(samples: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list"""
+    rank = math.ceil(p / 100 * len(samples))
+    return samples[min(len(samples), max(rank, 1)) - 1]
+
+
+class LatencyHistogram:
+    """Rolling window of latencies with percentile queries"""
+
+    def __init__(self, window: int = 1024):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, value_ms: float) -> None:
+        with self._lock:
+            self._samples.append(value_ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Return the ``p``-th percentile (0-100), or None with no samples"""
+        with self._lock:
+            samples = sorted(self._samples)
+        return _nearest_rank(samples, p) if samples else None
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Return sample count and p50/p95/p99"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0, "p50": None, "p95": None, "p99": None}
+        return {
+            "count": len(samples),
+            "p50": _nearest_rank(samples, 50),
+            "p95": _nearest_rank(samples, 95),
+            "p99": _nearest_rank(samples, 99),
+        }
+
+
+@dataclass
+class Span:
+    """Minimal OpenTelemetry-style span"""
+    name: str
+    trace_id: str
+    span_id: str
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+    attributes: Dict[str, Any]
+    status: str = "OK"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "startTimeUnixNano": self.start_time_unix_nano,
+            "endTimeUnixNano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+class SpanExporter:
+    """Base class for span exporters"""
+
+    def export(self, span: Span) -> None:
+        raise NotImplementedError
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the most recent spans in memory (useful in tests and notebooks)"""
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Appends one JSON span per line to a file or stream"""
+
+    def __init__(self, target: Any):
+        """
+        Initialize JSON lines exporter
+
+        Args:
+            target: File path or writable text stream
+        """
+        if isinstance(target, (str, os.PathLike)):
+            self._stream: IO[str] = open(target, "a", encoding="utf-8")
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.as_dict(), separators=(",", ":"))
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self) -> None:
+        if self._owns_stream:
+            self._stream.close()
+
+
+class Instrumentation:
+    """
+    Request hooks, latency breakdown and per-schema percentiles
+
+    Hooks run synchronously on the calling thread (or event loop); keep them
+    cheap. Exceptions raised by hooks or exporters are logged, never
+    propagated into the parse call.
+    """
+
+    def __init__(
+        self,
+        on_request: Optional[Callable[[RequestEvent], None]] = None,
+        on_response: Optional[Callable[[RequestEvent], None]] = None,
+        exporter: Optional[SpanExporter] = None,
+        window: int = 1024
+    ):
+        """
+        Initialize instrumentation
+
+        Args:
+            on_request: Called with the event before the request is sent
+            on_response: Called with the completed event
+            exporter: Optional span exporter
+            window: Number of recent latencies kept per schema
+        """
+        self.on_request = on_request
+        self.on_response = on_response
+        self.exporter = exporter
+        self.window = window
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, schema: str) -> LatencyHistogram:
+        """Return the rolling latency histogram for a schema fingerprint"""
+        histogram = self._histograms.get(schema)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(schema, LatencyHistogram(self.window))
+        return histogram
+
+    def latency_summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Return p50/p95/p99 per schema fingerprint"""
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {schema: histogram.summary() for schema, histogram in histograms.items()}
+
+    def start(self, payload: Dict[str, Any]) -> RequestEvent:
+        """Create the event for a request and run the ``on_request`` hook"""
+        event = RequestEvent(
+            schema=schema_fingerprint(payload.get("outputSchema") or {}),
+            input_bytes=len(payload.get("inputData") or "")
+        )
+        self._call(self.on_request, event)
+        return event
+
+    def finish(self, event: RequestEvent, result: Dict[str, Any]) -> None:
+        """Complete ``event`` from the parse result, record and export it"""
+        event.total_ms = (time.perf_counter() - event.started_at) * 1000
+        event.success = bool(result.get("success"))
+        error = result.get("error")
+        if isinstance(error, dict):
+            event.error_code = error.get("code")
+
+        metadata = result.get("metadata") or {}
+        event.server_processing_ms = metadata.get("processingTimeMs")
+        event.tokens_used = metadata.get("tokensUsed")
+
+        trace = event.trace
+        if trace is not None:
+            events = trace.events
+            if trace.first_event_at is not None:
+                event.phases["pool_wait"] = (trace.first_event_at - trace.started_at) * 1000
+            for name, start, end in _PHASES:
+                if start in events and end in events:
+                    event.phases[name] = (events[end] - events[start]) * 1000
+
+        self.histogram(event.schema).record(event.total_ms)
+        if self.exporter is not None:
+            try:
+                self.exporter.export(_to_span(event))
+            except Exception:
+                logger.exception("Parserator span exporter failed")
+        self._call(self.on_response, event)
+
+    @staticmethod
+    def _call(hook: Optional[Callable[[RequestEvent], None]], event: RequestEvent) -> None:
+        if hook is None:
+            return
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Parserator instrumentation hook failed")
+
+
+def _to_span(event: RequestEvent) -> Span:
+    attributes: Dict[str, Any] = {
+        "http.request.method": "POST",
+        "url.path": "/v1/parse",
+        "parserator.schema": event.schema,
+        "parserator.input_bytes": event.input_bytes,
+        "parserator.attempts": event.attempts,
+        "parserator.decode_ms": event.decode_ms,
+        "parserator.client_overhead_ms": event.client_overhead_ms,
+    }
+    if event.status_code is not None:
+        attributes["http.response.status_code"] = event.status_code
+    if event.error_code is not None:
+        attributes["error.type"] = event.error_code
+    if event.server_processing_ms is not None:
+        attributes["parserator.server_processing_ms"] = event.server_processing_ms
+    if event.tokens_used is not None:
+        attributes["parserator.tokens_used"] = event.tokens_used
+    for phase, value in event.phases.items():
+        attributes[f"parserator.phase.{phase}_ms"] = value
+
+    return Span(
+        name="parserator.parse",
+        trace_id=os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+        start_time_unix_nano=event.start_time_ns,
+        end_time_unix_nano=event.start_time_ns + int(event.total_ms * 1e6),
+        attributes=attributes,
+        status="OK" if event.success else "ERROR"
+    )
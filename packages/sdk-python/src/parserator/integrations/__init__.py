@@ -0,0 +1,6 @@
+"""
+Agent framework integrations
+
+Each submodule wraps the SDK clients for one framework and imports that
+framework on load; install them with ``pip install 'parserator-sdk[integrations]'``.
+"""
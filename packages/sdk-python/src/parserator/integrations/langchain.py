@@ -0,0 +1,202 @@
+"""
+LangChain tools backed by the Parserator SDK
+
+:class:`ParseratorTool` parses one input, and :class:`ParseratorBatchTool`
+parses a list of inputs against one schema for agent map steps. Both tools
+create their SDK clients on first use and keep them, so every call reuses
+pooled keep-alive connections. ``_arun`` awaits the async client instead
+of blocking the event loop; async clients are kept per event loop, since
+their connections cannot move between loops. The tools retry with a default
+:class:`RetryPolicy` and take an optional result ``cache``. To share
+clients configured with other SDK features, pass ``client=`` and
+``async_client=``.
+
+Failed parses raise ``ToolException``. With the default
+``handle_tool_error=True``, LangChain hands the error message to the agent
+instead of an empty result.
+
+Requires ``langchain-core``, installed with the ``integrations`` extra.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+try:
+    from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+    from langchain_core.tools import BaseTool, ToolException
+except ImportError as exc:  # pragma: no cover - optional dependency
+    raise ImportError(
+        "langchain-core is required for the LangChain integration; "
+        "install it with: pip install 'parserator-sdk[integrations]'"
+    ) from exc
+
+from ..cache import ResultCache
+from ..client import DEFAULT_BASE_URL, AsyncParserator, Parserator
+from ..retry import RetryPolicy
+
+_SCHEMA_DESCRIPTION = 'Field names mapped to types, e.g. {"name": "string", "email": "email", "total": "number"}'
+
+
+class ParseInput(BaseModel):
+    """Arguments of :class:`ParseratorTool`"""
+    input_data: str = Field(description="Raw unstructured text to parse")
+    output_schema: Dict[str, Any] = Field(description=_SCHEMA_DESCRIPTION)
+
+
+class BatchParseInput(BaseModel):
+    """Arguments of :class:`ParseratorBatchTool`"""
+    inputs: List[str] = Field(description="Raw unstructured texts, each parsed on its own")
+    output_schema: Dict[str, Any] = Field(description=_SCHEMA_DESCRIPTION)
+
+
+def _parsed_data(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a result's parsed data, raising its error as a ToolException"""
+    if result.get("success"):
+        return result.get("parsedData") or {}
+    error = result.get("error") or {}
+    raise ToolException(f"{error.get('code', 'PARSE_FAILED')}: {error.get('message', 'Parsing failed')}")
+
+
+def _batch_item(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a result's parsed data, or an ``error`` entry so one failure does not fail the batch"""
+    if result.get("success"):
+        return result.get("parsedData") or {}
+    return {"error": result.get("error") or {"code": "PARSE_FAILED", "message": "Parsing failed"}}
+
+
+class _ParseratorToolBase(BaseTool):
+    """Shared configuration and lazily created SDK clients"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    api_key: Optional[str] = Field(default_factory=lambda: os.environ.get("PARSERATOR_API_KEY"))
+    base_url: str = Field(default_factory=lambda: os.environ.get("PARSERATOR_BASE_URL") or DEFAULT_BASE_URL)
+    timeout: float = 30.0
+    cache: Optional[ResultCache] = None
+    retry: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
+    client: Optional[Parserator] = None
+    async_client: Optional[AsyncParserator] = None
+    handle_tool_error: Optional[Union[bool, str, Callable[[ToolException], str]]] = True
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncParserator]" = PrivateAttr(
+        default_factory=weakref.WeakKeyDictionary
+    )
+
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "api_key": self.api_key,
+            "timeout": self.timeout,
+            "cache": self.cache,
+            "retry": self.retry,
+        }
+
+    def get_client(self) -> Parserator:
+        """Return the sync client, creating it on first use"""
+        if self.client is None:
+            with self._lock:
+                if self.client is None:
+                    self.client = Parserator(**self._client_options())
+        return self.client
+
+    def get_async_client(self) -> AsyncParserator:
+        """
+        Return the async client for the running event loop
+
+        A client passed as ``async_client`` is always used; otherwise one is
+        created on first use in each event loop.
+        """
+        if self.async_client is not None:
+            return self.async_client
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = AsyncParserator(**self._client_options())
+        return client
+
+    def close(self) -> None:
+        """Close the sync client"""
+        if self.client is not None:
+            self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the async client passed in, or the one created for the running loop"""
+        if self.async_client is not None:
+            await self.async_client.aclose()
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+class ParseratorTool(_ParseratorToolBase):
+    """Parse one unstructured input into JSON matching a schema"""
+
+    name: str = "parserator"
+    description: str = (
+        "Transform messy, unstructured text (emails, invoices, web pages, CSV rows) into clean JSON. "
+        "Input: input_data (the raw text) and output_schema (field names mapped to types). "
+        "Returns the extracted fields as JSON."
+    )
+    args_schema: Type[BaseModel] = ParseInput
+
+    def _run(
+        self,
+        input_data: str,
+        output_schema: Dict[str, Any],
+        run_manager: Optional[CallbackManagerForToolRun] = None
+    ) -> Dict[str, Any]:
+        """Parse on the pooled sync client"""
+        return _parsed_data(self.get_client().parse(input_data, output_schema))
+
+    async def _arun(
+        self,
+        input_data: str,
+        output_schema: Dict[str, Any],
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None
+    ) -> Dict[str, Any]:
+        """Parse on the pooled async client without blocking the event loop"""
+        return _parsed_data(await self.get_async_client().parse(input_data, output_schema))
+
+
+class ParseratorBatchTool(_ParseratorToolBase):
+    """Parse many unstructured inputs against one schema concurrently"""
+
+    name: str = "parserator_batch"
+    description: str = (
+        "Transform a list of messy, unstructured texts into clean JSON, all with the same fields. "
+        "Input: inputs (list of raw texts) and output_schema (field names mapped to types). "
+        "Returns one JSON object per input, in order; failed inputs have an 'error' entry."
+    )
+    args_schema: Type[BaseModel] = BatchParseInput
+    concurrency: int = 8
+
+    def _run(
+        self,
+        inputs: List[str],
+        output_schema: Dict[str, Any],
+        run_manager: Optional[CallbackManagerForToolRun] = None
+    ) -> List[Dict[str, Any]]:
+        """Parse on the pooled sync client's worker threads"""
+        results = self.get_client().parse_many(inputs, output_schema, concurrency=self.concurrency)
+        return [_batch_item(result) for _, result in results]
+
+    async def _arun(
+        self,
+        inputs: List[str],
+        output_schema: Dict[str, Any],
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None
+    ) -> List[Dict[str, Any]]:
+        """Parse concurrently on the pooled async client"""
+        client = self.get_async_client()
+        return [
+            _batch_item(result)
+            async for _, result in client.parse_many(inputs, output_schema, concurrency=self.concurrency)
+        ]
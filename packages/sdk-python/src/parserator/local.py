@@ -0,0 +1,320 @@
+"""
+In-process fast path for pattern-shaped fields
+
+:class:`LocalExtractor` fills fields such as emails, phone numbers, dates,
+URLs, amounts and labelled numbers or booleans with precompiled regular
+expressions before any request is made. Other ``Label: value`` text cannot
+be validated, so it scores below the default threshold and is only used
+when ``min_confidence`` is lowered. When every field is found with
+enough confidence the client answers locally and skips the network;
+otherwise only the unresolved fields are sent to ``/v1/parse`` and the two
+halves are merged. Each field gets its own confidence, reported in the
+result's ``metadata.fieldConfidence``.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from .cache import schema_fingerprint
+from .schema import SchemaLike, schema_fields
+
+# Confidence of a value by how it was found
+LABELED_MATCH = 0.95
+LABELED_TEXT = 0.6
+UNIQUE_MATCH = 0.9
+AMBIGUOUS_MATCH = 0.4
+
+_PATTERNS: Dict[str, Pattern[str]] = {
+    "email": re.compile(r"(?<![\w.+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}(?![\w-])"),
+    "phone": re.compile(
+        r"(?<![\w(])(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}(?!\w)"
+    ),
+    "date": re.compile(
+        r"\b(?:\d{4}-\d{2}-\d{2}"
+        r"|\d{1,2}/\d{1,2}/\d{2,4}"
+        r"|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.? \d{1,2}(?:st|nd|rd|th)?,? \d{4}"
+        r"|\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]* \d{4})\b",
+        re.IGNORECASE
+    ),
+    "url": re.compile(r"\bhttps?://[^\s<>\"']+[^\s<>\"'.,;:)]"),
+    "amount": re.compile(r"(?<![\w.])[$€£¥]\s?\d{1,3}(?:,\d{3})*(?:\.\d+)?(?![\d.])"),
+    "number": re.compile(r"^[$€£¥]?\s?-?\d{1,3}(?:,\d{3})*(?:\.\d+)?$|^-?\d+(?:\.\d+)?$"),
+}
+
+# Field name words that select a pattern when the schema type is generic
+_NAME_HINTS = {
+    "email": "email",
+    "mail": "email",
+    "phone": "phone",
+    "tel": "phone",
+    "telephone": "phone",
+    "mobile": "phone",
+    "date": "date",
+    "dob": "date",
+    "url": "url",
+    "website": "url",
+    "link": "url",
+    "amount": "amount",
+    "price": "amount",
+    "total": "amount",
+    "cost": "amount",
+    "subtotal": "amount",
+}
+
+_TRUE = frozenset({"yes", "y", "true", "1", "available", "active"})
+_FALSE = frozenset({"no", "n", "false", "0", "unavailable", "inactive"})
+
+_WORD_BOUNDARY = re.compile(r"[_\W]+|(?<=[a-z])(?=[A-Z])")
+
+# Indentation of the line after a labelled value
+_NEXT_LINE = re.compile(r"\r?\n([ \t]*)\S")
+
+
+def _field_words(name: str) -> List[str]:
+    return [word.lower() for word in _WORD_BOUNDARY.split(name) if word]
+
+
+def _continues(text: str, match: "re.Match[str]") -> bool:
+    """True if the line after a labelled value is indented further, so may continue it"""
+    following = _NEXT_LINE.match(text, match.end())
+    if following is None:
+        return False
+    line = match.group(0)
+    return len(following.group(1)) > len(line) - len(line.lstrip(" \t"))
+
+
+def _coerce(value: str, field_type: str) -> Tuple[Any, bool]:
+    """Convert matched text to the schema type; return (value, ok)"""
+    if field_type == "number":
+        try:
+            return float(re.sub(r"[^\d.-]", "", value)), True
+        except ValueError:
+            return None, False
+    if field_type == "boolean":
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True, True
+        if lowered in _FALSE:
+            return False, True
+        return None, False
+    if field_type == "array":
+        items = [item.strip() for item in re.split(r"[,;]", value) if item.strip()]
+        return items, bool(items)
+    return value, True
+
+
+class _FieldExtractor:
+    """Precompiled matcher for one schema field"""
+
+    __slots__ = ("name", "field_type", "kind", "label")
+
+    def __init__(self, name: str, field_type: str):
+        self.name = name
+        self.field_type = field_type.strip().lower()
+        words = _field_words(name)
+        if self.field_type in _PATTERNS:
+            self.kind: Optional[str] = self.field_type
+        else:
+            self.kind = next((_NAME_HINTS[word] for word in words if word in _NAME_HINTS), None)
+        label = r"[\s_-]*".join(re.escape(word) for word in words)
+        self.label = re.compile(rf"^[ \t]*{label}[ \t]*[:=][ \t]*(\S.*?)[ \t]*$", re.IGNORECASE | re.MULTILINE)
+
+    def extract(self, text: str) -> Tuple[Any, float]:
+        """Return the field's value and confidence (0.0 when not found)"""
+        labeled = list(self.label.finditer(text))
+        if len(labeled) == 1:
+            raw = labeled[0].group(1)
+            if self.kind is not None:
+                pattern = _PATTERNS["number" if self.kind == "amount" else self.kind]
+                match = pattern.search(raw)
+                if match is not None:
+                    value, ok = _coerce(match.group(0), self.field_type)
+                    if ok:
+                        return value, LABELED_MATCH
+                return None, 0.0
+            value, ok = _coerce(raw, self.field_type)
+            if not ok:
+                return None, 0.0
+            if self.field_type == "boolean":
+                # Only a yes/no word coerces, so the value is validated
+                return value, LABELED_MATCH
+            if _continues(text, labeled[0]):
+                # Only the first line of a multi-line value was captured
+                return value, AMBIGUOUS_MATCH
+            return value, LABELED_TEXT
+
+        if self.kind is None or self.kind == "number" or labeled:
+            return None, 0.0
+        matches = list(OrderedDict.fromkeys(_PATTERNS[self.kind].findall(text)))
+        if not matches:
+            return None, 0.0
+        value, ok = _coerce(matches[0], self.field_type)
+        if not ok:
+            return None, 0.0
+        return value, UNIQUE_MATCH if len(matches) == 1 else AMBIGUOUS_MATCH
+
+
+@dataclass
+class LocalStats:
+    """Local fast-path counters"""
+    requests: int = 0
+    skipped: int = 0
+    partial: int = 0
+    fields: int = 0
+    fields_resolved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests answered without the network"""
+        return self.skipped / self.requests if self.requests else 0.0
+
+    @property
+    def field_hit_rate(self) -> float:
+        """Fraction of fields filled locally"""
+        return self.fields_resolved / self.fields if self.fields else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary"""
+        data = asdict(self)
+        data["hit_rate"] = self.hit_rate
+        data["field_hit_rate"] = self.field_hit_rate
+        return data
+
+
+class LocalExtraction:
+    """Outcome of a local pass over one input"""
+
+    __slots__ = ("schema", "values", "confidence", "remaining", "started_at")
+
+    def __init__(
+        self,
+        schema: Dict[str, str],
+        values: Dict[str, Any],
+        confidence: Dict[str, float],
+        remaining: Dict[str, str],
+        started_at: float
+    ):
+        self.schema = schema
+        self.values = values
+        self.confidence = confidence
+        self.remaining = remaining
+        self.started_at = started_at
+
+    @property
+    def complete(self) -> bool:
+        """True if every field was resolved locally"""
+        return not self.remaining
+
+    def as_result(self) -> Dict[str, Any]:
+        """Build a parse result from local values alone"""
+        return {
+            "success": True,
+            "parsedData": {name: self.values[name] for name in self.schema},
+            "metadata": {
+                "confidence": min(self.confidence.values()) if self.confidence else 1.0,
+                "processingTimeMs": int((time.perf_counter() - self.started_at) * 1000),
+                "tokensUsed": 0,
+                "requestId": "local",
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "version": "local",
+                "features": ["local-extraction"],
+                "fieldConfidence": dict(self.confidence),
+            }
+        }
+
+    def merge(self, remote: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine local values with the API's result for the remaining fields"""
+        if not remote.get("success"):
+            return remote
+
+        remote_data = remote.get("parsedData") or {}
+        metadata = dict(remote.get("metadata") or {})
+        remote_confidence = metadata.get("confidence")
+        field_confidence = {
+            name: self.confidence.get(name, remote_confidence) for name in self.schema
+        }
+        metadata["fieldConfidence"] = field_confidence
+        metadata["localFields"] = list(self.values)
+
+        merged = dict(remote)
+        merged["parsedData"] = {
+            name: self.values[name] if name in self.values else remote_data.get(name)
+            for name in self.schema
+        }
+        merged["metadata"] = metadata
+        return merged
+
+
+class LocalExtractor:
+    """
+    Regex-based extraction of pattern-shaped fields, compiled per schema
+
+    A field counts as resolved when its confidence reaches
+    ``min_confidence``: a labelled line that validates against the field's
+    pattern (or a labelled yes/no for a boolean) scores 0.95, a single
+    unlabelled pattern match 0.9, other labelled text 0.6 and several
+    conflicting matches or a value continued on further lines 0.4.
+    """
+
+    def __init__(self, min_confidence: float = 0.85, max_schemas: int = 128):
+        """
+        Initialize local extractor
+
+        Args:
+            min_confidence: Confidence a local value needs to be used
+            max_schemas: Number of compiled schemas kept
+        """
+        self.min_confidence = min_confidence
+        self.max_schemas = max_schemas
+        self.stats = LocalStats()
+        self._compiled: "OrderedDict[str, List[_FieldExtractor]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compile(self, output_schema: SchemaLike) -> List[_FieldExtractor]:
+        """Return the cached field extractors for a schema"""
+        fields = schema_fields(output_schema)
+        key = schema_fingerprint(fields)
+        with self._lock:
+            extractors = self._compiled.get(key)
+            if extractors is not None:
+                self._compiled.move_to_end(key)
+                return extractors
+
+        extractors = [_FieldExtractor(name, str(kind)) for name, kind in fields.items()]
+        with self._lock:
+            self._compiled[key] = extractors
+            while len(self._compiled) > self.max_schemas:
+                self._compiled.popitem(last=False)
+        return extractors
+
+    def extract(self, input_data: str, output_schema: SchemaLike) -> LocalExtraction:
+        """Run every field extractor over ``input_data``"""
+        started_at = time.perf_counter()
+        schema = schema_fields(output_schema)
+        if not schema:
+            raise ValueError("output_schema must not be empty")
+        values: Dict[str, Any] = {}
+        confidence: Dict[str, float] = {}
+        remaining: Dict[str, str] = {}
+        for extractor in self.compile(schema):
+            value, score = extractor.extract(input_data)
+            if score >= self.min_confidence:
+                values[extractor.name] = value
+                confidence[extractor.name] = score
+            else:
+                remaining[extractor.name] = schema[extractor.name]
+
+        with self._lock:
+            stats = self.stats
+            stats.requests += 1
+            stats.fields += len(schema)
+            stats.fields_resolved += len(values)
+            if not remaining:
+                stats.skipped += 1
+            elif values:
+                stats.partial += 1
+        return LocalExtraction(schema, values, confidence, remaining, started_at)
@@ -0,0 +1,540 @@
+"""
+Micro-batching of small parse requests
+
+Tiny inputs such as one-line records spend most of their cost on
+per-request overhead: the HTTP round trip and the Architect stage.
+:class:`MicroBatcher` collects ``parse()`` calls that share a schema for up
+to ``max_wait`` seconds and packs them into one request. The packed input
+separates records with delimiter lines, and the packed schema repeats every
+field once per record (``r0_name``, ``r1_name``, ...). Each caller then
+gets its own slice of the response. Batches are closed early when the
+estimated request size would pass ``max_tokens``. Records whose slice is
+missing, empty or looks like it was taken from another record are parsed
+again on their own.
+
+Each record still goes through the client's local fast path, result cache,
+coalescing, deadline and result settings on its own; only the fields left
+unresolved join a batch, and results match the client's ``parse()``.
+
+The API's schema types are flat, so records are packed into prefixed
+fields rather than an array of objects.
+"""
+
+import asyncio
+import functools
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .cache import make_cache_key
+from .client import AsyncParserator, Parserator
+from .decoding import ParseResult
+from .ratelimit import estimate_tokens
+from .scheduling import DeadlineExceeded, Ticket
+from .schema import SchemaLike, schema_fields
+
+RECORD_DELIMITER = "### RECORD {index} ###"
+
+# Records containing this text cannot be packed unambiguously
+_DELIMITER_MARK = "### RECORD "
+
+# Shortest string value checked for having come from another record
+_MIN_ATTRIBUTION_CHARS = 4
+
+
+def record_key(index: int, field: str) -> str:
+    """Name of ``field`` for record ``index`` in a packed schema"""
+    return f"r{index}_{field}"
+
+
+def pack_records(records: Sequence[str], fields: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+    """
+    Pack records into one input and one prefixed schema
+
+    Returns:
+        Tuple of ``(input_data, output_schema)`` for the packed request
+    """
+    parts = []
+    schema = {}
+    for index, record in enumerate(records):
+        parts.append(RECORD_DELIMITER.format(index=index))
+        parts.append(record)
+        for field, kind in fields.items():
+            schema[record_key(index, field)] = kind
+    return "\n".join(parts), schema
+
+
+def _empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _misattributed(values: Dict[str, Any], index: int, records: Sequence[str]) -> bool:
+    """True if a string value is absent from its record but present in another"""
+    record = records[index]
+    for value in values.values():
+        if not isinstance(value, str) or len(value) < _MIN_ATTRIBUTION_CHARS or value in record:
+            continue
+        if any(value in other for position, other in enumerate(records) if position != index):
+            return True
+    return False
+
+
+def split_result(
+    result: Dict[str, Any],
+    records: Sequence[str],
+    fields: Dict[str, str]
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Split a packed parse result into one result per record
+
+    Returns:
+        One result per record, or None where the record must be parsed on
+        its own (failed request, missing or empty slice, or values that
+        appear to belong to another record)
+    """
+    parsed = result.get("parsedData")
+    if not result.get("success") or not isinstance(parsed, dict):
+        return [None] * len(records)
+
+    metadata = result.get("metadata") or {}
+    tokens = metadata.get("tokensUsed")
+    split: List[Optional[Dict[str, Any]]] = []
+    for index in range(len(records)):
+        keys = [record_key(index, field) for field in fields]
+        if any(key not in parsed for key in keys):
+            split.append(None)
+            continue
+
+        values = {field: parsed[key] for field, key in zip(fields, keys)}
+        if all(_empty(value) for value in values.values()) or _misattributed(values, index, records):
+            split.append(None)
+            continue
+
+        record_metadata = dict(metadata)
+        record_metadata["batchSize"] = len(records)
+        record_metadata["batchIndex"] = index
+        if isinstance(tokens, int):
+            record_metadata["tokensUsed"] = tokens // len(records)
+        split.append({"success": True, "parsedData": values, "metadata": record_metadata})
+    return split
+
+
+def _as_dict(result: Any) -> Dict[str, Any]:
+    return result.raw if isinstance(result, ParseResult) else result
+
+
+@dataclass
+class MicroBatchStats:
+    """Micro-batching counters"""
+    records: int = 0
+    batches: int = 0
+    direct: int = 0
+    fallbacks: int = 0
+
+    @property
+    def records_per_batch(self) -> float:
+        """Average number of records sent per batch"""
+        return self.records / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary"""
+        data = asdict(self)
+        data["records_per_batch"] = self.records_per_batch
+        return data
+
+
+class _Batch:
+    """Records waiting to be sent together"""
+
+    __slots__ = ("fields", "confidence_threshold", "options", "records", "waiters",
+                 "tickets", "input_chars", "schema_chars", "timer")
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]]
+    ):
+        self.fields = fields
+        self.confidence_threshold = confidence_threshold
+        self.options = options
+        self.records: List[str] = []
+        self.waiters: List[Any] = []
+        self.tickets: List[Ticket] = []
+        self.input_chars = 0
+        self.schema_chars = 0
+        self.timer: Any = None
+
+    def _growth(self, record: str) -> Tuple[int, int]:
+        index = len(self.records)
+        input_chars = len(RECORD_DELIMITER.format(index=index)) + len(record) + 1
+        schema_chars = sum(len(record_key(index, field)) + len(kind) + 6 for field, kind in self.fields.items())
+        return input_chars, schema_chars
+
+    def fits(self, record: str, max_tokens: int) -> bool:
+        """True if adding ``record`` keeps the packed request under ``max_tokens``"""
+        if not self.records:
+            return True
+        input_chars, schema_chars = self._growth(record)
+        return estimate_tokens(self.input_chars + input_chars, self.schema_chars + schema_chars) <= max_tokens
+
+    def add(self, record: str, waiter: Any, ticket: Ticket) -> None:
+        input_chars, schema_chars = self._growth(record)
+        self.input_chars += input_chars
+        self.schema_chars += schema_chars
+        self.records.append(record)
+        self.waiters.append(waiter)
+        self.tickets.append(ticket)
+
+    def ticket(self) -> Ticket:
+        """Ticket of the packed request: the highest priority and latest deadline"""
+        expiries = [ticket.expires_at for ticket in self.tickets]
+        expires_at = None if None in expiries else max(expiries)
+        return Ticket(max(ticket.priority for ticket in self.tickets), expires_at)
+
+
+class _Waiter:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[Exception] = None
+
+
+class _BatcherBase:
+    """Batch bookkeeping shared by the sync and async batchers"""
+
+    def __init__(
+        self,
+        max_records: int,
+        max_wait: float,
+        max_tokens: int,
+        max_record_chars: int
+    ):
+        if max_records < 1:
+            raise ValueError("max_records must be at least 1")
+        self.max_records = max_records
+        self.max_wait = max_wait
+        self.max_tokens = max_tokens
+        self.max_record_chars = max_record_chars
+        self.stats = MicroBatchStats()
+        self._batches: Dict[str, _Batch] = {}
+        self._lock = threading.Lock()
+
+    def _batchable(self, input_data: str, fields: Dict[str, str]) -> bool:
+        return bool(fields) and len(input_data) <= self.max_record_chars and _DELIMITER_MARK not in input_data
+
+    def _enqueue(
+        self,
+        input_data: str,
+        fields: Dict[str, str],
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]],
+        ticket: Ticket,
+        waiter: Any
+    ) -> Tuple[Optional[_Batch], List[_Batch]]:
+        """
+        Add a record to its batch; call with the lock held
+
+        Returns:
+            The batch if it was newly created (so the caller starts its
+            timer) and any batches that are now ready to send
+        """
+        key = make_cache_key("", fields, confidence_threshold, options)
+        ready = []
+        batch = self._batches.get(key)
+        if batch is not None and not batch.fits(input_data, self.max_tokens):
+            ready.append(self._batches.pop(key))
+            batch = None
+
+        created = None
+        if batch is None:
+            batch = created = self._batches[key] = _Batch(fields, confidence_threshold, options)
+        batch.add(input_data, waiter, ticket)
+        if len(batch.records) >= self.max_records:
+            ready.append(self._batches.pop(key))
+            if created is batch:
+                created = None
+        return created, ready
+
+    def _take(self, batch: _Batch) -> bool:
+        """Remove ``batch`` if it is still pending; call with the lock held"""
+        for key, pending in self._batches.items():
+            if pending is batch:
+                del self._batches[key]
+                return True
+        return False
+
+    def _count(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+
+class MicroBatcher(_BatcherBase):
+    """
+    Packs concurrent small ``parse()`` calls from many threads into batches
+
+    The thread that fills a batch sends it; partially filled batches are
+    sent by a timer after ``max_wait`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: Parserator,
+        max_records: int = 20,
+        max_wait: float = 0.02,
+        max_tokens: int = 8000,
+        max_record_chars: int = 2000
+    ):
+        """
+        Initialize micro-batcher
+
+        Args:
+            client: Client used to send batches
+            max_records: Maximum records packed into one request
+            max_wait: Seconds the first record of a batch waits for company
+            max_tokens: Estimated token budget of a packed request
+            max_record_chars: Larger inputs are sent on their own
+        """
+        super().__init__(max_records, max_wait, max_tokens, max_record_chars)
+        self.client = client
+
+    def parse(
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
+        confidence_threshold: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None
+    ) -> Any:
+        """
+        Parse ``input_data`` as part of a batch; blocks until its batch returns
+
+        Arguments and results match :meth:`Parserator.parse`.
+        """
+        if not self._batchable(input_data, schema_fields(output_schema)):
+            self._count(direct=1)
+            return self.client.parse(input_data, output_schema, confidence_threshold, options, priority, deadline)
+
+        return self.client._parse_routed(
+            input_data, output_schema, confidence_threshold, options,
+            Ticket.start(priority, deadline),
+            send=functools.partial(self._submit, confidence_threshold, options)
+        )
+
+    def _submit(
+        self,
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]],
+        input_data: str,
+        fields: Dict[str, str],
+        ticket: Ticket
+    ) -> Optional[Dict[str, Any]]:
+        """Add a record to a batch and wait for its share of the result"""
+        waiter = _Waiter()
+        with self._lock:
+            created, ready = self._enqueue(input_data, fields, confidence_threshold, options, ticket, waiter)
+            if created is not None:
+                created.timer = threading.Timer(self.max_wait, self._expire, (created,))
+                created.timer.daemon = True
+                created.timer.start()
+
+        for batch in ready:
+            self._send(batch)
+        if not waiter.event.wait(ticket.remaining()):
+            raise DeadlineExceeded("Deadline exceeded while waiting for a micro-batch")
+        if waiter.error is not None:
+            raise waiter.error
+        return waiter.result
+
+    def _expire(self, batch: _Batch) -> None:
+        with self._lock:
+            if not self._take(batch):
+                return
+        self._send(batch)
+
+    def _send(self, batch: _Batch) -> None:
+        if batch.timer is not None:
+            batch.timer.cancel()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch.records)
+        error = None
+        try:
+            results = self._run(batch)
+        except Exception as e:
+            # Each caller's client turns this into its own error result
+            error = e
+        for waiter, result in zip(batch.waiters, results):
+            waiter.result = result
+            waiter.error = error
+            waiter.event.set()
+
+    def _run(self, batch: _Batch) -> List[Optional[Dict[str, Any]]]:
+        """Send a batch; None marks records the client sends on their own"""
+        records = batch.records
+        self._count(batches=1, records=len(records))
+        if len(records) == 1:
+            return [None]
+
+        input_data, schema = pack_records(records, batch.fields)
+        # Skip the client's local fast path, which would see all records at once
+        result = self.client._parse_routed(
+            input_data, schema, batch.confidence_threshold, batch.options, batch.ticket(), local=False
+        )
+        results = split_result(_as_dict(result), records, batch.fields)
+        self._count(fallbacks=sum(split is None for split in results))
+        return results
+
+    def flush(self) -> None:
+        """Send every pending batch now"""
+        with self._lock:
+            batches = list(self._batches.values())
+            self._batches.clear()
+        for batch in batches:
+            self._send(batch)
+
+    def close(self) -> None:
+        """Flush pending batches; the client stays open"""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncMicroBatcher(_BatcherBase):
+    """
+    Async counterpart of :class:`MicroBatcher` for ``AsyncParserator``
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        client: AsyncParserator,
+        max_records: int = 20,
+        max_wait: float = 0.02,
+        max_tokens: int = 8000,
+        max_record_chars: int = 2000
+    ):
+        """
+        Initialize async micro-batcher
+
+        Arguments match :class:`MicroBatcher`.
+        """
+        super().__init__(max_records, max_wait, max_tokens, max_record_chars)
+        self.client = client
+        self._tasks: "set[asyncio.Task]" = set()
+
+    async def parse(
+        self,
+        input_data: str,
+        output_schema: SchemaLike,
+        confidence_threshold: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None
+    ) -> Any:
+        """
+        Parse ``input_data`` as part of a batch
+
+        Arguments and results match :meth:`AsyncParserator.parse`.
+        """
+        if not self._batchable(input_data, schema_fields(output_schema)):
+            self._count(direct=1)
+            return await self.client.parse(
+                input_data, output_schema, confidence_threshold, options, priority, deadline
+            )
+
+        return await self.client._parse_routed(
+            input_data, output_schema, confidence_threshold, options,
+            Ticket.start(priority, deadline),
+            send=functools.partial(self._submit, confidence_threshold, options)
+        )
+
+    async def _submit(
+        self,
+        confidence_threshold: Optional[float],
+        options: Optional[Dict[str, Any]],
+        input_data: str,
+        fields: Dict[str, str],
+        ticket: Ticket
+    ) -> Optional[Dict[str, Any]]:
+        """Add a record to a batch and wait for its share of the result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            created, ready = self._enqueue(input_data, fields, confidence_threshold, options, ticket, future)
+        if created is not None:
+            created.timer = loop.call_later(self.max_wait, self._expire, created)
+        for batch in ready:
+            self._spawn(batch)
+        try:
+            return await asyncio.wait_for(future, ticket.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("Deadline exceeded while waiting for a micro-batch") from None
+
+    def _expire(self, batch: _Batch) -> None:
+        with self._lock:
+            if not self._take(batch):
+                return
+        self._spawn(batch)
+
+    def _spawn(self, batch: _Batch) -> None:
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: _Batch) -> None:
+        try:
+            results = await self._run(batch)
+        except Exception as e:
+            for future in batch.waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(batch.waiters, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self, batch: _Batch) -> List[Optional[Dict[str, Any]]]:
+        """Send a batch; None marks records the client sends on their own"""
+        records = batch.records
+        self._count(batches=1, records=len(records))
+        if len(records) == 1:
+            return [None]
+
+        input_data, schema = pack_records(records, batch.fields)
+        # Skip the client's local fast path, which would see all records at once
+        result = await self.client._parse_routed(
+            input_data, schema, batch.confidence_threshold, batch.options, batch.ticket(), local=False
+        )
+        results = split_result(_as_dict(result), records, batch.fields)
+        self._count(fallbacks=sum(split is None for split in results))
+        return results
+
+    async def flush(self) -> None:
+        """Send every pending batch and wait for all in-flight batches"""
+        with self._lock:
+            batches = list(self._batches.values())
+            self._batches.clear()
+        for batch in batches:
+            self._spawn(batch)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def aclose(self) -> None:
+        """Flush pending batches; the client stays open"""
+        await self.flush()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,184 @@
+"""
+Client-side cache of Architect plans
+
+Every parse request normally runs two model stages: the Architect writes a
+search plan from the schema and a sample of the input, then the Extractor
+follows it. Plans depend mostly on the schema, so :class:`PlanCache` keeps
+the plan the server returned per schema fingerprint (optionally split by
+coarse input shape) and the client sends it back as ``architectPlan``,
+letting the API go straight to the Extractor. A replayed plan whose result
+comes back below ``min_confidence`` is dropped, so the next request for
+that key plans afresh.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .cache import CacheStats, schema_fingerprint
+
+# Characters of input inspected when computing its shape
+SHAPE_SAMPLE_CHARS = 2000
+
+_DELIMITERS = (",", "\t", "|", ";")
+
+
+def input_shape(input_data: str) -> str:
+    """
+    Coarse structural signature of an input
+
+    Combines the apparent format (JSON, markup or text), a log-scale line
+    count bucket and the dominant field delimiter of the first
+    :data:`SHAPE_SAMPLE_CHARS` characters. Inputs with the same shape
+    usually want the same plan.
+    """
+    sample = input_data[:SHAPE_SAMPLE_CHARS]
+    first = sample.lstrip()[:1]
+    if first in ("{", "["):
+        kind = "json"
+    elif first == "<":
+        kind = "markup"
+    else:
+        kind = "text"
+
+    lines = min(sample.count("\n"), 255).bit_length()
+    counts = [(sample.count(delimiter), delimiter) for delimiter in _DELIMITERS]
+    count, delimiter = max(counts)
+    return f"{kind}:{lines}:{delimiter if count else '-'}"
+
+
+@dataclass
+class PlanCacheStats(CacheStats):
+    """Plan cache counters; ``invalidations`` counts plans dropped for low confidence"""
+    invalidations: int = 0
+
+
+class PlanCache:
+    """
+    Thread-safe LRU cache of Architect plans keyed by schema and input shape
+
+    Share one instance between clients talking to the same API.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: Optional[float] = None,
+        min_confidence: float = 0.8,
+        shape: Optional[Callable[[str], str]] = input_shape
+    ):
+        """
+        Initialize plan cache
+
+        Args:
+            max_entries: Maximum number of plans kept before evicting the
+                least recently used one
+            ttl: Optional lifetime of a plan in seconds
+            min_confidence: Plans are only stored, and only kept after a
+                replay, when the result's confidence reaches this value
+            shape: Function mapping an input to a shape key, or None to
+                keep a single plan per schema
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.min_confidence = min_confidence
+        self.shape = shape
+        self.stats = PlanCacheStats()
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, output_schema: Dict[str, Any], input_data: str) -> str:
+        """Return the cache key for a schema and input"""
+        fingerprint = schema_fingerprint(output_schema)
+        if self.shape is None:
+            return fingerprint
+        return f"{fingerprint}/{self.shape(input_data)}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the plan stored under ``key`` or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            expires_at, plan = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return plan
+
+    def put(self, key: str, plan: Any, confidence: Optional[float] = None) -> bool:
+        """
+        Store a plan returned by the server
+
+        Returns:
+            True if the plan was stored, False if it was not a dict or its
+            confidence was below ``min_confidence``
+        """
+        if not isinstance(plan, dict) or not self._confident(confidence):
+            return False
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        plan = copy.deepcopy(plan)
+        with self._lock:
+            self._entries[key] = (expires_at, plan)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return True
+
+    def record(self, key: str, confidence: Optional[float]) -> bool:
+        """
+        Record the confidence of a request that replayed the plan at ``key``
+
+        Returns:
+            False if the plan was invalidated
+        """
+        if self._confident(confidence):
+            return True
+        self.invalidate(key)
+        return False
+
+    def invalidate(self, key: str) -> None:
+        """Drop the plan stored under ``key``"""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def invalidate_schema(self, output_schema: Dict[str, Any]) -> int:
+        """
+        Drop every plan for ``output_schema``, across all input shapes
+
+        Returns:
+            Number of plans dropped
+        """
+        fingerprint = schema_fingerprint(output_schema)
+        with self._lock:
+            keys = [key for key in self._entries if key.split("/", 1)[0] == fingerprint]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every plan"""
+        with self._lock:
+            self._entries.clear()
+
+    def _confident(self, confidence: Optional[float]) -> bool:
+        return confidence is None or confidence >= self.min_confidence
@@ -0,0 +1,116 @@
+"""
+Connection pool statistics for Parserator clients
+
+Statistics are gathered from httpcore's ``trace`` request extension: a
+request whose first network event is a TCP connect opened a new
+connection, otherwise it reused a pooled one, and the time from sending
+to that first event is how long it waited for a pool slot.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+_CONNECT_EVENT = "connection.connect_tcp.started"
+
+
+class RequestTrace:
+    """
+    Per-request trace callback for sync clients
+
+    Records when each httpcore event fired, keyed by event name with the
+    protocol prefix (``http11.``/``http2.``) removed.
+    """
+
+    __slots__ = ("started_at", "first_event_at", "new_connection", "events")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.first_event_at: Optional[float] = None
+        self.new_connection = False
+        self.events: Dict[str, float] = {}
+
+    def _record(self, event_name: str) -> None:
+        now = time.perf_counter()
+        if self.first_event_at is None:
+            self.first_event_at = now
+        if event_name == _CONNECT_EVENT:
+            self.new_connection = True
+        if event_name.startswith("http"):
+            event_name = event_name.split(".", 1)[1]
+        self.events[event_name] = now
+
+    def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        self._record(event_name)
+
+
+class AsyncRequestTrace(RequestTrace):
+    """Per-request trace callback for async clients"""
+
+    __slots__ = ()
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:  # type: ignore[override]
+        self._record(event_name)
+
+
+class PoolStats:
+    """Thread-safe counters describing connection pool behaviour"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.pool_wait_total = 0.0
+        self.pool_wait_max = 0.0
+
+    def record(self, trace: RequestTrace) -> None:
+        """Fold a finished request trace into the counters"""
+        if trace.first_event_at is None:
+            # Transport emitted no trace events (e.g. a mock transport)
+            with self._lock:
+                self.requests += 1
+            return
+
+        wait = trace.first_event_at - trace.started_at
+        with self._lock:
+            self.requests += 1
+            if trace.new_connection:
+                self.new_connections += 1
+            else:
+                self.reused_connections += 1
+            self.pool_wait_total += wait
+            self.pool_wait_max = max(self.pool_wait_max, wait)
+
+    def as_dict(self, transport: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Return counters plus a snapshot of the pool's connections
+
+        Args:
+            transport: The client's transport, used to count active and
+                idle connections when it exposes an httpcore pool
+        """
+        with self._lock:
+            traced = self.new_connections + self.reused_connections
+            stats: Dict[str, Any] = {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "reuse_rate": self.reused_connections / traced if traced else 0.0,
+                "pool_wait_avg_ms": self.pool_wait_total / traced * 1000 if traced else 0.0,
+                "pool_wait_max_ms": self.pool_wait_max * 1000,
+            }
+        stats.update(connection_counts(transport))
+        return stats
+
+
+def connection_counts(transport: Optional[Any]) -> Dict[str, Optional[int]]:
+    """Count active and idle connections in an httpx transport's pool"""
+    pool = getattr(transport, "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return {"active_connections": None, "idle_connections": None}
+
+    idle = sum(1 for conn in connections if conn.is_idle())
+    return {"active_connections": len(connections) - idle, "idle_connections": idle}
+
@@ -0,0 +1,207 @@
+"""
+Client-side rate limiting for Parserator clients
+
+Limiters use the generic cell rate algorithm (GCRA): each bucket is a
+single "theoretical arrival time", which makes reservations O(1) and lets
+the state be shared between processes through a tiny locked file.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+# Per-minute request limits enforced by the API (rateLimitMiddleware.ts)
+PLAN_LIMITS: Dict[str, int] = {
+    "anonymous": 5,
+    "free": 10,
+    "pro": 100,
+    "enterprise": 1000,
+}
+
+# Fixed prompt text the API wraps around every request, in characters
+_PROMPT_OVERHEAD_CHARS = 1600
+
+
+def estimate_tokens(input_chars: int, schema_chars: int) -> int:
+    """Estimate the tokens of a request from its input and JSON schema sizes"""
+    chars = min(input_chars, 1000) + input_chars + 2 * schema_chars + _PROMPT_OVERHEAD_CHARS
+    return max(1, chars // 4)
+
+
+def estimate_request_tokens(payload: Dict[str, Any]) -> int:
+    """
+    Estimate the tokens a /v1/parse request will consume
+
+    Mirrors the API's own accounting: the Architect sees the first 1KB of
+    input plus the schema, the Extractor sees the full input plus the
+    schema, at roughly four characters per token. A replayed
+    ``architectPlan`` skips the Architect and is shown to the Extractor.
+    """
+    input_chars = len(payload.get("inputData") or "")
+    schema_chars = len(json.dumps(payload.get("outputSchema") or {}))
+    plan = payload.get("architectPlan")
+    if plan is None:
+        return estimate_tokens(input_chars, schema_chars)
+    chars = input_chars + schema_chars + len(json.dumps(plan)) + _PROMPT_OVERHEAD_CHARS // 2
+    return max(1, chars // 4)
+
+
+class RateLimiter:
+    """
+    Thread-safe request and token rate limiter
+
+    Calls to :meth:`acquire` reserve capacity immediately and then sleep
+    until their slot comes up, so concurrent callers are spaced out evenly
+    instead of bursting into server-side 429s. Rates are multiplied by
+    ``headroom`` to stay just under the quota.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+        headroom: float = 0.9
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_second: Request quota, or None for no request limit
+            tokens_per_minute: Token quota, or None for no token limit
+            burst: Requests that may be sent back-to-back (defaults to one
+                second's worth, at least 1)
+            headroom: Fraction of each quota to actually use
+        """
+        if not 0 < headroom <= 1:
+            raise ValueError("headroom must be in (0, 1]")
+
+        # Each bucket is (seconds per unit, capacity in units)
+        self._buckets: List[Tuple[float, float]] = []
+        if requests_per_second:
+            rate = requests_per_second * headroom
+            self._buckets.append((1.0 / rate, burst or max(1.0, rate)))
+        else:
+            self._buckets.append((0.0, 1.0))
+        if tokens_per_minute:
+            rate = tokens_per_minute * headroom / 60.0
+            # Allow ten seconds' worth of tokens to go out at once
+            self._buckets.append((1.0 / rate, rate * 10))
+
+        self._tats = [0.0] * len(self._buckets)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_plan(cls, plan: str, **kwargs: Any) -> "RateLimiter":
+        """Create a limiter matching the per-minute quota of an API plan"""
+        try:
+            per_minute = PLAN_LIMITS[plan]
+        except KeyError:
+            raise ValueError(f"Unknown plan {plan!r}, expected one of {sorted(PLAN_LIMITS)}")
+        kwargs.setdefault("burst", 1.0)
+        return cls(requests_per_second=per_minute / 60.0, **kwargs)
+
+    def _now(self) -> float:
+        return time.monotonic()
+
+    def _reserve_locked(self, tats: List[float], now: float, tokens: int) -> float:
+        """Advance bucket state for one request and return its wait"""
+        wait = 0.0
+        units = (1, tokens)
+        for i, (interval, capacity) in enumerate(self._buckets):
+            cost = interval * units[i]
+            tat = max(tats[i], now)
+            wait = max(wait, (tat - now) + cost - interval * capacity)
+            tats[i] = tat + cost
+        return wait
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve capacity for one request using ``tokens`` tokens
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            return self._reserve_locked(self._tats, self._now(), tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (e.g. after a 429)"""
+        with self._lock:
+            self._pause_locked(self._tats, self._now(), seconds)
+
+    def _pause_locked(self, tats: List[float], now: float, seconds: float) -> None:
+        for i, (interval, capacity) in enumerate(self._buckets):
+            tats[i] = max(tats[i], now + seconds + interval * capacity)
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Block until a request using ``tokens`` tokens may be sent"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int = 1) -> None:
+        """Wait without blocking the event loop until a request may be sent"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Rate limiter whose state lives in a file shared by processes on a host
+
+    Every reservation takes an exclusive ``flock`` on ``path``, reads the
+    bucket state, updates it and writes it back. Requires a POSIX platform.
+    """
+
+    def __init__(self, path: str, **kwargs: Any):
+        """
+        Initialize file-backed rate limiter
+
+        Args:
+            path: State file path (created if missing)
+            **kwargs: Rate options accepted by :class:`RateLimiter`
+        """
+        if fcntl is None:
+            raise RuntimeError("FileRateLimiter requires fcntl (POSIX only)")
+        super().__init__(**kwargs)
+        self.path = os.fspath(path)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        os.close(fd)
+
+    def _now(self) -> float:
+        # Wall-clock time is comparable across processes
+        return time.time()
+
+    def _update(self, fn: Any) -> Any:
+        with self._lock, open(self.path, "r+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                raw = f.read()
+                tats = json.loads(raw) if raw else []
+                if len(tats) != len(self._buckets):
+                    tats = [0.0] * len(self._buckets)
+                result = fn(tats, self._now())
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(tats))
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def reserve(self, tokens: int = 1) -> float:
+        return self._update(lambda tats, now: self._reserve_locked(tats, now, tokens))
+
+    def pause(self, seconds: float) -> None:
+        self._update(lambda tats, now: self._pause_locked(tats, now, seconds))
@@ -0,0 +1,205 @@
+"""
+Retry policy and circuit breaker for Parserator clients
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+import httpx
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the host's circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+
+    After ``failure_threshold`` consecutive failures the circuit for a host
+    opens and requests fail fast for ``reset_timeout`` seconds. Then a single
+    trial request is let through (half-open); its outcome closes or re-opens
+    the circuit. A trial that ends without an outcome (a deadline or
+    cancellation) is handed back with :meth:`release`, and one that never
+    reports back is replaced after another ``reset_timeout``. Thread-safe, so one breaker can be shared by several
+    clients.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to wait before allowing a trial request
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        # host -> [state, consecutive failures, opened or trial started at]
+        self._hosts: Dict[str, list] = {}
+
+    def state(self, host: str) -> str:
+        """Return the current state for ``host``"""
+        with self._lock:
+            return self._entry(host)[0]
+
+    def _entry(self, host: str) -> list:
+        entry = self._hosts.get(host)
+        if entry is None:
+            entry = self._hosts[host] = [self.CLOSED, 0, 0.0]
+        return entry
+
+    def allow(self, host: str) -> bool:
+        """Return True if a request to ``host`` may be sent now"""
+        with self._lock:
+            entry = self._entry(host)
+            if entry[0] == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - entry[2] >= self.reset_timeout:
+                entry[0], entry[2] = self.HALF_OPEN, now
+                return True
+            return False
+
+    def record_success(self, host: str) -> None:
+        """Record a successful request to ``host``"""
+        with self._lock:
+            entry = self._entry(host)
+            entry[0], entry[1] = self.CLOSED, 0
+
+    def release(self, host: str) -> None:
+        """Hand back a half-open trial to ``host`` that ended without an outcome"""
+        with self._lock:
+            entry = self._entry(host)
+            if entry[0] == self.HALF_OPEN:
+                entry[0], entry[2] = self.OPEN, time.monotonic() - self.reset_timeout
+
+    def record_failure(self, host: str) -> None:
+        """Record a failed request to ``host``"""
+        with self._lock:
+            entry = self._entry(host)
+            entry[1] += 1
+            if entry[0] == self.HALF_OPEN or entry[1] >= self.failure_threshold:
+                entry[0], entry[2] = self.OPEN, time.monotonic()
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient API failures
+
+    Retries use exponential backoff with full jitter, honor ``Retry-After``
+    headers, and stop once ``max_attempts`` or the ``max_retry_time`` budget
+    is exhausted. An optional :class:`CircuitBreaker` makes requests fail
+    fast while a host is down. Works with both sync and async clients.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_exceptions: Tuple[Type[BaseException], ...] = (httpx.TransportError,),
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_retry_time: Optional[float] = 60.0,
+        respect_retry_after: bool = True,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            max_attempts: Total attempts per request, including the first
+            retry_statuses: HTTP status codes that trigger a retry
+            retry_exceptions: Exception types that trigger a retry
+            backoff_base: Backoff ceiling for the first retry in seconds
+            backoff_max: Maximum backoff ceiling in seconds
+            max_retry_time: Total seconds a request may spend retrying, or
+                None for no limit
+            respect_retry_after: Wait at least as long as a ``Retry-After``
+                response header asks
+            circuit_breaker: Optional per-host circuit breaker
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_time = max_retry_time
+        self.respect_retry_after = respect_retry_after
+        self.circuit_breaker = circuit_breaker
+
+    def is_retryable_response(self, response: httpx.Response) -> bool:
+        """Return True if ``response`` should be retried"""
+        return response.status_code in self.retry_statuses
+
+    def is_retryable_exception(self, exc: BaseException) -> bool:
+        """Return True if ``exc`` should be retried"""
+        return isinstance(exc, self.retry_exceptions)
+
+    def backoff(self, retry_number: int) -> float:
+        """Full-jitter exponential backoff for the given retry (0-based)"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** retry_number))
+        return random.uniform(0, ceiling)
+
+    def start(self) -> "RetryState":
+        """Begin tracking retries for one logical request"""
+        return RetryState(self)
+
+
+class RetryState:
+    """Attempt counter and time budget for a single logical request"""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempts = 0
+        self.started_at = time.monotonic()
+
+    def next_delay(self, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """
+        Record a failed attempt and return how long to wait before retrying
+
+        Returns:
+            Delay in seconds, or None if the request should not be retried
+        """
+        policy = self.policy
+        self.attempts += 1
+        if self.attempts >= policy.max_attempts:
+            return None
+
+        delay = policy.backoff(self.attempts - 1)
+        if response is not None and policy.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+        if policy.max_retry_time is not None:
+            elapsed = time.monotonic() - self.started_at
+            if elapsed + delay > policy.max_retry_time:
+                return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
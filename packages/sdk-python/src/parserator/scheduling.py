@@ -0,0 +1,78 @@
+"""
+Per-call priorities and deadlines
+
+Every parse call carries a :class:`Ticket`. When the client's in-flight
+limiters are saturated, higher-priority tickets are admitted first.
+Tickets whose deadline passes while queued are dropped before anything is
+sent, and the call returns a ``DEADLINE_EXCEEDED`` error. The time left is
+sent to the API in the ``X-Parserator-Deadline-Ms`` header, so the server
+can abandon work nobody is waiting for.
+"""
+
+import time
+from typing import Dict, Optional
+
+DEADLINE_HEADER = "X-Parserator-Deadline-Ms"
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a call's deadline passes before its request is sent"""
+
+
+class Ticket:
+    """Priority and absolute deadline of one parse call"""
+
+    __slots__ = ("priority", "expires_at")
+
+    def __init__(self, priority: int = 0, expires_at: Optional[float] = None):
+        """
+        Initialize ticket
+
+        Args:
+            priority: Larger values are admitted first
+            expires_at: ``time.monotonic()`` value after which the call is
+                abandoned, or None for no deadline
+        """
+        self.priority = priority
+        self.expires_at = expires_at
+
+    @classmethod
+    def start(cls, priority: int = 0, deadline: Optional[float] = None) -> "Ticket":
+        """Create a ticket whose deadline is ``deadline`` seconds from now"""
+        return cls(priority, time.monotonic() + deadline if deadline is not None else None)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (negative once passed), or None"""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def outlasts(self, seconds: float) -> bool:
+        """Return True if the deadline is more than ``seconds`` away (or unset)"""
+        remaining = self.remaining()
+        return remaining is None or remaining > seconds
+
+    def check(self) -> None:
+        """
+        Raise if the deadline has passed
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded by {-remaining * 1000:.0f}ms before sending")
+
+    def headers(self) -> Dict[str, str]:
+        """Return the deadline header for a request sent now"""
+        remaining = self.remaining()
+        if remaining is None:
+            return {}
+        return {DEADLINE_HEADER: str(max(0, int(remaining * 1000)))}
+
+    def __repr__(self) -> str:
+        return f"Ticket(priority={self.priority!r}, remaining={self.remaining()!r})"
+
+
+# Shared ticket for calls without a priority or deadline
+DEFAULT_TICKET = Ticket()
@@ -0,0 +1,169 @@
+"""
+Compiled output schemas and the client-side schema registry
+
+:func:`compile_schema` canonicalizes an output schema once (sorted fields,
+lower-cased type names), checks every type against :data:`SUPPORTED_TYPES`
+before any request is made, and fingerprints the result. A
+:class:`CompiledSchema` can be passed anywhere a schema dict is accepted.
+Once a schema is registered with the server (``client.register_schema``),
+requests send only its reference instead of the full schema.
+"""
+
+import json
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+from .cache import schema_fingerprint
+
+SUPPORTED_TYPES = (
+    "string",
+    "number",
+    "boolean",
+    "array",
+    "object",
+    "date",
+    "email",
+    "phone",
+    "url",
+)
+
+
+class SchemaError(ValueError):
+    """Raised when an output schema fails local validation"""
+
+    def __init__(self, problems: List[str]):
+        super().__init__("Invalid output schema: " + "; ".join(problems))
+        self.problems = problems
+
+
+class CompiledSchema:
+    """
+    Canonical, validated and fingerprinted output schema
+
+    Instances are immutable; ``fields`` is shared between every request
+    that uses the schema, so do not modify it.
+    """
+
+    __slots__ = ("fields", "fingerprint", "_json")
+
+    def __init__(self, fields: Dict[str, str]):
+        self.fields = fields
+        self.fingerprint = schema_fingerprint(fields)
+        self._json: Optional[str] = None
+
+    @property
+    def canonical_json(self) -> str:
+        """Compact, key-sorted JSON form the fingerprint is computed over"""
+        if self._json is None:
+            self._json = json.dumps(self.fields, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return self._json
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompiledSchema) and other.fingerprint == self.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __repr__(self) -> str:
+        return f"CompiledSchema({self.fingerprint}, fields={list(self.fields)!r})"
+
+
+SchemaLike = Union[Mapping[str, str], CompiledSchema]
+
+
+def schema_fields(output_schema: SchemaLike) -> Dict[str, str]:
+    """Return the field mapping of a schema dict or compiled schema"""
+    if isinstance(output_schema, CompiledSchema):
+        return output_schema.fields
+    return dict(output_schema)
+
+
+def compile_schema(output_schema: SchemaLike) -> CompiledSchema:
+    """
+    Validate and canonicalize an output schema
+
+    Args:
+        output_schema: Mapping of field name to type name, or an already
+            compiled schema (returned unchanged)
+
+    Returns:
+        The compiled schema
+
+    Raises:
+        SchemaError: If the schema is empty, has non-string field names or
+            uses an unsupported type
+    """
+    if isinstance(output_schema, CompiledSchema):
+        return output_schema
+    if not isinstance(output_schema, Mapping) or not output_schema:
+        raise SchemaError(["schema must be a non-empty mapping of field name to type"])
+
+    problems = []
+    fields = {}
+    for name in sorted(output_schema, key=str):
+        kind = output_schema[name]
+        if not isinstance(name, str) or not name.strip():
+            problems.append(f"field name {name!r} must be a non-empty string")
+            continue
+        if not isinstance(kind, str) or kind.strip().lower() not in SUPPORTED_TYPES:
+            problems.append(
+                f"field {name!r} has unsupported type {kind!r} "
+                f"(expected one of {', '.join(SUPPORTED_TYPES)})"
+            )
+            continue
+        fields[name] = kind.strip().lower()
+
+    if problems:
+        raise SchemaError(problems)
+    return CompiledSchema(fields)
+
+
+class SchemaRegistry:
+    """
+    Thread-safe store of compiled schemas and their server references
+
+    Each client owns one registry; server references are only valid for
+    the API the client talks to.
+    """
+
+    def __init__(self):
+        self._compiled: Dict[str, CompiledSchema] = {}
+        self._refs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return fingerprint in self._compiled
+
+    def compile(self, output_schema: SchemaLike) -> CompiledSchema:
+        """Compile ``output_schema``, returning the shared instance if already known"""
+        compiled = compile_schema(output_schema)
+        with self._lock:
+            return self._compiled.setdefault(compiled.fingerprint, compiled)
+
+    def get(self, fingerprint: str) -> Optional[CompiledSchema]:
+        """Return the compiled schema with ``fingerprint``, if known"""
+        return self._compiled.get(fingerprint)
+
+    def server_ref(self, fingerprint: str) -> Optional[str]:
+        """Return the server reference for a registered schema, or None"""
+        return self._refs.get(fingerprint)
+
+    def mark_registered(self, compiled: CompiledSchema, ref: str) -> None:
+        """Record that the server knows ``compiled`` as ``ref``"""
+        with self._lock:
+            self._compiled.setdefault(compiled.fingerprint, compiled)
+            self._refs[compiled.fingerprint] = ref
+
+    def forget_ref(self, ref: str) -> None:
+        """Drop a server reference the server no longer recognizes"""
+        with self._lock:
+            for fingerprint, known in list(self._refs.items()):
+                if known == ref:
+                    del self._refs[fingerprint]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return compiled and registered schema counts"""
+        return {"compiled": len(self._compiled), "registered": len(self._refs)}
@@ -0,0 +1,310 @@
+"""
+Near-duplicate input index
+
+Much parse traffic is near-identical text: the same email template with a
+different name, or invoices from one vendor. An exact cache misses all of
+it. :class:`SimilarityIndex` splits each input into word shingles, MinHashes
+them into a fixed-size signature and files the signature under
+locality-sensitive hashing (LSH) bands. Inputs whose Jaccard similarity is
+above ``threshold`` then share at least one band bucket with high
+probability, so a lookup probes a handful of buckets instead of scanning
+the index and costs the same with ten entries or ten million.
+
+Signatures are stored back to back in one ``array`` of 32-bit values, and
+the index is bounded by least-recently-used eviction. MinHashing uses numpy
+when it is installed and pure Python otherwise; both give the same
+signatures. numpy is imported when the first index is built, not when this
+module is.
+"""
+
+import random
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import eq
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .cache import CacheStats
+
+_PRIME = (1 << 61) - 1
+_MASK64 = (1 << 64) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN = re.compile(r"\w+")
+
+# Fixed so every index draws the same permutations
+_SEED = 0x5EED
+
+
+def shingles(text: str, size: int = 3) -> List[int]:
+    """
+    Return the distinct 32-bit hashes of the word ``size``-grams of ``text``
+
+    Words are lowercased runs of letters and digits, so punctuation and
+    whitespace changes do not matter. Texts shorter than ``size`` words
+    become a single shingle. Hashes use Python's string hashing, so they
+    (and signatures) are only comparable within one process.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) <= size:
+        return [hash(tuple(tokens)) & _MAX_HASH]
+    return [value & _MAX_HASH for value in set(map(hash, zip(*(tokens[i:] for i in range(size)))))]
+
+
+def lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose ``(bands, rows)`` with ``bands * rows == num_perm`` for a threshold
+
+    Picks the most selective banding whose S-curve midpoint
+    ``(1 / bands) ** (1 / rows)`` does not exceed ``threshold``, so inputs
+    at the threshold are still likely to become candidates.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0 and (rows / num_perm) ** (1 / rows) <= threshold:
+            best = (num_perm // rows, rows)
+    return best
+
+
+@dataclass
+class SimilarityStats(CacheStats):
+    """Similarity index counters; ``candidates`` counts signatures compared"""
+    candidates: int = 0
+    inserts: int = 0
+
+
+@dataclass
+class SimilarityMatch:
+    """Stored value of a similar earlier input"""
+    similarity: float
+    value: Any
+
+
+class SimilarityIndex:
+    """
+    Thread-safe MinHash/LSH index of earlier inputs, partitioned by schema
+
+    Values are whatever the caller stores, typically a parse result or an
+    Architect plan. A match is a candidate to reuse or verify, not a
+    guarantee: estimated similarity has an error of about
+    ``1 / sqrt(num_perm)``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        max_entries: int = 100_000,
+        shingle_size: int = 3,
+        max_candidates: int = 32,
+        min_confidence: float = 0.8
+    ):
+        """
+        Initialize similarity index
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of a match
+            num_perm: MinHash permutations per signature; more is more
+                accurate and costs 4 bytes per entry each
+            max_entries: Entries kept before evicting the least recently
+                used one
+            shingle_size: Words per shingle
+            max_candidates: Most recent bucket entries compared per
+                lookup, which bounds lookup time when many stored inputs
+                share buckets
+            min_confidence: A client only indexes results whose confidence
+                reaches this value
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if num_perm < 1 or max_entries < 1:
+            raise ValueError("num_perm and max_entries must be at least 1")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.max_entries = max_entries
+        self.shingle_size = shingle_size
+        self.max_candidates = max_candidates
+        self.min_confidence = min_confidence
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+        self.stats = SimilarityStats()
+
+        generator = random.Random(_SEED)
+        self._a = [generator.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [generator.randrange(0, _PRIME) for _ in range(num_perm)]
+        # Imported here so that importing the SDK does not pay for numpy
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - optional speedup
+            numpy = None  # type: ignore[assignment]
+        self._numpy = numpy
+        if numpy is not None:
+            self._a_np = numpy.array(self._a, dtype=numpy.uint64)[:, None]
+            self._b_np = numpy.array(self._b, dtype=numpy.uint64)[:, None]
+
+        self._signatures = array("I")
+        self._schemas: List[Optional[str]] = []
+        self._values: List[Any] = []
+        self._free: List[int] = []
+        self._order: "OrderedDict[int, None]" = OrderedDict()
+        self._buckets: List[Dict[int, Union[int, List[int]]]] = [{} for _ in range(self.bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def signature(self, text: str) -> array:
+        """Return the MinHash signature of ``text``"""
+        hashes = shingles(text, self.shingle_size)
+        numpy = self._numpy
+        if numpy is not None:
+            x = numpy.array(hashes, dtype=numpy.uint64)
+            with numpy.errstate(over="ignore"):
+                values = (self._a_np * x + self._b_np) % numpy.uint64(_PRIME) & numpy.uint64(_MAX_HASH)
+            return array("I", values.min(axis=1).tolist())
+        return array("I", [
+            min((((a * x + b) & _MASK64) % _PRIME) & _MAX_HASH for x in hashes)
+            for a, b in zip(self._a, self._b)
+        ])
+
+    def lookup(self, schema: str, text: str, signature: Optional[array] = None) -> Optional[SimilarityMatch]:
+        """
+        Return the most similar earlier input for ``schema``, if any
+
+        Args:
+            schema: Partition key, usually the schema fingerprint
+            text: Input to look up
+            signature: Precomputed :meth:`signature` of ``text``
+
+        Returns:
+            The best match at or above ``threshold``, or None
+        """
+        if signature is None:
+            signature = self.signature(text)
+        with self._lock:
+            slot, similarity = self._best_locked(schema, signature)
+            if slot is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self._order.move_to_end(slot)
+            value = self._values[slot]
+        return SimilarityMatch(similarity, value)
+
+    def add(self, schema: str, text: str, value: Any, signature: Optional[array] = None) -> None:
+        """
+        Store ``value`` for ``text`` under ``schema``
+
+        An entry with an identical signature is updated in place rather
+        than duplicated, so repetitive traffic does not fill the index.
+        """
+        if signature is None:
+            signature = self.signature(text)
+        with self._lock:
+            slot, similarity = self._best_locked(schema, signature)
+            if slot is not None and similarity == 1.0:
+                self._values[slot] = value
+                self._order.move_to_end(slot)
+                return
+
+            # Evict first so the freed slot is reused and storage stays bounded
+            while len(self._order) >= self.max_entries:
+                self._remove_locked(next(iter(self._order)))
+                self.stats.evictions += 1
+
+            if self._free:
+                slot = self._free.pop()
+                offset = slot * self.num_perm
+                self._signatures[offset:offset + self.num_perm] = signature
+                self._schemas[slot] = schema
+                self._values[slot] = value
+            else:
+                slot = len(self._values)
+                self._signatures.extend(signature)
+                self._schemas.append(schema)
+                self._values.append(value)
+
+            for bucket, key in zip(self._buckets, self._band_keys(schema, signature)):
+                entry = bucket.get(key)
+                if entry is None:
+                    bucket[key] = slot
+                elif isinstance(entry, list):
+                    entry.append(slot)
+                else:
+                    bucket[key] = [entry, slot]
+            self._order[slot] = None
+            self.stats.inserts += 1
+
+    def clear(self) -> None:
+        """Remove every entry and release the signature storage"""
+        with self._lock:
+            self._signatures = array("I")
+            self._schemas.clear()
+            self._values.clear()
+            self._free.clear()
+            self._order.clear()
+            for bucket in self._buckets:
+                bucket.clear()
+
+    def _band_keys(self, schema: str, signature: array, offset: int = 0) -> List[int]:
+        rows = self.rows
+        return [
+            hash((schema, signature[start:start + rows].tobytes()))
+            for start in range(offset, offset + self.num_perm, rows)
+        ]
+
+    def _best_locked(self, schema: str, signature: array) -> Tuple[Optional[int], float]:
+        limit = self.max_candidates
+        candidates: List[int] = []
+        seen = set()
+        for bucket, key in zip(self._buckets, self._band_keys(schema, signature)):
+            entry = bucket.get(key)
+            if entry is None:
+                continue
+            # Newest entries are last; under the candidate cap they win
+            for slot in reversed(entry) if isinstance(entry, list) else (entry,):
+                if slot not in seen and self._schemas[slot] == schema:
+                    seen.add(slot)
+                    candidates.append(slot)
+                    if len(candidates) >= limit:
+                        break
+            if len(candidates) >= limit:
+                break
+        self.stats.candidates += len(candidates)
+        if not candidates:
+            return None, 0.0
+
+        scores = self._similarities(signature, candidates)
+        best = max(range(len(candidates)), key=scores.__getitem__)
+        if scores[best] < self.threshold:
+            return None, scores[best]
+        return candidates[best], scores[best]
+
+    def _similarities(self, signature: array, slots: List[int]) -> List[float]:
+        """Estimated Jaccard similarity of ``signature`` to each stored slot"""
+        num_perm = self.num_perm
+        numpy = self._numpy
+        if numpy is not None:
+            stored = numpy.frombuffer(self._signatures, dtype=numpy.uint32).reshape(-1, num_perm)
+            query = numpy.frombuffer(signature, dtype=numpy.uint32)
+            return ((stored[slots] == query).sum(axis=1) / num_perm).tolist()
+        stored = self._signatures
+        return [
+            sum(map(eq, signature, stored[slot * num_perm:(slot + 1) * num_perm])) / num_perm
+            for slot in slots
+        ]
+
+    def _remove_locked(self, slot: int) -> None:
+        schema = self._schemas[slot]
+        for bucket, key in zip(self._buckets, self._band_keys(schema, self._signatures, slot * self.num_perm)):
+            entry = bucket.get(key)
+            if isinstance(entry, list):
+                entry.remove(slot)
+                if len(entry) == 1:
+                    bucket[key] = entry[0]
+            elif entry == slot:
+                del bucket[key]
+        self._schemas[slot] = None
+        self._values[slot] = None
+        self._free.append(slot)
+        del self._order[slot]
@@ -0,0 +1,102 @@
+"""
+In-flight request coalescing (single-flight) for identical parse calls
+"""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A call in flight that followers wait on"""
+
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one execution
+
+    The first caller for a key (the leader) runs the function; callers
+    arriving while it is in flight block and receive a deep copy of the
+    leader's result (or its exception). When anyone joined, the leader gets
+    a copy too, so no caller can mutate the object the others copy from.
+    Nothing is remembered once the call
+    finishes, so this complements rather than replaces a result cache.
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call for ``key`` is already in flight"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        # No one can join once the key is gone, so the count is final
+        return copy.deepcopy(call.result) if call.followers else call.result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of :class:`SingleFlight`
+
+    Followers await the leader's task; cancelling a follower does not
+    cancel the shared request.
+    """
+
+    def __init__(self):
+        # key -> (task, [number of followers])
+        self._calls: Dict[str, Tuple["asyncio.Future[Any]", List[int]]] = {}
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` unless a call for ``key`` is already in flight"""
+        call = self._calls.get(key)
+        if call is not None:
+            task, followers = call
+            self.coalesced += 1
+            followers[0] += 1
+            result = await asyncio.shield(task)
+            return copy.deepcopy(result)
+
+        task = asyncio.ensure_future(fn())
+        followers = [0]
+        self._calls[key] = (task, followers)
+        task.add_done_callback(lambda _: self._calls.pop(key, None))
+        result = await asyncio.shield(task)
+        # Followers resume after the leader and copy from the shared result
+        return copy.deepcopy(result) if followers[0] else result
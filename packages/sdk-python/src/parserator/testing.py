@@ -0,0 +1,194 @@
+"""
+Local stand-in for the Parserator API, for tests and benchmarks
+
+:class:`StubAPI` answers ``/v1/parse`` and ``/health`` with configurable
+latency, error rate and response size. It can be plugged into a client as
+an httpx mock transport (no sockets) or served over real HTTP on
+localhost when connection costs should be part of the measurement.
+"""
+
+import asyncio
+import gzip
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+
+def _decode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    """Undo request compression applied by the client"""
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    return body
+
+
+class StubAPI:
+    """
+    Configurable fake ``/v1/parse`` backend
+
+    Responses fill every schema field with a value derived from the input,
+    padded to ``response_bytes`` so response decoding cost can be varied.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        response_bytes: int = 0,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize stub API
+
+        Args:
+            latency: Base server latency in seconds
+            jitter: Extra uniformly distributed latency in seconds
+            error_rate: Fraction of parse requests answered with an error
+            error_status: HTTP status used for injected errors
+            response_bytes: Approximate size to pad each parsed value to
+            seed: Optional random seed for reproducible runs
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.response_bytes = response_bytes
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _plan(self) -> Tuple[float, bool]:
+        """Pick this request's delay and whether it fails"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0.0)
+            failed = self._random.random() < self.error_rate
+        return delay, failed
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        failed: bool,
+        encoding: Optional[str] = None
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Build the status code and JSON body for a request"""
+        if method == "GET" and path == "/health":
+            return 200, {"status": "healthy", "message": "Parserator API stub"}
+        if path != "/v1/parse":
+            return 404, {"error": "Not found"}
+        if failed:
+            return self.error_status, {
+                "success": False,
+                "error": {"code": "STUB_ERROR", "message": "Injected failure"}
+            }
+
+        payload = json.loads(_decode_body(body, encoding))
+        input_data = payload.get("inputData", "")
+        padding = "x" * self.response_bytes
+        parsed = {field: f"{input_data[:32]}{padding}" for field in payload.get("outputSchema", {})}
+        return 200, {
+            "success": True,
+            "parsedData": parsed,
+            "metadata": {
+                "confidence": 0.9,
+                "processingTimeMs": 0,
+                "tokensUsed": len(input_data) // 4,
+                "requestId": f"req_stub_{self.requests}",
+                "timestamp": "1970-01-01T00:00:00Z",
+                "version": "stub",
+                "features": ["structured-outputs"]
+            }
+        }
+
+    def transport(self) -> httpx.MockTransport:
+        """Sync httpx transport backed by this stub"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            delay, failed = self._plan()
+            if delay:
+                time.sleep(delay)
+            status, body = self.respond(
+                request.method, request.url.path, request.read(), failed,
+                request.headers.get("Content-Encoding")
+            )
+            return httpx.Response(status, json=body)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Async httpx transport backed by this stub"""
+        async def handler(request: httpx.Request) -> httpx.Response:
+            delay, failed = self._plan()
+            if delay:
+                await asyncio.sleep(delay)
+            status, body = self.respond(
+                request.method, request.url.path, await request.aread(), failed,
+                request.headers.get("Content-Encoding")
+            )
+            return httpx.Response(status, json=body)
+
+        return httpx.MockTransport(handler)
+
+    @contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """
+        Serve the stub over HTTP/1.1 on localhost
+
+        Yields:
+            The server's base URL
+        """
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without this the
+            # client's delayed ACK adds ~40 ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                delay, failed = stub._plan()
+                if delay:
+                    time.sleep(delay)
+                status, reply = stub.respond(
+                    self.command, self.path, body, failed,
+                    self.headers.get("Content-Encoding")
+                )
+                data = json.dumps(reply).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _handle
+            do_POST = _handle
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
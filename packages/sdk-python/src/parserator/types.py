@@ -1,52 +1,34 @@
 """
 Type definitions for Parserator Python SDK
+
+The pydantic models live in :mod:`parserator.models` and are loaded on first
+attribute access, so importing this module does not import pydantic.
 """
 
-from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel
-
-
-class ParseRequest(BaseModel):
-    """Request model for parsing operations"""
-    input_data: str
-    output_schema: Dict[str, str]
-    confidence_threshold: Optional[float] = None
-    options: Optional[Dict[str, Any]] = None
-
-
-class ErrorRecovery(BaseModel):
-    """Error recovery suggestions"""
-    suggestions: List[Dict[str, Any]]
-    suggested_schema: Optional[Dict[str, Any]] = None
-    suggested_input: Optional[str] = None
-    auto_retry_recommended: bool = False
-    explanation: str
-
-
-class ParseMetadata(BaseModel):
-    """Metadata from parsing operation"""
-    confidence: float
-    processing_time_ms: int
-    tokens_used: int
-    request_id: str
-    timestamp: str
-    version: str
-    features: List[str]
-    architect_plan: Optional[Dict[str, Any]] = None
-
-
-class ParseResponse(BaseModel):
-    """Response model for parsing operations"""
-    success: bool
-    parsed_data: Optional[Dict[str, Any]] = None
-    error: Optional[Dict[str, Any]] = None
-    metadata: Optional[ParseMetadata] = None
-    recovery: Optional[ErrorRecovery] = None
-
-
-class HealthResponse(BaseModel):
-    """Health check response"""
-    status: str
-    message: str
-    timestamp: str
-    version: str
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+_MODELS = (
+    "ParseRequest",
+    "ErrorRecovery",
+    "ParseMetadata",
+    "ParseResponse",
+    "HealthResponse",
+)
+
+__all__ = list(_MODELS)
+
+if TYPE_CHECKING:
+    from .models import ErrorRecovery, HealthResponse, ParseMetadata, ParseRequest, ParseResponse
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".models", __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
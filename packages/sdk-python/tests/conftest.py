@@ -0,0 +1,76 @@
+"""
+Shared fixtures for offline Parserator SDK tests
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+
+def fake_parse_response(request: httpx.Request) -> httpx.Response:
+    """Answer a /v1/parse request by echoing the schema fields back"""
+    if request.url.path == "/health":
+        return httpx.Response(200, json={"status": "healthy", "message": "Parserator API"})
+
+    payload = json.loads(request.content)
+    parsed = {field: f"{field}:{payload['inputData']}" for field in payload["outputSchema"]}
+    return httpx.Response(200, json={
+        "success": True,
+        "parsedData": parsed,
+        "metadata": {
+            "confidence": 0.9,
+            "processingTimeMs": 5,
+            "tokensUsed": 10,
+            "requestId": "req_test",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "version": "2.0.0",
+            "features": ["structured-outputs"]
+        }
+    })
+
+
+@pytest.fixture
+def mock_transport():
+    """Sync transport answering requests with fake_parse_response"""
+    return httpx.MockTransport(fake_parse_response)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive HTTP/1.1 stand-in for the Parserator API"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, body):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._reply({"status": "healthy", "message": "Parserator API"})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply({
+            "success": True,
+            "parsedData": {},
+            "metadata": {"processingTimeMs": 3, "tokensUsed": 42}
+        })
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Base URL of a StubHandler server running in a background thread"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
@@ -0,0 +1,67 @@
+"""
+Offline tests for AsyncParserator
+"""
+
+import asyncio
+
+import httpx
+
+from parserator import AsyncParserator
+
+from conftest import fake_parse_response
+
+
+def test_parse_returns_api_result():
+    async def main():
+        transport = httpx.MockTransport(fake_parse_response)
+        async with AsyncParserator(transport=transport) as client:
+            return await client.parse("Jane", {"name": "string"})
+
+    result = asyncio.run(main())
+    assert result["success"] is True
+    assert result["parsedData"] == {"name": "name:Jane"}
+
+
+def test_in_flight_requests_are_bounded():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return fake_parse_response(request)
+
+    async def main():
+        transport = httpx.MockTransport(handler)
+        async with AsyncParserator(max_concurrency=5, transport=transport) as client:
+            return await asyncio.gather(
+                *(client.parse(str(i), {"name": "string"}) for i in range(50))
+            )
+
+    results = asyncio.run(main())
+    assert all(r["success"] for r in results)
+    assert peak == 5
+
+
+def test_http_errors_become_error_dicts():
+    async def main():
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        async with AsyncParserator(transport=transport) as client:
+            return await client.parse("Jane", {"name": "string"})
+
+    result = asyncio.run(main())
+    assert result["success"] is False
+    assert result["error"]["code"] == "HTTP_ERROR"
+
+
+def test_parse_file_reports_missing_file(tmp_path):
+    async def main():
+        transport = httpx.MockTransport(fake_parse_response)
+        async with AsyncParserator(transport=transport) as client:
+            return await client.parse_file(str(tmp_path / "missing.txt"), {"name": "string"})
+
+    result = asyncio.run(main())
+    assert result["error"]["code"] == "FILE_ERROR"
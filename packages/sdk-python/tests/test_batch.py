@@ -0,0 +1,72 @@
+"""
+Offline tests for the parse_many batch API
+"""
+
+import asyncio
+import itertools
+import random
+import time
+
+import httpx
+
+from parserator import AsyncParserator, Parserator
+
+from conftest import fake_parse_response
+
+
+def slow_handler(request):
+    time.sleep(random.random() * 0.01)
+    return fake_parse_response(request)
+
+
+def test_parse_many_preserves_input_order():
+    client = Parserator(transport=httpx.MockTransport(slow_handler))
+    results = list(client.parse_many((str(i) for i in range(40)), {"n": "string"}, concurrency=8))
+
+    assert [index for index, _ in results] == list(range(40))
+    assert [r["parsedData"]["n"] for _, r in results] == [f"n:{i}" for i in range(40)]
+
+
+def test_parse_many_completion_order_covers_all_items():
+    client = Parserator(transport=httpx.MockTransport(slow_handler))
+    results = dict(client.parse_many(map(str, range(40)), {"n": "string"}, ordered=False))
+
+    assert sorted(results) == list(range(40))
+    assert results[7]["parsedData"]["n"] == "n:7"
+
+
+def test_parse_many_consumes_input_lazily():
+    client = Parserator(transport=httpx.MockTransport(fake_parse_response))
+    pulled = itertools.count()
+    inputs = (str(next(pulled)) for _ in itertools.repeat(None))
+
+    results = client.parse_many(inputs, {"n": "string"}, concurrency=4)
+    first = [next(results) for _ in range(3)]
+    results.close()
+
+    assert [index for index, _ in first] == [0, 1, 2]
+    assert next(pulled) <= 3 + 4 * 2 + 1
+
+
+def test_parse_many_reports_failures_per_item():
+    def handler(request):
+        if b'"inputData":"2"' in request.content.replace(b" ", b""):
+            return httpx.Response(500)
+        return fake_parse_response(request)
+
+    client = Parserator(transport=httpx.MockTransport(handler))
+    results = [r for _, r in client.parse_many(map(str, range(5)), {"n": "string"})]
+
+    assert [r["success"] for r in results] == [True, True, False, True, True]
+    assert results[2]["error"]["code"] == "HTTP_ERROR"
+
+
+def test_async_parse_many_yields_all_results():
+    async def main():
+        transport = httpx.MockTransport(fake_parse_response)
+        async with AsyncParserator(max_concurrency=4, transport=transport) as client:
+            return [item async for item in client.parse_many(map(str, range(20)), {"n": "string"})]
+
+    results = asyncio.run(main())
+    assert [index for index, _ in results] == list(range(20))
+    assert all(r["success"] for _, r in results)
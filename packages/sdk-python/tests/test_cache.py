@@ -0,0 +1,87 @@
+"""
+Offline tests for client-side result caching
+"""
+
+import time
+
+import httpx
+
+from parserator import MemoryCache, Parserator, SQLiteCache
+from parserator.cache import make_cache_key
+
+from conftest import fake_parse_response
+
+
+def counting_transport():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return fake_parse_response(request)
+
+    return httpx.MockTransport(handler), calls
+
+
+def test_cache_key_ignores_schema_key_order():
+    a = make_cache_key("x", {"a": "string", "b": "number"}, 0.8, {"k": 1})
+    b = make_cache_key("x", {"b": "number", "a": "string"}, 0.8, {"k": 1})
+    assert a == b
+    assert a != make_cache_key("x", {"a": "string", "b": "number"}, 0.9, {"k": 1})
+
+
+def test_repeat_parse_is_served_from_cache():
+    transport, calls = counting_transport()
+    cache = MemoryCache()
+    client = Parserator(transport=transport, cache=cache)
+
+    first = client.parse("Jane", {"name": "string"})
+    second = client.parse("Jane", {"name": "string"})
+
+    assert first == second
+    assert len(calls) == 1
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+
+def test_failed_results_are_not_cached():
+    cache = MemoryCache()
+    client = Parserator(transport=httpx.MockTransport(lambda r: httpx.Response(500)), cache=cache)
+
+    client.parse("Jane", {"name": "string"})
+
+    assert len(cache) == 0
+
+
+def test_memory_cache_evicts_lru_and_expires():
+    cache = MemoryCache(max_entries=2, ttl=0.05)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.stats.evictions == 1
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "results.db"
+    transport, calls = counting_transport()
+
+    Parserator(transport=transport, cache=SQLiteCache(path)).parse("Jane", {"name": "string"})
+    result = Parserator(transport=transport, cache=SQLiteCache(path)).parse("Jane", {"name": "string"})
+
+    assert result["parsedData"] == {"name": "name:Jane"}
+    assert len(calls) == 1
+
+
+def test_sqlite_cache_bounds_entries(tmp_path):
+    cache = SQLiteCache(tmp_path / "results.db", max_entries=2)
+    for key in "abc":
+        cache.set(key, {"v": key})
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"v": "c"}
+    assert cache.stats.evictions == 1
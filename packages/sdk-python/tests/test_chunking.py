@@ -0,0 +1,103 @@
+"""
+Offline tests for chunked file parsing
+"""
+
+import asyncio
+import io
+import threading
+
+import httpx
+import pytest
+
+from parserator import AsyncParserator, Parserator
+from parserator.chunking import iter_chunks
+
+from conftest import fake_parse_response
+
+
+def chunks(text, **kwargs):
+    return list(iter_chunks(io.StringIO(text), **kwargs))
+
+
+def test_line_strategy_skips_blank_lines():
+    assert chunks("a\n\nb\r\nc") == ["a", "b", "c"]
+
+
+def test_delimiter_strategy_splits_records_across_blocks(monkeypatch):
+    monkeypatch.setattr("parserator.chunking.READ_BLOCK_SIZE", 3)
+    assert chunks("one---two---three", strategy="delimiter", delimiter="---") == ["one", "two", "three"]
+
+
+def test_window_strategy_overlaps():
+    assert chunks("abcdefghij", strategy="window", chunk_size=4, overlap=1) == ["abcd", "defg", "ghij"]
+    assert chunks("abcdefghij", strategy="window", chunk_size=4) == ["abcd", "efgh", "ij"]
+
+
+def test_csv_strategy_renders_rows():
+    assert chunks("name,email\nJane,j@x.com\n", strategy="csv") == ["name: Jane\nemail: j@x.com"]
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        chunks("a", strategy="pages")
+
+
+def test_parse_file_stream_yields_result_per_record(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(f"record {i}" for i in range(25)))
+    client = Parserator(transport=httpx.MockTransport(fake_parse_response))
+
+    results = list(client.parse_file_stream(str(path), {"text": "string"}, concurrency=4))
+
+    assert [index for index, _ in results] == list(range(25))
+    assert results[3][1]["parsedData"] == {"text": "text:record 3"}
+
+
+def test_parse_file_stream_reports_missing_file(tmp_path):
+    client = Parserator(transport=httpx.MockTransport(fake_parse_response))
+    results = list(client.parse_file_stream(str(tmp_path / "missing"), {"text": "string"}))
+
+    assert results[0][1]["error"]["code"] == "FILE_ERROR"
+
+
+def test_parse_file_stream_rejects_bad_options_before_opening(tmp_path, monkeypatch):
+    opened = []
+    monkeypatch.setattr("parserator.client.open", lambda *args, **kwargs: opened.append(args), raising=False)
+    client = Parserator(transport=httpx.MockTransport(fake_parse_response))
+
+    with pytest.raises(ValueError):
+        client.parse_file_stream(str(tmp_path / "records.txt"), {"text": "string"}, strategy="pages")
+    assert opened == []
+
+
+def test_async_parse_file_stream(tmp_path):
+    path = tmp_path / "records.txt"
+    path.write_text("a\nb\nc\n")
+
+    async def main():
+        transport = httpx.MockTransport(fake_parse_response)
+        async with AsyncParserator(transport=transport) as client:
+            return [r async for r in client.parse_file_stream(str(path), {"text": "string"})]
+
+    assert [r["parsedData"]["text"] for _, r in asyncio.run(main())] == ["text:a", "text:b", "text:c"]
+
+
+def test_async_parse_file_stream_reads_off_the_event_loop(tmp_path, monkeypatch):
+    path = tmp_path / "records.txt"
+    path.write_text("a\nb\nc\n")
+    readers = set()
+
+    def recording_chunks(f, *args):
+        for chunk in iter_chunks(f, *args):
+            readers.add(threading.get_ident())
+            yield chunk
+
+    monkeypatch.setattr("parserator.client.iter_chunks", recording_chunks)
+
+    async def main():
+        transport = httpx.MockTransport(fake_parse_response)
+        async with AsyncParserator(transport=transport) as client:
+            return [r async for r in client.parse_file_stream(str(path), {"text": "string"})]
+
+    assert len(asyncio.run(main())) == 3
+    assert readers and threading.get_ident() not in readers
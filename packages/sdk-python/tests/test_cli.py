@@ -0,0 +1,114 @@
+"""
+Offline tests for the parserator command-line interface
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from parserator.cli import iter_records, main
+from parserator.testing import StubAPI
+
+SCHEMA = '{"name": "string"}'
+
+
+@pytest.fixture
+def stub_url():
+    with StubAPI().serve() as url:
+        yield url
+
+
+def output_lines(captured):
+    return [json.loads(line) for line in captured.out.splitlines()]
+
+
+def test_lines_from_files_in_order(tmp_path, stub_url, capsysbinary):
+    path = tmp_path / "in.txt"
+    path.write_text("alice\n\nbob\ncarol\n", encoding="utf-8")
+
+    status = main(["--schema", SCHEMA, "--base-url", stub_url, "--retries", "0", str(path)])
+
+    lines = output_lines(capsysbinary.readouterr())
+    assert status == 0
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert [line["result"]["parsedData"]["name"] for line in lines] == ["alice", "bob", "carol"]
+
+
+def test_schema_file_cache_and_unordered(tmp_path, stub_url, capsysbinary):
+    schema = tmp_path / "schema.json"
+    schema.write_text(SCHEMA, encoding="utf-8")
+    path = tmp_path / "in.txt"
+    path.write_text("same\nsame\nother\n", encoding="utf-8")
+
+    status = main([
+        "-s", str(schema), "--base-url", stub_url, "--cache", "memory",
+        "--unordered", "-c", "1", str(path)
+    ])
+
+    lines = output_lines(capsysbinary.readouterr())
+    assert status == 0
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+
+
+def test_failures_set_exit_status(tmp_path, capsysbinary):
+    path = tmp_path / "in.txt"
+    path.write_text("alice\n", encoding="utf-8")
+
+    with StubAPI(error_rate=1.0).serve() as url:
+        status = main(["--schema", SCHEMA, "--base-url", url, "--retries", "0", str(path)])
+
+    lines = output_lines(capsysbinary.readouterr())
+    assert status == 1
+    assert lines[0]["result"]["success"] is False
+
+
+def test_jsonl_and_csv_records(tmp_path):
+    jsonl = tmp_path / "in.jsonl"
+    jsonl.write_text('{"text": "first"}\n"second"\n{"text": {"nested": 1}}\n', encoding="utf-8")
+    rows = tmp_path / "in.csv"
+    rows.write_text("name,city\nAda,London\n", encoding="utf-8")
+
+    assert list(iter_records([str(jsonl)], "jsonl")) == ["first", "second", '{"nested": 1}']
+    assert list(iter_records([str(rows)], "csv")) == ["name: Ada\ncity: London"]
+
+
+def test_bad_input_is_a_usage_error(tmp_path, capsys):
+    path = tmp_path / "in.jsonl"
+    path.write_text('{"body": "x"}\n', encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exc:
+        main(["--schema", SCHEMA, "--format", "jsonl", "--base-url", "http://127.0.0.1:9", str(path)])
+
+    assert exc.value.code == 2
+    assert "missing field 'text'" in capsys.readouterr().err
+
+
+def test_stdin_to_stdout_subprocess(stub_url):
+    env = dict(os.environ, PYTHONPATH=os.path.join(os.path.dirname(__file__), "..", "src"))
+    completed = subprocess.run(
+        [sys.executable, "-m", "parserator", "--schema", SCHEMA, "--base-url", stub_url],
+        input=b"alice\nbob\n", capture_output=True, env=env, timeout=60
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    lines = [json.loads(line) for line in completed.stdout.splitlines()]
+    assert [line["result"]["parsedData"]["name"] for line in lines] == ["alice", "bob"]
+
+
+def test_closed_stdout_exits_cleanly(stub_url):
+    env = dict(os.environ, PYTHONPATH=os.path.join(os.path.dirname(__file__), "..", "src"))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "parserator", "--schema", SCHEMA, "--base-url", stub_url],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env
+    )
+    process.stdin.write(b"".join(b"record %d\n" % i for i in range(2000)))
+    process.stdin.close()
+    process.stdout.readline()
+    process.stdout.close()  # like `| head -1`
+
+    assert process.wait(timeout=60) == 0
+    assert b"Traceback" not in process.stderr.read()
+    process.stderr.close()
@@ -0,0 +1,66 @@
+"""
+Offline tests for request body compression
+"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from parserator import Parserator
+from parserator.compression import compress_chunks, negotiate
+
+from conftest import fake_parse_response
+
+
+def decoding_transport(seen, accept=("gzip",)):
+    def handler(request):
+        encoding = request.headers.get("Content-Encoding")
+        seen.append(encoding)
+        if encoding and encoding not in accept:
+            return httpx.Response(415, headers={"Accept-Encoding": ", ".join(accept)})
+        body = request.read()
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        return fake_parse_response(httpx.Request("POST", request.url, content=body))
+
+    return httpx.MockTransport(handler)
+
+
+def test_gzip_stream_round_trips():
+    body = json.dumps({"inputData": "x" * 300000}).encode()
+    assert gzip.decompress(b"".join(compress_chunks(body, "gzip"))) == body
+
+
+def test_large_bodies_are_compressed():
+    seen = []
+    client = Parserator(transport=decoding_transport(seen), compression="gzip", compression_threshold=1024)
+
+    small = client.parse("short", {"a": "string"})
+    large = client.parse("x" * 5000, {"a": "string"})
+
+    assert seen == [None, "gzip"]
+    assert small["success"] and large["success"]
+    assert large["parsedData"]["a"] == "a:" + "x" * 5000
+
+
+def test_unsupported_encoding_falls_back_after_415():
+    pytest.importorskip("zstandard")
+    seen = []
+    client = Parserator(transport=decoding_transport(seen), compression="zstd", compression_threshold=0)
+
+    assert client.parse("abc", {"a": "string"})["success"] is True
+    assert client.parse("def", {"a": "string"})["success"] is True
+    assert seen == ["zstd", "gzip", "gzip"]
+
+
+def test_negotiate_prefers_known_encodings():
+    assert negotiate("br, gzip;q=0.5") == "gzip"
+    assert negotiate("br") is None
+    assert negotiate(None) is None
+
+
+def test_unknown_compression_is_rejected():
+    with pytest.raises(ValueError):
+        Parserator(compression="br")
@@ -0,0 +1,176 @@
+"""
+Offline tests for the adaptive concurrency limiter
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from parserator import AdaptiveLimiter, AsyncParserator, Parserator
+from parserator.testing import StubAPI
+
+from conftest import fake_parse_response
+
+SCHEMA = {"name": "string"}
+
+
+def saturate(limiter, latency, rounds):
+    """Keep the limiter's window full and complete every request after ``latency``"""
+    for _ in range(rounds):
+        held = limiter.limit
+        for _ in range(held):
+            limiter.acquire()
+        for _ in range(held):
+            limiter.release(latency)
+
+
+def test_grows_additively_while_latency_is_flat():
+    limiter = AdaptiveLimiter(initial_limit=4)
+
+    saturate(limiter, 0.01, 10)
+
+    assert 8 <= limiter.limit <= 14
+    assert limiter.stats.increases == limiter.limit - 4
+    assert [entry["reason"] for entry in limiter.history()][:2] == ["initial", "increase"]
+
+
+def test_idle_callers_do_not_grow_the_limit():
+    limiter = AdaptiveLimiter(initial_limit=8)
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(0.01)
+    assert limiter.limit == 8
+
+
+def test_overload_cuts_once_per_round_trip():
+    limiter = AdaptiveLimiter(initial_limit=20)
+    saturate(limiter, 10.0, 1)
+    before = limiter.limit
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(overloaded=True)
+
+    assert limiter.limit == int(before * 0.7)
+    assert limiter.stats.decreases == 1
+    assert limiter.stats.overloads == 3
+
+
+def test_latency_inflation_cuts_limit():
+    limiter = AdaptiveLimiter(initial_limit=10, tolerance=2.0)
+    saturate(limiter, 0.001, 3)
+    before = limiter.limit
+
+    saturate(limiter, 0.05, 1)
+
+    assert limiter.limit < before
+    assert limiter.history()[-1]["reason"] == "latency"
+    assert limiter.as_dict()["min_rtt_ms"] == pytest.approx(1.0)
+
+
+def test_waiters_are_served_in_order():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+    limiter.acquire()
+    order = []
+
+    def worker(index):
+        limiter.acquire()
+        order.append(index)
+        limiter.release()
+
+    threads = []
+    for index in range(3):
+        thread = threading.Thread(target=worker, args=(index,))
+        thread.start()
+        threads.append(thread)
+        while limiter.stats.waited < index + 1:
+            time.sleep(0.001)
+
+    limiter.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == [0, 1, 2]
+    assert limiter.in_flight == 0
+
+
+def test_cancelled_async_waiter_returns_its_slot():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+
+    async def main():
+        await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        await asyncio.wait_for(limiter.acquire_async(), 1)
+        limiter.release()
+
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+
+
+def test_client_finds_backend_capacity():
+    capacity = 4
+    active = []
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            active.append(1)
+            overloaded = len(active) > capacity
+        try:
+            if overloaded:
+                return httpx.Response(503, json={"success": False})
+            time.sleep(0.003)
+            return fake_parse_response(request)
+        finally:
+            with lock:
+                active.pop()
+
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=32)
+    client = Parserator(transport=httpx.MockTransport(handler), concurrency_limiter=limiter)
+
+    results = [result for _, result in client.parse_many([f"r{i}" for i in range(400)], SCHEMA)]
+
+    assert sum(result["success"] for result in results) >= 300
+    assert limiter.stats.increases > 0
+    assert 1 <= limiter.limit <= capacity + 2
+    assert limiter.in_flight == 0
+
+
+def test_parse_many_sizes_worker_pool_to_the_batch(monkeypatch):
+    workers = []
+
+    def bounded_map(fn, items, concurrency, ordered):
+        workers.append(concurrency)
+        return iter(())
+
+    monkeypatch.setattr("parserator.client.bounded_map", bounded_map)
+    client = Parserator(transport=StubAPI().transport(), concurrency_limiter=AdaptiveLimiter(max_limit=256))
+
+    client.parse_many(["a", "b", "c"], SCHEMA)
+    client.parse_many([f"r{i}" for i in range(1000)], SCHEMA)
+    client.parse_many(iter(["a"]), SCHEMA)
+
+    assert workers == [3, 32, 32]
+
+
+def test_async_client_backs_off_on_429():
+    limiter = AdaptiveLimiter(initial_limit=16)
+    stub = StubAPI(error_rate=1.0, error_status=429)
+
+    async def main():
+        async with AsyncParserator(transport=stub.async_transport(), concurrency_limiter=limiter) as client:
+            async for _ in client.parse_many(["a", "b", "c"], SCHEMA):
+                pass
+
+    asyncio.run(main())
+    assert limiter.limit < 16
+    assert limiter.stats.overloads == 3
+    assert limiter.in_flight == 0
@@ -0,0 +1,115 @@
+"""
+Offline tests for DataFrame, Polars and Arrow column parsing
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from parserator import Parserator
+from parserator.dataframe import parse_arrow, parse_dataframe, parse_polars
+
+SCHEMA = {"name": "string", "amount": "number", "paid": "boolean", "tags": "array"}
+
+
+class TypedHandler:
+    """Return typed values derived from inputs shaped like 'name|amount|paid'"""
+
+    def __init__(self):
+        self.inputs = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        text = json.loads(request.content)["inputData"]
+        with self._lock:
+            self.inputs.append(text)
+        if text == "bad":
+            return httpx.Response(500, json={"success": False, "error": {"code": "X", "message": "x"}})
+        name, amount, paid = text.split("|")
+        return httpx.Response(200, json={
+            "success": True,
+            "parsedData": {"name": name, "amount": amount, "paid": paid == "yes", "tags": [name]},
+            "metadata": {"confidence": 0.75}
+        })
+
+
+@pytest.fixture
+def handler():
+    return TypedHandler()
+
+
+@pytest.fixture
+def client(handler):
+    return Parserator(transport=httpx.MockTransport(handler))
+
+
+def test_parse_dataframe_deduplicates_and_types_columns(client, handler):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {"raw": ["a|1.5|yes", "b|2|no", "a|1.5|yes", None, "a|1.5|yes"]},
+        index=[10, 11, 12, 13, 14]
+    )
+
+    out = parse_dataframe(client, df, "raw", SCHEMA)
+
+    assert sorted(handler.inputs) == ["a|1.5|yes", "b|2|no"]
+    assert list(out.index) == [10, 11, 12, 13, 14]
+    assert list(out.columns) == ["name", "amount", "paid", "tags", "confidence"]
+    assert out["amount"].dtype == "float64"
+    assert out["amount"].tolist()[:3] == [1.5, 2.0, 1.5]
+    assert pd.isna(out["amount"].iloc[3])
+    assert out["paid"].dtype == "boolean"
+    assert out["paid"].tolist()[:3] == [True, False, True]
+    assert out["tags"].iloc[1] == ["b"]
+    assert pd.isna(out["name"].iloc[3])
+    assert out["confidence"].iloc[0] == 0.75
+
+
+def test_parse_dataframe_plain_bool_without_missing(client):
+    pd = pytest.importorskip("pandas")
+    out = parse_dataframe(client, pd.DataFrame({"raw": ["a|1|yes", "b|2|no"]}), "raw", SCHEMA)
+
+    assert out["paid"].dtype == bool
+
+
+def test_parse_dataframe_failed_rows_are_missing(client):
+    pd = pytest.importorskip("pandas")
+    out = parse_dataframe(client, pd.DataFrame({"raw": ["a|1|yes", "bad"]}), "raw", SCHEMA)
+
+    assert out["name"].iloc[0] == "a"
+    assert pd.isna(out["name"].iloc[1])
+    assert pd.isna(out["confidence"].iloc[1])
+
+
+def test_confidence_column_clash_is_rejected(client):
+    pd = pytest.importorskip("pandas")
+    with pytest.raises(ValueError):
+        parse_dataframe(client, pd.DataFrame({"raw": ["a|1|yes"]}), "raw", SCHEMA, confidence_column="name")
+
+
+def test_parse_arrow(client, handler):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"raw": ["a|1|yes", None, "a|1|yes", "b|3|no"]})
+
+    out = parse_arrow(client, table, "raw", SCHEMA)
+
+    assert len(handler.inputs) == 2
+    assert out.schema.field("amount").type == pa.float64()
+    assert out.schema.field("paid").type == pa.bool_()
+    assert out.column("amount").to_pylist() == [1.0, None, 1.0, 3.0]
+    assert out.column("tags").to_pylist() == [["a"], None, ["a"], ["b"]]
+
+
+def test_parse_polars(client):
+    pl = pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    df = pl.DataFrame({"raw": ["a|1|yes", "b|2|no", "b|2|no"]})
+
+    out = parse_polars(client, df, "raw", SCHEMA)
+
+    assert out.height == 3
+    assert out["amount"].dtype == pl.Float64
+    assert out["paid"].to_list() == [True, False, False]
+    assert out["confidence"].to_list() == [0.75, 0.75, 0.75]
@@ -0,0 +1,56 @@
+"""
+Offline tests for fast decoding and lightweight result objects
+"""
+
+import httpx
+
+from parserator import Parserator, ParseResult
+from parserator.decoding import loads
+
+from conftest import fake_parse_response
+
+
+def test_loads_accepts_bytes_and_str():
+    assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert loads('{"a": null}') == {"a": None}
+
+
+def test_typed_results_expose_fields_lazily():
+    client = Parserator(transport=httpx.MockTransport(fake_parse_response), typed_results=True)
+    result = client.parse("Jane", {"name": "string"})
+
+    assert isinstance(result, ParseResult)
+    assert result.success is True
+    assert result.parsed_data == {"name": "name:Jane"}
+    assert result.metadata.confidence == 0.9
+    assert result.metadata.processing_time_ms == 5
+    assert result["parsedData"] == result.parsed_data
+
+
+def test_error_results_use_snake_case_metadata():
+    result = ParseResult({"success": False, "error": {"code": "HTTP_ERROR"}, "metadata": {"processing_time_ms": 0}})
+
+    assert result.error["code"] == "HTTP_ERROR"
+    assert result.metadata.processing_time_ms == 0
+    assert result.metadata.features == []
+
+
+def test_strict_validation_builds_pydantic_model():
+    result = ParseResult(fake_parse_response(httpx.Request(
+        "POST", "http://test/v1/parse", json={"inputData": "x", "outputSchema": {"a": "string"}}
+    )).json())
+
+    validated = result.validate()
+    assert validated.parsed_data == {"a": "a:x"}
+    assert validated.metadata.tokens_used == 10
+
+
+def test_strict_validation_flags_malformed_responses():
+    def handler(request):
+        return httpx.Response(200, json={"success": True, "parsedData": {}, "metadata": {"confidence": "high"}})
+
+    client = Parserator(transport=httpx.MockTransport(handler), strict_validation=True)
+    result = client.parse("Jane", {"name": "string"})
+
+    assert result["success"] is False
+    assert result["error"]["code"] == "VALIDATION_ERROR"
@@ -0,0 +1,191 @@
+"""
+Offline tests for hedged parse requests
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+
+from parserator import AsyncParserator, HedgePolicy, Parserator
+from parserator.cache import schema_fingerprint
+
+from conftest import fake_parse_response
+
+SCHEMA = {"name": "string"}
+
+
+def tagged_response(request, attempt):
+    """fake_parse_response with the attempt number as its request id"""
+    body = json.loads(fake_parse_response(request).content)
+    body["metadata"]["requestId"] = f"attempt {attempt}"
+    return httpx.Response(200, json=body)
+
+
+class SlowFirstTransport(httpx.MockTransport):
+    """
+    The first request for an input marked 'slow' stalls (then fails, if
+    asked); repeats answer after ``repeat_stall`` seconds
+    """
+
+    def __init__(self, stall=1.0, fail=False, repeat_stall=0.0):
+        self.stall = stall
+        self.fail = fail
+        self.repeat_stall = repeat_stall
+        self.seen = {}
+        self.lock = threading.Lock()
+        super().__init__(self.handle)
+
+    def handle(self, request):
+        text = json.loads(request.content)["inputData"]
+        with self.lock:
+            count = self.seen[text] = self.seen.get(text, 0) + 1
+        if text.startswith("slow"):
+            time.sleep(self.stall if count == 1 else self.repeat_stall)
+            if self.fail and count == 1:
+                raise httpx.ReadTimeout("stalled", request=request)
+        return tagged_response(request, count)
+
+
+class AsyncSlowFirstTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.seen = {}
+        self.cancelled = 0
+
+    async def handle_async_request(self, request):
+        text = json.loads(await request.aread())["inputData"]
+        count = self.seen[text] = self.seen.get(text, 0) + 1
+        if text.startswith("slow") and count == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return tagged_response(request, count)
+
+
+# Hedging policies below wait at least min_delay=0.15, so pauses such as a
+# garbage collection on a busy machine do not hedge the warm-up requests
+def warm_up(client, count=10):
+    for index in range(count):
+        client.parse(f"fast {index}", SCHEMA)
+
+
+def test_slow_request_is_hedged_and_hedge_wins():
+    policy = HedgePolicy(percentile=90, budget=1.0, min_samples=5, min_delay=0.15)
+    client = Parserator(transport=SlowFirstTransport(stall=1.0), hedge=policy)
+    warm_up(client)
+
+    started = time.perf_counter()
+    result = client.parse("slow one", SCHEMA)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert result["parsedData"]["name"] == "name:slow one"
+    assert result["metadata"]["requestId"] == "attempt 2"
+    assert policy.stats.hedges == 1
+    assert policy.stats.hedges_won == 1
+    # The winner's latency is sampled, not the abandoned original's
+    histogram = policy.histogram(schema_fingerprint(SCHEMA))
+    assert len(histogram) == 11
+    assert histogram.percentile(99.9) < 500
+    client.close()
+
+
+def test_original_that_answers_first_is_returned():
+    policy = HedgePolicy(percentile=90, budget=1.0, min_samples=5, min_delay=0.15)
+    client = Parserator(transport=SlowFirstTransport(stall=0.3, repeat_stall=1.0), hedge=policy)
+    warm_up(client)
+
+    started = time.perf_counter()
+    result = client.parse("slow one", SCHEMA)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.8
+    assert result["metadata"]["requestId"] == "attempt 1"
+    assert policy.stats.hedges == 1
+    assert policy.stats.hedges_won == 0
+    client.close()
+
+
+def test_hedge_answers_when_the_original_fails():
+    policy = HedgePolicy(percentile=90, budget=1.0, min_samples=5, min_delay=0.15)
+    client = Parserator(transport=SlowFirstTransport(stall=0.3, fail=True), hedge=policy)
+    warm_up(client)
+
+    result = client.parse("slow one", SCHEMA)
+
+    assert result["success"] is True
+    assert result["parsedData"]["name"] == "name:slow one"
+    assert policy.stats.hedges_won == 1
+    client.close()
+
+
+def test_constant_latency_fires_no_hedges_under_parse_many():
+    def handler(request):
+        time.sleep(0.05)
+        return fake_parse_response(request)
+
+    # A pool far smaller than the batch: originals must not queue behind it
+    policy = HedgePolicy(budget=1.0, min_samples=5, min_delay=0.25, max_workers=4)
+    client = Parserator(transport=httpx.MockTransport(handler), hedge=policy)
+    warm_up(client)
+
+    started = time.perf_counter()
+    results = [result for _, result in client.parse_many([f"r{i}" for i in range(256)], SCHEMA, concurrency=32)]
+    elapsed = time.perf_counter() - started
+
+    assert all(result["success"] for result in results)
+    assert policy.stats.hedges == 0
+    assert elapsed < 2.0
+    client.close()
+
+
+def test_fast_requests_are_not_hedged():
+    policy = HedgePolicy(budget=1.0, min_samples=5, min_delay=0.25)
+    client = Parserator(transport=SlowFirstTransport(), hedge=policy)
+
+    warm_up(client, 30)
+
+    assert policy.stats.requests == 30
+    assert policy.stats.hedges == 0
+    client.close()
+
+
+def test_budget_caps_hedges():
+    policy = HedgePolicy(percentile=90, budget=0.05, burst=1.0, min_samples=5)
+    transport = SlowFirstTransport(stall=0.1)
+    client = Parserator(transport=transport, hedge=policy)
+    warm_up(client)
+
+    client.parse("slow one", SCHEMA)
+
+    assert policy.stats.hedges == 0
+    assert policy.stats.budget_exhausted == 1
+    assert policy.stats.hedge_rate == 0.0
+    client.close()
+
+
+def test_async_hedge_cancels_loser():
+    policy = HedgePolicy(percentile=90, budget=1.0, min_samples=5, min_delay=0.15)
+    transport = AsyncSlowFirstTransport()
+
+    async def main():
+        async with AsyncParserator(transport=transport, hedge=policy) as client:
+            for index in range(10):
+                await client.parse(f"fast {index}", SCHEMA)
+            started = time.perf_counter()
+            result = await client.parse("slow one", SCHEMA)
+            await asyncio.sleep(0)
+            return result, time.perf_counter() - started
+
+    result, elapsed = asyncio.run(main())
+
+    assert result["parsedData"]["name"] == "name:slow one"
+    assert result["metadata"]["requestId"] == "attempt 2"
+    assert elapsed < 1.0
+    assert transport.cancelled == 1
+    assert policy.stats.as_dict()["win_rate"] == 1.0
+    assert len(policy.histogram(schema_fingerprint(SCHEMA))) == 11
@@ -0,0 +1,58 @@
+"""
+Import-time regression tests for the lazy package exports
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import parserator
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+
+
+def loaded_after(code):
+    """Run ``code`` in a fresh interpreter and return which heavy modules it loaded"""
+    script = (
+        f"{code}\n"
+        "import json, sys\n"
+        "print(json.dumps([m for m in ('httpx', 'numpy', 'pydantic', 'pandas', 'parserator.client') "
+        "if m in sys.modules]))"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC)
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def test_import_loads_no_heavy_dependencies():
+    assert loaded_after("import parserator") == []
+
+
+def test_client_loads_httpx_but_not_pydantic():
+    assert loaded_after("from parserator import Parserator") == ["httpx", "parserator.client"]
+
+
+def test_similarity_index_defers_numpy():
+    assert "numpy" not in loaded_after("from parserator import SimilarityIndex")
+    assert "numpy" in loaded_after("from parserator import SimilarityIndex; SimilarityIndex()")
+
+
+def test_types_module_defers_pydantic():
+    assert loaded_after("import parserator.types") == []
+    assert "pydantic" in loaded_after("from parserator.types import ParseResponse")
+
+
+def test_every_export_resolves():
+    for name in parserator.__all__:
+        assert getattr(parserator, name) is not None
+    assert set(parserator.__all__) <= set(dir(parserator))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        parserator.NotAThing
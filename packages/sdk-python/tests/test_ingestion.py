@@ -0,0 +1,169 @@
+"""
+Offline tests for resumable bulk ingestion
+"""
+
+import gzip
+import json
+
+import httpx
+
+from parserator import IngestRunner, Parserator, ingest
+from parserator.cache import schema_fingerprint
+from parserator.ingestion import IngestJournal, discover_inputs, input_hash, scan_input
+
+from conftest import fake_parse_response
+
+SCHEMA = {"name": "string"}
+
+
+class CountingTransport(httpx.MockTransport):
+    def __init__(self, fail_on=None):
+        self.inputs = []
+        self.fail_on = fail_on
+        super().__init__(self.handle)
+
+    def handle(self, request):
+        payload = json.loads(request.content)
+        self.inputs.append(payload["inputData"])
+        if payload["inputData"] == self.fail_on:
+            return httpx.Response(500, json={"success": False})
+        return fake_parse_response(request)
+
+
+def make_inputs(root, count):
+    root.mkdir(exist_ok=True)
+    for index in range(count):
+        (root / f"doc{index}.txt").write_text(f"document {index}", encoding="utf-8")
+    return root
+
+
+def read_output(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_directory_ingestion_writes_jsonl(tmp_path):
+    source = make_inputs(tmp_path / "in", 5)
+    output = tmp_path / "out.jsonl"
+    transport = CountingTransport()
+
+    stats = ingest(Parserator(transport=transport), str(source), SCHEMA, str(output), workers=0)
+
+    lines = read_output(output)
+    assert stats.parsed == 5
+    assert stats.done == stats.files == 5
+    assert sorted(line["result"]["parsedData"]["name"] for line in lines) == [
+        f"name:document {index}" for index in range(5)
+    ]
+    assert stats.as_dict()["input_bytes"] == sum(len(f"document {index}") for index in range(5))
+
+
+def test_restart_skips_completed_files(tmp_path):
+    source = make_inputs(tmp_path / "in", 3)
+    output = str(tmp_path / "out.jsonl")
+    ingest(Parserator(transport=CountingTransport()), str(source), SCHEMA, output, workers=0)
+
+    make_inputs(source, 4)
+    transport = CountingTransport()
+    stats = ingest(Parserator(transport=transport), str(source), SCHEMA, output, workers=0)
+
+    assert transport.inputs == ["document 3"]
+    assert stats.skipped == 3
+    assert stats.parsed == 1
+    assert len(read_output(output)) == 4
+
+
+def test_changed_schema_reparses(tmp_path):
+    source = make_inputs(tmp_path / "in", 2)
+    output = str(tmp_path / "out.jsonl")
+    ingest(Parserator(transport=CountingTransport()), str(source), SCHEMA, output, workers=0)
+
+    transport = CountingTransport()
+    ingest(Parserator(transport=transport), str(source), {"title": "string"}, output, workers=0)
+
+    assert len(transport.inputs) == 2
+
+
+def test_failures_are_retried_on_next_run(tmp_path):
+    source = make_inputs(tmp_path / "in", 2)
+    (source / "bad.txt").write_bytes(b"\xff\xfe\xfa")
+    output = str(tmp_path / "out.jsonl")
+
+    stats = ingest(
+        Parserator(transport=CountingTransport(fail_on="document 1")), str(source), SCHEMA, output, workers=0
+    )
+    assert (stats.parsed, stats.failed) == (1, 2)
+    assert len(read_output(output)) == 1
+    codes = sorted(line["result"]["error"]["code"] for line in read_output(output + ".errors"))
+    assert codes == ["FILE_ERROR", "HTTP_ERROR"]
+
+    transport = CountingTransport()
+    stats = ingest(Parserator(transport=transport), str(source), SCHEMA, output, workers=0)
+    assert transport.inputs == ["document 1"]
+    assert stats.skipped == 1
+    assert all(line["result"]["success"] for line in read_output(output))
+    assert len(read_output(output)) == 2
+    assert [line["path"] for line in read_output(output + ".errors")] == [str(source / "bad.txt")]
+
+
+def test_process_pool_and_gzip(tmp_path):
+    source = make_inputs(tmp_path / "in", 3)
+    with gzip.open(source / "extra.txt.gz", "wt", encoding="utf-8") as f:
+        f.write("compressed document")
+    output = str(tmp_path / "out.jsonl")
+    transport = CountingTransport()
+    reports = []
+
+    runner = IngestRunner(
+        Parserator(transport=transport), SCHEMA, output, workers=2, progress=reports.append
+    )
+    stats = runner.run(str(source))
+
+    assert stats.parsed == 4
+    assert "compressed document" in transport.inputs
+    assert reports[-1] is stats
+
+
+def test_workers_return_only_the_hash(tmp_path):
+    source = make_inputs(tmp_path / "in", 1)
+    path = str(source / "doc0.txt")
+
+    assert scan_input(path, "fp") == (path, input_hash("document 0", "fp"), None)
+    assert scan_input(str(source / "missing.txt"), "fp")[1] is None
+
+
+def test_process_pool_resume_skips_completed_files(tmp_path):
+    source = make_inputs(tmp_path / "in", 3)
+    output = str(tmp_path / "out.jsonl")
+    ingest(Parserator(transport=CountingTransport()), str(source), SCHEMA, output, workers=2)
+
+    make_inputs(source, 4)
+    transport = CountingTransport()
+    stats = ingest(Parserator(transport=transport), str(source), SCHEMA, output, workers=2)
+
+    assert transport.inputs == ["document 3"]
+    assert stats.skipped == 3
+    assert read_output(output)[-1]["hash"] == input_hash("document 3", schema_fingerprint(SCHEMA))
+
+
+def test_glob_and_manifest_discovery(tmp_path):
+    source = make_inputs(tmp_path / "in", 3)
+    (source / "notes.md").write_text("ignored", encoding="utf-8")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("# inputs\nin/doc2.txt\n\nin/doc0.txt\n", encoding="utf-8")
+
+    assert discover_inputs(str(source / "*.txt")) == [str(source / f"doc{index}.txt") for index in range(3)]
+    assert discover_inputs(str(manifest)) == [str(source / "doc2.txt"), str(source / "doc0.txt")]
+    assert len(discover_inputs(str(source))) == 4
+
+
+def test_journal_ignores_truncated_line(tmp_path):
+    path = tmp_path / "out.journal"
+    path.write_text("aaa\tone.txt\nbbb\ttw", encoding="utf-8")
+
+    journal = IngestJournal(str(path))
+    journal.close()
+
+    assert "aaa" in journal
+    assert "bbb" not in journal
+    assert path.read_text(encoding="utf-8") == "aaa\tone.txt\n"
@@ -0,0 +1,109 @@
+"""
+Tests for request instrumentation and latency breakdown
+"""
+
+import io
+import json
+
+import httpx
+
+from parserator import (
+    InMemorySpanExporter,
+    Instrumentation,
+    JsonLinesSpanExporter,
+    Parserator,
+    RetryPolicy,
+)
+from parserator.cache import schema_fingerprint
+from parserator.instrumentation import LatencyHistogram
+
+
+def test_events_carry_phase_breakdown_and_server_metadata(server_url):
+    seen = []
+    instrumentation = Instrumentation(on_request=seen.append, on_response=seen.append)
+
+    with Parserator(base_url=server_url, instrumentation=instrumentation) as client:
+        client.parse("Jane", {"name": "string"})
+
+    started, finished = seen
+    assert started is finished
+    assert finished.success is True
+    assert finished.attempts == 1
+    assert finished.status_code == 200
+    assert finished.server_processing_ms == 3
+    assert finished.tokens_used == 42
+    assert {"pool_wait", "connect", "upload", "server_wait", "download"} <= set(finished.phases)
+    assert finished.total_ms >= finished.network_ms > 0
+
+
+def test_retries_are_counted():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"success": True, "parsedData": {}})
+
+    events = []
+    client = Parserator(
+        transport=httpx.MockTransport(handler),
+        retry=RetryPolicy(backoff_base=0.001),
+        instrumentation=Instrumentation(on_response=events.append)
+    )
+    client.parse("Jane", {"name": "string"})
+
+    assert events[0].attempts == 2
+
+
+def test_percentiles_are_tracked_per_schema():
+    instrumentation = Instrumentation()
+    client = Parserator(
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, json={"success": True})),
+        instrumentation=instrumentation
+    )
+    for _ in range(5):
+        client.parse("x", {"a": "string"})
+    client.parse("x", {"b": "number"})
+
+    summary = instrumentation.latency_summary()
+    assert summary[schema_fingerprint({"a": "string"})]["count"] == 5
+    assert summary[schema_fingerprint({"b": "number"})]["count"] == 1
+
+
+def test_histogram_nearest_rank_percentiles():
+    histogram = LatencyHistogram(window=100)
+    for value in range(1, 101):
+        histogram.record(float(value))
+
+    assert histogram.summary() == {"count": 100, "p50": 50.0, "p95": 95.0, "p99": 99.0}
+    assert LatencyHistogram().percentile(50) is None
+
+
+def test_spans_are_exported_without_a_collector():
+    memory = InMemorySpanExporter()
+    stream = io.StringIO()
+    client = Parserator(
+        transport=httpx.MockTransport(lambda r: httpx.Response(500)),
+        instrumentation=Instrumentation(exporter=memory)
+    )
+    client.parse("x", {"a": "string"})
+    JsonLinesSpanExporter(stream).export(memory.spans[0])
+
+    span = json.loads(stream.getvalue())
+    assert span["name"] == "parserator.parse"
+    assert span["status"] == "ERROR"
+    assert span["attributes"]["http.response.status_code"] == 500
+    assert span["attributes"]["error.type"] == "HTTP_ERROR"
+
+
+def test_failing_hooks_do_not_break_parsing():
+    def boom(event):
+        raise RuntimeError("hook failed")
+
+    client = Parserator(
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, json={"success": True})),
+        instrumentation=Instrumentation(on_request=boom, on_response=boom)
+    )
+
+    assert client.parse("x", {"a": "string"})["success"] is True
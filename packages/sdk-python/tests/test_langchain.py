@@ -0,0 +1,114 @@
+"""
+Offline tests for the LangChain tools
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from parserator import AsyncParserator, MemoryCache, Parserator
+from parserator.integrations.langchain import ParseratorBatchTool, ParseratorTool
+from parserator.testing import StubAPI
+
+from conftest import fake_parse_response
+
+SCHEMA = {"name": "string"}
+
+
+def failing_handler(request):
+    if b"bad" in request.content:
+        return httpx.Response(422, json={"success": False, "error": {"code": "INVALID_INPUT", "message": "bad"}})
+    return fake_parse_response(request)
+
+
+def test_tool_invoke_returns_parsed_data_and_reuses_client():
+    stub = StubAPI()
+    tool = ParseratorTool(client=Parserator(transport=stub.transport()))
+
+    first = tool.invoke({"input_data": "Jane", "output_schema": SCHEMA})
+    second = tool.invoke({"input_data": "John", "output_schema": SCHEMA})
+
+    assert set(first) == {"name"} and set(second) == {"name"}
+    assert tool.client.pool_stats()["requests"] == 2
+
+
+def test_tool_surfaces_errors_to_the_agent():
+    tool = ParseratorTool(client=Parserator(transport=httpx.MockTransport(failing_handler)))
+
+    message = tool.invoke({"input_data": "bad input", "output_schema": SCHEMA})
+
+    assert isinstance(message, str)
+    assert message.startswith("HTTP_ERROR")
+
+
+def test_tool_arun_uses_async_client():
+    stub = StubAPI()
+    tool = ParseratorTool(async_client=AsyncParserator(transport=stub.async_transport()))
+
+    async def main():
+        try:
+            return await asyncio.gather(*(
+                tool.ainvoke({"input_data": f"r{i}", "output_schema": SCHEMA}) for i in range(5)
+            ))
+        finally:
+            await tool.aclose()
+
+    results = asyncio.run(main())
+    assert len(results) == 5
+    assert tool.client is None
+
+
+def test_tool_creates_one_async_client_per_event_loop():
+    tool = ParseratorTool(api_key="pk_test")
+
+    async def clients():
+        try:
+            return tool.get_async_client(), tool.get_async_client()
+        finally:
+            await tool.aclose()
+
+    first, again = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+
+    assert first is again
+    assert second is not first
+    assert tool.async_client is None
+
+
+def test_tool_builds_client_with_cache_and_retry():
+    tool = ParseratorTool(api_key="pk_test", cache=MemoryCache())
+    try:
+        client = tool.get_client()
+        assert client is tool.get_client()
+        assert client.cache is tool.cache
+        assert client.retry is not None
+    finally:
+        tool.close()
+
+
+def test_batch_tool_keeps_order_and_isolates_failures():
+    tool = ParseratorBatchTool(client=Parserator(transport=httpx.MockTransport(failing_handler)), concurrency=4)
+
+    results = tool.invoke({"inputs": ["a", "bad", "c"], "output_schema": SCHEMA})
+
+    assert len(results) == 3
+    assert "name" in results[0] and "name" in results[2]
+    assert results[1]["error"]["code"] == "HTTP_ERROR"
+
+
+def test_batch_tool_arun():
+    stub = StubAPI()
+    tool = ParseratorBatchTool(async_client=AsyncParserator(transport=stub.async_transport()))
+
+    async def main():
+        try:
+            return await tool.ainvoke({"inputs": [f"r{i}" for i in range(10)], "output_schema": SCHEMA})
+        finally:
+            await tool.aclose()
+
+    results = asyncio.run(main())
+    assert len(results) == 10
+    assert all("name" in result for result in results)
@@ -0,0 +1,134 @@
+"""
+Offline tests for the local fast-path extractor
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from parserator import AsyncParserator, LocalExtractor, Parserator
+
+from conftest import fake_parse_response
+
+CONTACT = "Maria Garcia - Software Engineer\nEmail: maria@tech.com\nPhone: (555) 987-6543"
+CONTACT_SCHEMA = {"name": "string", "role": "string", "email": "string", "phone": "string"}
+
+PRODUCT = """
+    Product: Gaming Desktop
+    Price: $1,899.99
+    Specs: 32GB RAM, 1TB NVMe SSD, RTX 4070
+    Available: Yes
+    Tags: Gaming, High-Performance, Desktop, Computer
+"""
+PRODUCT_SCHEMA = {
+    "product": "string",
+    "price": "number",
+    "specs": "string",
+    "available": "boolean",
+    "tags": "array",
+}
+
+
+class RecordingTransport(httpx.MockTransport):
+    def __init__(self):
+        self.bodies = []
+        super().__init__(self.handle)
+
+    def handle(self, request):
+        self.bodies.append(json.loads(request.content))
+        return fake_parse_response(request)
+
+
+def test_fully_local_input_skips_network():
+    transport = RecordingTransport()
+    client = Parserator(transport=transport, local_extractor=LocalExtractor(min_confidence=0.5))
+
+    result = client.parse(PRODUCT, PRODUCT_SCHEMA)
+
+    assert transport.bodies == []
+    assert result["parsedData"] == {
+        "product": "Gaming Desktop",
+        "price": 1899.99,
+        "specs": "32GB RAM, 1TB NVMe SSD, RTX 4070",
+        "available": True,
+        "tags": ["Gaming", "High-Performance", "Desktop", "Computer"],
+    }
+    assert result["metadata"]["fieldConfidence"]["price"] == 0.95
+    assert result["metadata"]["fieldConfidence"]["specs"] == 0.6
+    assert client.local_extractor.stats.hit_rate == 1.0
+
+
+def test_unvalidated_labeled_text_is_left_to_the_api_by_default():
+    extraction = LocalExtractor().extract(PRODUCT, PRODUCT_SCHEMA)
+
+    assert extraction.values == {"price": 1899.99, "available": True}
+    assert extraction.remaining == {"product": "string", "specs": "string", "tags": "array"}
+
+
+def test_multi_line_labeled_value_is_not_trusted():
+    text = "Address: 1 Main St\n    Springfield, IL\nPhone: 555-010-2030"
+    extraction = LocalExtractor(min_confidence=0.5).extract(text, {"address": "string", "phone": "phone"})
+
+    assert extraction.remaining == {"address": "string"}
+    assert extraction.values == {"phone": "555-010-2030"}
+
+
+def test_only_unresolved_fields_are_sent():
+    transport = RecordingTransport()
+    extractor = LocalExtractor()
+    client = Parserator(transport=transport, local_extractor=extractor)
+
+    result = client.parse(CONTACT, CONTACT_SCHEMA)
+
+    assert transport.bodies[0]["outputSchema"] == {"name": "string", "role": "string"}
+    assert result["parsedData"]["email"] == "maria@tech.com"
+    assert result["parsedData"]["phone"] == "(555) 987-6543"
+    assert result["parsedData"]["name"] == f"name:{CONTACT}"
+    assert list(result["parsedData"]) == list(CONTACT_SCHEMA)
+    assert result["metadata"]["fieldConfidence"]["name"] == 0.9
+    assert sorted(result["metadata"]["localFields"]) == ["email", "phone"]
+    assert extractor.stats.partial == 1
+    assert extractor.stats.field_hit_rate == 0.5
+
+
+def test_unlabeled_patterns_and_ambiguity():
+    extractor = LocalExtractor()
+
+    single = extractor.extract("Reach me at ada@example.com any time", {"email": "email"})
+    double = extractor.extract("ada@example.com or grace@example.com", {"email": "email"})
+
+    assert single.values == {"email": "ada@example.com"}
+    assert double.remaining == {"email": "email"}
+
+
+def test_invalid_labeled_value_is_left_to_the_api():
+    extraction = LocalExtractor().extract("Email: ask at the desk", {"email": "string"})
+
+    assert extraction.remaining == {"email": "string"}
+
+
+def test_dates_and_amounts():
+    text = "Invoice #INV-2024-005\nDate: 2024-06-15\nCustomer: XYZ Corporation\nAmount: $3,750.00"
+    extraction = LocalExtractor().extract(text, {"date": "date", "customer": "string", "amount": "number"})
+
+    assert extraction.values == {"date": "2024-06-15", "amount": 3750.0}
+    assert extraction.remaining == {"customer": "string"}
+    assert LocalExtractor().extract("Paid June 15, 2024", {"paid_on": "date"}).values == {"paid_on": "June 15, 2024"}
+
+
+def test_local_results_pass_strict_validation():
+    client = Parserator(transport=RecordingTransport(), local_extractor=LocalExtractor(), strict_validation=True)
+
+    assert client.parse(PRODUCT, PRODUCT_SCHEMA)["success"] is True
+
+
+def test_async_client_uses_local_fast_path():
+    transport = RecordingTransport()
+
+    async def main():
+        async with AsyncParserator(transport=transport, local_extractor=LocalExtractor(min_confidence=0.5)) as client:
+            return await client.parse(PRODUCT, PRODUCT_SCHEMA)
+
+    assert asyncio.run(main())["parsedData"]["available"] is True
+    assert transport.bodies == []
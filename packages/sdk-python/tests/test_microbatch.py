@@ -0,0 +1,277 @@
+"""
+Offline tests for micro-batching
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+
+import httpx
+
+from parserator import (
+    AsyncMicroBatcher, AsyncParserator, LocalExtractor, MemoryCache, MicroBatcher, ParseResult, Parserator
+)
+from parserator.microbatch import pack_records, split_result
+
+SCHEMA = {"name": "string"}
+
+_RECORD = re.compile(r"### RECORD (\d+) ###\n")
+
+
+def packed_response(payload, swap=False, drop=None):
+    """Answer a packed request with each record's text under its own keys"""
+    parts = _RECORD.split(payload["inputData"])
+    if len(parts) == 1:
+        parsed = {field: payload["inputData"] for field in payload["outputSchema"]}
+    else:
+        records = {int(index): text.rstrip("\n") for index, text in zip(parts[1::2], parts[2::2])}
+        if swap:
+            records[0], records[1] = records[1], records[0]
+        parsed = {}
+        for key in payload["outputSchema"]:
+            index = int(key[1:key.index("_")])
+            if index != drop:
+                parsed[key] = records[index]
+    return {
+        "success": True,
+        "parsedData": parsed,
+        "metadata": {"confidence": 0.9, "tokensUsed": 100},
+    }
+
+
+class PackedTransport(httpx.MockTransport):
+    def __init__(self, **behaviour):
+        self.bodies = []
+        self.behaviour = behaviour
+        super().__init__(self.handle)
+
+    def handle(self, request):
+        payload = json.loads(request.content)
+        self.bodies.append(payload)
+        # Only the packed request gets the configured misbehaviour
+        behaviour = self.behaviour if len(self.bodies) == 1 else {}
+        return httpx.Response(200, json=packed_response(payload, **behaviour))
+
+
+class AsyncPackedTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.bodies = []
+
+    async def handle_async_request(self, request):
+        payload = json.loads(await request.aread())
+        self.bodies.append(payload)
+        return httpx.Response(200, json=packed_response(payload))
+
+
+def run_threads(batcher, inputs, schema=SCHEMA):
+    results = [None] * len(inputs)
+    barrier = threading.Barrier(len(inputs))
+
+    def worker(index):
+        barrier.wait()
+        results[index] = batcher.parse(inputs[index], schema)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_pack_and_split_round_trip():
+    records = ["alice smith", "bob jones"]
+    input_data, schema = pack_records(records, SCHEMA)
+
+    assert schema == {"r0_name": "string", "r1_name": "string"}
+    assert input_data == "### RECORD 0 ###\nalice smith\n### RECORD 1 ###\nbob jones"
+
+    result = packed_response({"inputData": input_data, "outputSchema": schema})
+    split = split_result(result, records, SCHEMA)
+    assert [item["parsedData"] for item in split] == [{"name": "alice smith"}, {"name": "bob jones"}]
+    assert split[1]["metadata"]["batchIndex"] == 1
+    assert split[1]["metadata"]["tokensUsed"] == 50
+
+
+def test_concurrent_calls_share_one_request():
+    transport = PackedTransport()
+    inputs = [f"record number {index}" for index in range(5)]
+    with MicroBatcher(Parserator(transport=transport), max_wait=5.0, max_records=5) as batcher:
+        results = run_threads(batcher, inputs)
+
+    assert len(transport.bodies) == 1
+    assert [result["parsedData"]["name"] for result in results] == inputs
+    assert batcher.stats.batches == 1
+    assert batcher.stats.records_per_batch == 5
+
+
+def test_timer_sends_partial_batch():
+    transport = PackedTransport()
+    batcher = MicroBatcher(Parserator(transport=transport), max_wait=0.01)
+
+    result = batcher.parse("lonely record", SCHEMA)
+
+    assert result["parsedData"] == {"name": "lonely record"}
+    assert transport.bodies[0]["outputSchema"] == SCHEMA
+
+
+def test_token_budget_closes_batches():
+    transport = PackedTransport()
+    inputs = ["x" * 300 + str(index) for index in range(4)]
+    batcher = MicroBatcher(Parserator(transport=transport), max_wait=0.2, max_tokens=800)
+
+    results = run_threads(batcher, inputs)
+
+    assert [result["parsedData"]["name"] for result in results] == inputs
+    assert len(transport.bodies) > 1
+
+
+def test_large_and_delimiter_records_go_direct():
+    transport = PackedTransport()
+    batcher = MicroBatcher(Parserator(transport=transport), max_record_chars=10)
+
+    batcher.parse("a much longer record", SCHEMA)
+    batcher.parse("### RECORD 3 ###", SCHEMA)
+
+    assert [body["outputSchema"] for body in transport.bodies] == [SCHEMA, SCHEMA]
+    assert batcher.stats.direct == 2
+
+
+def test_misattributed_values_fall_back():
+    transport = PackedTransport(swap=True)
+    inputs = ["first record", "second record"]
+    batcher = MicroBatcher(Parserator(transport=transport), max_wait=5.0, max_records=2)
+
+    results = run_threads(batcher, inputs)
+
+    assert [result["parsedData"]["name"] for result in results] == inputs
+    assert batcher.stats.fallbacks == 2
+    assert len(transport.bodies) == 3
+
+
+def test_missing_slice_falls_back():
+    transport = PackedTransport(drop=1)
+    inputs = ["first record", "second record"]
+    batcher = MicroBatcher(Parserator(transport=transport), max_wait=5.0, max_records=2)
+
+    results = run_threads(batcher, inputs)
+
+    assert [result["parsedData"]["name"] for result in results] == inputs
+    assert sum("batchSize" in result["metadata"] for result in results) == 1
+    assert batcher.stats.fallbacks == 1
+
+
+def test_records_use_the_result_cache():
+    transport = PackedTransport()
+    inputs = ["first record", "second record"]
+    batcher = MicroBatcher(Parserator(transport=transport, cache=MemoryCache()), max_wait=5.0, max_records=2)
+
+    run_threads(batcher, inputs)
+    again = batcher.parse("first record", SCHEMA)
+
+    assert again["parsedData"] == {"name": "first record"}
+    assert len(transport.bodies) == 1
+
+
+def test_records_use_the_local_fast_path():
+    transport = PackedTransport()
+    client = Parserator(transport=transport, local_extractor=LocalExtractor())
+    schema = {"name": "string", "email": "email"}
+    inputs = ["alice ada@example.com", "bob bob@example.com"]
+    batcher = MicroBatcher(client, max_wait=5.0, max_records=2)
+
+    results = run_threads(batcher, inputs, schema)
+
+    assert transport.bodies[0]["outputSchema"] == {"r0_name": "string", "r1_name": "string"}
+    assert [result["parsedData"] for result in results] == [
+        {"name": "alice ada@example.com", "email": "ada@example.com"},
+        {"name": "bob bob@example.com", "email": "bob@example.com"},
+    ]
+
+
+def test_results_follow_the_client_result_type():
+    batcher = MicroBatcher(Parserator(transport=PackedTransport(), typed_results=True), max_wait=0.01)
+
+    result = batcher.parse("typed record", SCHEMA)
+
+    assert isinstance(result, ParseResult)
+    assert result.parsed_data == {"name": "typed record"}
+
+
+def test_deadline_stops_waiting_for_a_batch():
+    transport = PackedTransport()
+    batcher = MicroBatcher(Parserator(transport=transport), max_wait=5.0)
+
+    started = time.perf_counter()
+    result = batcher.parse("impatient record", SCHEMA, deadline=0.05)
+
+    assert time.perf_counter() - started < 1.0
+    assert result["error"]["code"] == "DEADLINE_EXCEEDED"
+    batcher.flush()
+
+
+def test_failed_batch_gives_each_record_its_own_error():
+    inputs = ["first record", "second record"]
+    batcher = MicroBatcher(Parserator(transport=PackedTransport()), max_wait=5.0, max_records=2)
+
+    def fail(batch):
+        raise RuntimeError("packing failed")
+
+    batcher._run = fail
+    results = run_threads(batcher, inputs)
+
+    assert [result["error"]["code"] for result in results] == ["CLIENT_ERROR", "CLIENT_ERROR"]
+    assert results[0] is not results[1]
+    assert results[0]["error"] is not results[1]["error"]
+
+
+def test_async_batcher():
+    transport = AsyncPackedTransport()
+    inputs = [f"record number {index}" for index in range(6)]
+
+    async def main():
+        async with AsyncParserator(transport=transport) as client:
+            async with AsyncMicroBatcher(client, max_records=3, max_wait=5.0) as batcher:
+                return await asyncio.gather(*(batcher.parse(item, SCHEMA) for item in inputs))
+
+    results = asyncio.run(main())
+
+    assert [result["parsedData"]["name"] for result in results] == inputs
+    assert len(transport.bodies) == 2
+
+
+def test_async_flush_on_close():
+    transport = AsyncPackedTransport()
+
+    async def main():
+        async with AsyncParserator(transport=transport) as client:
+            batcher = AsyncMicroBatcher(client, max_wait=60.0)
+            pending = asyncio.ensure_future(batcher.parse("waiting", SCHEMA))
+            await asyncio.sleep(0)
+            await batcher.aclose()
+            return await pending
+
+    assert asyncio.run(main())["parsedData"] == {"name": "waiting"}
+
+
+def test_async_records_use_the_local_fast_path_and_deadlines():
+    transport = AsyncPackedTransport()
+    schema = {"name": "string", "email": "email"}
+
+    async def main():
+        async with AsyncParserator(transport=transport, local_extractor=LocalExtractor()) as client:
+            async with AsyncMicroBatcher(client, max_records=2, max_wait=5.0) as batcher:
+                batched = await asyncio.gather(
+                    batcher.parse("alice ada@example.com", schema),
+                    batcher.parse("bob bob@example.com", schema),
+                )
+                late = await batcher.parse("impatient record", SCHEMA, deadline=0.05)
+                return batched, late
+
+    batched, late = asyncio.run(main())
+
+    assert transport.bodies[0]["outputSchema"] == {"r0_name": "string", "r1_name": "string"}
+    assert batched[1]["parsedData"] == {"name": "bob bob@example.com", "email": "bob@example.com"}
+    assert late["error"]["code"] == "DEADLINE_EXCEEDED"
@@ -6,6 +6,8 @@ Tests against actual API to verify functionality
 import pytest
 from parserator import Parserator
 
+pytestmark = pytest.mark.integration
+
 
 class TestParseratorRealAPI:
     """Real API tests for Parserator Python SDK"""
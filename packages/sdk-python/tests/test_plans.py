@@ -0,0 +1,129 @@
+"""
+Offline tests for Architect plan reuse
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from parserator import AsyncParserator, Parserator, PlanCache
+from parserator.plans import input_shape
+from parserator.ratelimit import estimate_request_tokens
+
+PLAN = {
+    "steps": [{"field": "name", "instruction": "Find the name", "pattern": ".*", "validation": "string"}],
+    "confidence": 0.9,
+    "strategy": "field-by-field extraction",
+}
+
+
+class PlanServer:
+    """Fake API that replays supplied plans with a configurable confidence"""
+
+    def __init__(self, replay_confidence=0.9):
+        self.replay_confidence = replay_confidence
+        self.bodies = []
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        reused = "architectPlan" in body
+        return httpx.Response(200, json={
+            "success": True,
+            "parsedData": {"name": body["inputData"]},
+            "metadata": {
+                "architectPlan": body.get("architectPlan", PLAN),
+                "planReused": reused,
+                "confidence": self.replay_confidence if reused else 0.9,
+            }
+        })
+
+
+def test_input_shape_groups_similar_inputs():
+    assert input_shape("a,b,c\n1,2,3") == input_shape("x,y,z\n4,5,6")
+    assert input_shape('{"a": 1}').startswith("json:")
+    assert input_shape("a\tb\tc").endswith(":\t")
+    assert input_shape("plain words") == "text:0:-"
+
+
+def test_second_request_replays_plan():
+    server = PlanServer()
+    client = Parserator(transport=httpx.MockTransport(server), plan_cache=PlanCache())
+
+    client.parse("Ada", {"name": "string"})
+    result = client.parse("Grace", {"name": "string"})
+
+    assert "architectPlan" not in server.bodies[0]
+    assert server.bodies[1]["architectPlan"] == PLAN
+    assert result["metadata"]["planReused"] is True
+    assert client.plan_cache.stats.hits == 1
+
+
+def test_low_confidence_replay_invalidates_plan():
+    server = PlanServer(replay_confidence=0.3)
+    plans = PlanCache(min_confidence=0.8)
+    client = Parserator(transport=httpx.MockTransport(server), plan_cache=plans)
+
+    for text in ("Ada", "Grace", "Linus"):
+        client.parse(text, {"name": "string"})
+
+    assert ["architectPlan" in body for body in server.bodies] == [False, True, False]
+    assert plans.stats.invalidations == 1
+
+
+def test_plans_are_split_by_shape_and_schema():
+    plans = PlanCache()
+    schema = {"name": "string"}
+
+    assert plans.key(schema, "a,b") != plans.key(schema, "a|b")
+    assert PlanCache(shape=None).key(schema, "a,b") == PlanCache(shape=None).key(schema, "a|b")
+    assert plans.key(schema, "x") != plans.key({"other": "string"}, "x")
+
+
+def test_eviction_and_schema_invalidation():
+    plans = PlanCache(max_entries=2)
+    schema = {"name": "string"}
+    for text in ("a,b", "a|b", "a;b"):
+        plans.put(plans.key(schema, text), PLAN)
+
+    assert len(plans) == 2
+    assert plans.stats.evictions == 1
+    assert plans.invalidate_schema(schema) == 2
+    assert len(plans) == 0
+
+
+def test_low_confidence_plans_are_not_stored():
+    plans = PlanCache(min_confidence=0.8)
+
+    assert plans.put("k", PLAN, confidence=0.5) is False
+    assert plans.put("k", "not a plan") is False
+    assert plans.get("k") is None
+
+
+def test_failed_replay_invalidates_plan():
+    plans = PlanCache()
+    client = Parserator(transport=httpx.MockTransport(lambda r: httpx.Response(500)), plan_cache=plans)
+    key = plans.key({"name": "string"}, "Ada")
+    plans.put(key, PLAN)
+
+    assert client.parse("Ada", {"name": "string"})["success"] is False
+    assert plans.get(key) is None
+
+
+def test_replayed_plan_lowers_token_estimate():
+    payload = {"inputData": "x" * 4000, "outputSchema": {"name": "string"}}
+
+    assert estimate_request_tokens(dict(payload, architectPlan=PLAN)) < estimate_request_tokens(payload)
+
+
+def test_async_client_replays_plan():
+    server = PlanServer()
+
+    async def main():
+        async with AsyncParserator(transport=httpx.MockTransport(server), plan_cache=PlanCache()) as client:
+            await client.parse("Ada", {"name": "string"})
+            await client.parse("Grace", {"name": "string"})
+
+    asyncio.run(main())
+    assert server.bodies[1]["architectPlan"] == PLAN
@@ -0,0 +1,41 @@
+"""
+Connection pool configuration and statistics tests against a local server
+"""
+
+import httpx
+
+from parserator import Parserator
+
+
+def test_pool_stats_count_new_and_reused_connections(server_url):
+    with Parserator(base_url=server_url) as client:
+        for _ in range(3):
+            assert client.parse("x", {"a": "string"})["success"] is True
+        stats = client.pool_stats()
+
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 2
+    assert stats["idle_connections"] == 1
+    assert stats["active_connections"] == 0
+
+
+def test_prewarm_opens_connections_up_front(server_url):
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    with Parserator(base_url=server_url, limits=limits, prewarm=3) as client:
+        assert client.pool_stats()["idle_connections"] >= 1
+        client.parse("x", {"a": "string"})
+        assert client.pool_stats()["reused_connections"] == 1
+
+
+def test_separate_timeouts_are_accepted(server_url):
+    timeout = httpx.Timeout(5.0, connect=1.0, pool=0.5)
+    with Parserator(base_url=server_url, timeout=timeout) as client:
+        assert client.client.timeout.connect == 1.0
+        assert client.parse("x", {"a": "string"})["success"] is True
+
+
+def test_prewarm_with_no_connections_is_a_no_op():
+    with Parserator(transport=httpx.MockTransport(lambda request: httpx.Response(500))) as client:
+        assert client.prewarm(0) == 0
+        assert client.pool_stats()["requests"] == 0
@@ -0,0 +1,76 @@
+"""
+Offline tests for client-side rate limiting
+"""
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from parserator import FileRateLimiter, Parserator, RateLimiter
+from parserator.ratelimit import estimate_request_tokens
+
+from conftest import fake_parse_response
+
+
+def test_requests_are_spaced_to_the_quota():
+    limiter = RateLimiter(requests_per_second=100, burst=1, headroom=1.0)
+    waits = [limiter.reserve() for _ in range(5)]
+
+    assert waits[0] == 0
+    assert waits[1:] == pytest.approx([0.01, 0.02, 0.03, 0.04], abs=2e-3)
+
+
+def test_burst_allows_back_to_back_requests():
+    limiter = RateLimiter(requests_per_second=10, burst=3, headroom=1.0)
+    waits = [limiter.reserve() for _ in range(4)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert waits[3] > 0
+
+
+def test_token_bucket_limits_large_requests():
+    limiter = RateLimiter(tokens_per_minute=600, headroom=1.0)
+    # 10 tokens/s with ten seconds of burst capacity
+    assert limiter.reserve(100) == 0
+    assert limiter.reserve(50) == pytest.approx(5.0, abs=0.05)
+
+
+def test_pause_holds_back_callers():
+    limiter = RateLimiter(requests_per_second=1000, headroom=1.0)
+    limiter.pause(0.5)
+    assert limiter.reserve() >= 0.5
+
+
+def test_limiter_is_shared_across_threads():
+    limiter = RateLimiter(requests_per_second=200, burst=1, headroom=1.0)
+    client = Parserator(transport=httpx.MockTransport(fake_parse_response), rate_limiter=limiter)
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=client.parse, args=(str(i), {"n": "string"})) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 19 / 200 * 0.9
+
+
+def test_file_limiter_shares_state(tmp_path):
+    path = tmp_path / "limiter.state"
+    first = FileRateLimiter(path, requests_per_second=10, burst=1, headroom=1.0)
+    second = FileRateLimiter(path, requests_per_second=10, burst=1, headroom=1.0)
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(0.1, abs=0.02)
+
+
+def test_plan_limits_and_token_estimate():
+    limiter = RateLimiter.for_plan("free", headroom=1.0)
+    limiter.reserve()
+    assert limiter.reserve() == pytest.approx(6.0, abs=0.05)
+
+    small = estimate_request_tokens({"inputData": "x" * 100, "outputSchema": {"a": "string"}})
+    large = estimate_request_tokens({"inputData": "x" * 10000, "outputSchema": {"a": "string"}})
+    assert 400 < small < large
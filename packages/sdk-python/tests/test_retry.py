@@ -0,0 +1,155 @@
+"""
+Offline tests for the retry policy and circuit breaker
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from parserator import AsyncParserator, CircuitBreaker, Parserator, RetryPolicy
+from parserator.retry import parse_retry_after
+
+from conftest import fake_parse_response
+
+
+def flaky_transport(failures, status=503, headers=None):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) <= failures:
+            return httpx.Response(status, headers=headers or {})
+        return fake_parse_response(request)
+
+    return calls, handler
+
+
+def fast_policy(**kwargs):
+    kwargs.setdefault("backoff_base", 0.001)
+    return RetryPolicy(**kwargs)
+
+
+def test_transient_errors_are_retried():
+    calls, handler = flaky_transport(failures=2)
+    client = Parserator(transport=httpx.MockTransport(handler), retry=fast_policy())
+
+    result = client.parse("Jane", {"name": "string"})
+
+    assert result["success"] is True
+    assert len(calls) == 3
+
+
+def test_gives_up_after_max_attempts():
+    calls, handler = flaky_transport(failures=10, status=502)
+    client = Parserator(transport=httpx.MockTransport(handler), retry=fast_policy(max_attempts=3))
+
+    result = client.parse("Jane", {"name": "string"})
+
+    assert result["error"]["code"] == "HTTP_ERROR"
+    assert len(calls) == 3
+
+
+def test_client_errors_are_not_retried():
+    calls, handler = flaky_transport(failures=10, status=400)
+    client = Parserator(transport=httpx.MockTransport(handler), retry=fast_policy())
+
+    client.parse("Jane", {"name": "string"})
+
+    assert len(calls) == 1
+
+
+def test_transport_exceptions_are_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return fake_parse_response(request)
+
+    client = Parserator(transport=httpx.MockTransport(handler), retry=fast_policy())
+
+    assert client.parse("Jane", {"name": "string"})["success"] is True
+
+
+def test_retry_after_is_honored_within_budget():
+    calls, handler = flaky_transport(failures=1, status=429, headers={"Retry-After": "120"})
+    client = Parserator(transport=httpx.MockTransport(handler), retry=fast_policy(max_retry_time=5))
+
+    result = client.parse("Jane", {"name": "string"})
+
+    # Waiting 120s would blow the 5s budget, so the 429 is returned as-is
+    assert result["error"]["code"] == "HTTP_ERROR"
+    assert len(calls) == 1
+
+
+def test_parse_retry_after_formats():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_circuit_breaker_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    calls, handler = flaky_transport(failures=100)
+    client = Parserator(
+        transport=httpx.MockTransport(handler),
+        retry=fast_policy(max_attempts=1, circuit_breaker=breaker)
+    )
+
+    client.parse("a", {"name": "string"})
+    client.parse("b", {"name": "string"})
+    result = client.parse("c", {"name": "string"})
+
+    assert result["error"]["code"] == "CIRCUIT_OPEN"
+    assert len(calls) == 2
+
+
+def test_circuit_breaker_half_open_recovers():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure("api")
+
+    assert breaker.allow("api") is True
+    assert breaker.state("api") == CircuitBreaker.HALF_OPEN
+    breaker.record_success("api")
+    assert breaker.state("api") == CircuitBreaker.CLOSED
+
+
+def test_abandoned_half_open_trial_does_not_wedge_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    calls, handler = flaky_transport(failures=2)
+    client = Parserator(
+        transport=httpx.MockTransport(handler),
+        retry=fast_policy(max_attempts=1, circuit_breaker=breaker)
+    )
+    client.parse("a", {"name": "string"})
+    client.parse("b", {"name": "string"})
+    time.sleep(0.06)
+
+    assert client.parse("c", {"name": "string"}, deadline=0)["error"]["code"] == "DEADLINE_EXCEEDED"
+    assert breaker.state(client.client.base_url.host) == CircuitBreaker.OPEN
+    assert client.parse("d", {"name": "string"})["success"] is True
+    assert breaker.state(client.client.base_url.host) == CircuitBreaker.CLOSED
+
+
+def test_silent_half_open_trial_is_replaced_after_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure("api")
+    time.sleep(0.06)
+
+    assert breaker.allow("api") is True
+    assert breaker.allow("api") is False
+    time.sleep(0.06)
+    assert breaker.allow("api") is True
+
+
+def test_async_client_retries():
+    calls, handler = flaky_transport(failures=2)
+
+    async def main():
+        async with AsyncParserator(transport=httpx.MockTransport(handler), retry=fast_policy()) as client:
+            return await client.parse("Jane", {"name": "string"})
+
+    assert asyncio.run(main())["success"] is True
+    assert len(calls) == 3
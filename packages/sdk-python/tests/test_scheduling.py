@@ -0,0 +1,152 @@
+"""
+Offline tests for per-call priorities and deadlines
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from parserator import AsyncParserator, ConcurrencyLimiter, DeadlineExceeded, Parserator, RetryPolicy, Ticket
+from parserator.scheduling import DEADLINE_HEADER
+
+from conftest import fake_parse_response
+
+SCHEMA = {"name": "string"}
+
+
+def test_waiters_are_admitted_by_priority_then_arrival():
+    limiter = ConcurrencyLimiter(1)
+    limiter.acquire()
+    order = []
+
+    def worker(name, priority):
+        limiter.acquire(Ticket(priority))
+        order.append(name)
+        limiter.release()
+
+    threads = []
+    for name, priority in (("low", 0), ("high", 5), ("low2", 0), ("high2", 5)):
+        thread = threading.Thread(target=worker, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        while limiter.waiting < len(threads):
+            time.sleep(0.001)
+
+    limiter.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == ["high", "high2", "low", "low2"]
+    assert limiter.in_flight == 0
+
+
+def test_expired_waiter_gives_up_and_is_skipped():
+    limiter = ConcurrencyLimiter(1)
+    limiter.acquire()
+
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire(Ticket.start(deadline=0.02))
+
+    assert limiter.stats.expired == 1
+    assert limiter.waiting == 0
+    limiter.release()
+    limiter.acquire()
+    assert limiter.in_flight == 1
+
+
+def test_async_waiter_times_out_and_slot_stays_usable():
+    limiter = ConcurrencyLimiter(1)
+
+    async def main():
+        await limiter.acquire_async()
+        with pytest.raises(DeadlineExceeded):
+            await limiter.acquire_async(Ticket.start(deadline=0.02))
+        limiter.release()
+        await asyncio.wait_for(limiter.acquire_async(), 1)
+        limiter.release()
+
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+    assert limiter.stats.expired == 1
+
+
+def test_deadline_header_is_sent():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get(DEADLINE_HEADER))
+        return fake_parse_response(request)
+
+    client = Parserator(transport=httpx.MockTransport(handler))
+    assert client.parse("Jane", SCHEMA)["success"]
+    assert client.parse("Jane", SCHEMA, deadline=5.0)["success"]
+
+    assert seen[0] is None
+    assert 4000 < int(seen[1]) <= 5000
+
+
+def test_queued_call_past_its_deadline_is_not_sent():
+    sent = []
+    release = threading.Event()
+
+    def handler(request):
+        sent.append(request)
+        release.wait(2)
+        return fake_parse_response(request)
+
+    client = Parserator(transport=httpx.MockTransport(handler), max_in_flight=1)
+    blocker = threading.Thread(target=client.parse, args=("first", SCHEMA))
+    blocker.start()
+    while not sent:
+        time.sleep(0.001)
+
+    result = client.parse("second", SCHEMA, deadline=0.05)
+    release.set()
+    blocker.join()
+
+    assert result["success"] is False
+    assert result["error"]["code"] == "DEADLINE_EXCEEDED"
+    assert len(sent) == 1
+    assert client.in_flight_limiter.stats.expired == 1
+
+
+def test_retries_stop_when_the_deadline_would_pass():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, headers={"Retry-After": "1"}, json={"success": False})
+
+    client = Parserator(transport=httpx.MockTransport(handler), retry=RetryPolicy(max_attempts=5))
+
+    started = time.monotonic()
+    result = client.parse("Jane", SCHEMA, deadline=0.3)
+
+    assert result["success"] is False
+    assert len(calls) == 1
+    assert time.monotonic() - started < 0.3
+
+
+def test_async_client_sheds_expired_batch_items():
+    sent = []
+
+    async def handler(request):
+        sent.append(request)
+        await asyncio.sleep(0.05)
+        return fake_parse_response(request)
+
+    async def main():
+        async with AsyncParserator(transport=httpx.MockTransport(handler), max_concurrency=1) as client:
+            return [result async for _, result in client.parse_many(
+                [f"r{i}" for i in range(6)], SCHEMA, concurrency=6, deadline=0.12
+            )]
+
+    results = asyncio.run(main())
+
+    codes = [result["error"]["code"] for result in results if not result["success"]]
+    assert 1 <= len(sent) <= 3
+    assert codes and set(codes) == {"DEADLINE_EXCEEDED"}
+    assert len(codes) + len(sent) == 6
@@ -0,0 +1,130 @@
+"""
+Offline tests for compiled schemas and server-side schema references
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from parserator import AsyncParserator, MemoryCache, Parserator, SchemaError, compile_schema
+from parserator.cache import schema_fingerprint
+from parserator.schema import SchemaRegistry
+
+from conftest import fake_parse_response
+
+
+class RegistryServer:
+    """Fake API that supports /v1/schemas and outputSchemaRef"""
+
+    def __init__(self):
+        self.schemas = {}
+        self.bodies = []
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        if request.url.path == "/v1/schemas":
+            ref = schema_fingerprint(body["outputSchema"])
+            self.schemas[ref] = body["outputSchema"]
+            return httpx.Response(200, json={"success": True, "schemaRef": ref})
+
+        if "outputSchemaRef" in body:
+            schema = self.schemas.get(body["outputSchemaRef"])
+            if schema is None:
+                return httpx.Response(422, json={
+                    "success": False,
+                    "error": {"code": "SCHEMA_NOT_FOUND", "message": "unknown"}
+                })
+            body = dict(body, outputSchema=schema)
+        return fake_parse_response(httpx.Request("POST", request.url, json=body))
+
+
+def test_compile_canonicalizes_and_fingerprints():
+    a = compile_schema({"b": "NUMBER ", "a": "string"})
+    b = compile_schema({"a": "string", "b": "number"})
+
+    assert list(a.fields) == ["a", "b"]
+    assert a.fields == {"a": "string", "b": "number"}
+    assert a == b and a.fingerprint == b.fingerprint
+    assert a.canonical_json == '{"a":"string","b":"number"}'
+
+
+def test_compile_reports_every_problem():
+    with pytest.raises(SchemaError) as info:
+        compile_schema({"a": "strng", "": "string", "c": 3})
+
+    assert len(info.value.problems) == 3
+
+
+@pytest.mark.parametrize("schema", [{}, None, ["a"]])
+def test_compile_rejects_non_mappings(schema):
+    with pytest.raises(SchemaError):
+        compile_schema(schema)
+
+
+def test_registry_shares_instances():
+    registry = SchemaRegistry()
+    first = registry.compile({"a": "string"})
+
+    assert registry.compile({"a": "STRING"}) is first
+    assert first.fingerprint in registry
+    assert registry.server_ref(first.fingerprint) is None
+
+
+def test_registered_schema_is_sent_by_reference():
+    server = RegistryServer()
+    client = Parserator(transport=httpx.MockTransport(server))
+
+    schema = client.register_schema({"name": "string"})
+    result = client.parse("Ada", schema)
+
+    assert result["parsedData"] == {"name": "name:Ada"}
+    assert "outputSchema" not in server.bodies[-1]
+    assert server.bodies[-1]["outputSchemaRef"] == schema.fingerprint
+
+
+def test_unregistered_compiled_schema_is_sent_in_full():
+    server = RegistryServer()
+    client = Parserator(transport=httpx.MockTransport(server))
+
+    client.parse("Ada", compile_schema({"name": "string"}))
+
+    assert server.bodies[-1]["outputSchema"] == {"name": "string"}
+    assert "outputSchemaRef" not in server.bodies[-1]
+
+
+def test_unknown_reference_falls_back_to_full_schema():
+    server = RegistryServer()
+    client = Parserator(transport=httpx.MockTransport(server))
+    schema = client.register_schema({"name": "string"})
+    server.schemas.clear()
+
+    result = client.parse("Ada", schema)
+
+    assert result["success"] is True
+    assert server.bodies[-1]["outputSchema"] == {"name": "string"}
+    assert client.schemas.server_ref(schema.fingerprint) is None
+
+
+def test_compiled_and_plain_schemas_share_cache_entries():
+    server = RegistryServer()
+    client = Parserator(transport=httpx.MockTransport(server), cache=MemoryCache())
+
+    client.parse("Ada", {"name": "string"})
+    client.parse("Ada", compile_schema({"name": "string"}))
+
+    assert client.cache.stats.hits == 1
+
+
+def test_async_register_and_parse_by_reference():
+    server = RegistryServer()
+
+    async def main():
+        async with AsyncParserator(transport=httpx.MockTransport(server)) as client:
+            schema = await client.register_schema({"name": "string"})
+            return await client.parse("Ada", schema)
+
+    assert asyncio.run(main())["parsedData"] == {"name": "name:Ada"}
+    assert "outputSchema" not in server.bodies[-1]
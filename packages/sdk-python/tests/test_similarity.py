@@ -0,0 +1,113 @@
+"""
+Offline tests for the near-duplicate similarity index
+"""
+
+import httpx
+import pytest
+
+from parserator import Parserator, PlanCache, SimilarityIndex
+from parserator import similarity
+
+from test_plans import PLAN, PlanServer
+
+TEMPLATE = (
+    "Hello {name}, thanks for your order placed at our store on Monday. Your items will ship "
+    "within three business days to the address we have on file for your account. Reply to this "
+    "email with any questions about delivery, returns, exchanges or billing and our support team "
+    "will get back to you within one working day. Kind regards, the customer care team."
+)
+
+
+def test_near_duplicates_match_and_unrelated_text_does_not():
+    index = SimilarityIndex(threshold=0.7)
+    index.add("schema", TEMPLATE.format(name="Ada"), "ada")
+
+    match = index.lookup("schema", TEMPLATE.format(name="Grace"))
+    assert match is not None
+    assert match.value == "ada"
+    assert 0.7 <= match.similarity < 1.0
+
+    assert index.lookup("schema", "Invoice 4411 from Acme Corp, total due $1,200 by March 3") is None
+    assert index.lookup("other-schema", TEMPLATE.format(name="Grace")) is None
+    assert index.stats.hits == 1
+    assert index.stats.misses == 2
+
+
+def test_identical_signatures_update_in_place():
+    index = SimilarityIndex()
+    index.add("schema", TEMPLATE.format(name="Ada"), 1)
+    index.add("schema", TEMPLATE.format(name="Ada") + "  ", 2)
+
+    assert len(index) == 1
+    assert index.lookup("schema", TEMPLATE.format(name="Ada")).value == 2
+
+
+def test_least_recently_used_entries_are_evicted_and_slots_reused():
+    index = SimilarityIndex(max_entries=2)
+    texts = [f"entry number {i} " + " ".join(f"word{i}x{j}" for j in range(30)) for i in range(3)]
+    index.add("schema", texts[0], 0)
+    index.add("schema", texts[1], 1)
+    assert index.lookup("schema", texts[0]).value == 0
+    index.add("schema", texts[2], 2)
+
+    assert len(index) == 2
+    assert index.stats.evictions == 1
+    assert index.lookup("schema", texts[1]) is None
+    assert index.lookup("schema", texts[2]).value == 2
+    assert len(index._signatures) == 2 * index.num_perm
+
+
+def test_pure_python_signature_matches_numpy(monkeypatch):
+    index = SimilarityIndex()
+    if index._numpy is None:
+        pytest.skip("numpy not installed")
+    text = TEMPLATE.format(name="Ada")
+    expected = index.signature(text)
+
+    monkeypatch.setattr(index, "_numpy", None)
+    assert index.signature(text) == expected
+
+
+def test_banding_is_chosen_from_the_threshold():
+    assert similarity.lsh_bands(0.8, 64) == (8, 8)
+    assert similarity.lsh_bands(0.5, 64) == (16, 4)
+    assert similarity.lsh_bands(1.0, 64) == (1, 64)
+
+
+def test_client_replays_plan_of_similar_input():
+    server = PlanServer()
+    index = SimilarityIndex(threshold=0.7)
+    client = Parserator(transport=httpx.MockTransport(server), similarity=index)
+
+    client.parse(TEMPLATE.format(name="Ada"), {"name": "string"})
+    result = client.parse(TEMPLATE.format(name="Grace"), {"name": "string"})
+    client.parse("Completely different text about the weather in Paris", {"name": "string"})
+
+    assert ["architectPlan" in body for body in server.bodies] == [False, True, False]
+    assert server.bodies[1]["architectPlan"] == PLAN
+    assert result["metadata"]["planReused"] is True
+
+
+def test_plan_cache_takes_precedence_and_still_learns():
+    server = PlanServer()
+    plans = PlanCache()
+    index = SimilarityIndex(threshold=0.7)
+    client = Parserator(transport=httpx.MockTransport(server), plan_cache=plans, similarity=index)
+
+    client.parse(TEMPLATE.format(name="Ada"), {"name": "string"})
+    client.parse(TEMPLATE.format(name="Grace"), {"name": "string"})
+
+    assert plans.stats.hits == 1
+    assert index.stats.hits == 0
+    assert len(plans) == 1
+
+
+def test_low_confidence_results_are_not_indexed():
+    server = PlanServer(replay_confidence=0.3)
+    index = SimilarityIndex(threshold=0.7, min_confidence=0.8)
+    client = Parserator(transport=httpx.MockTransport(server), similarity=index)
+
+    client.parse(TEMPLATE.format(name="Ada"), {"name": "string"})
+    client.parse(TEMPLATE.format(name="Grace"), {"name": "string"})
+
+    assert len(index) == 1
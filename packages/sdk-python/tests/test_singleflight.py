@@ -0,0 +1,155 @@
+"""
+Offline tests for in-flight request coalescing
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+
+from parserator import AsyncParserator, Parserator
+from parserator import singleflight
+from parserator.singleflight import AsyncSingleFlight, SingleFlight
+
+from conftest import fake_parse_response
+
+
+def test_identical_concurrent_calls_share_one_request():
+    calls = []
+    release = threading.Event()
+
+    def handler(request):
+        calls.append(request)
+        release.wait(2)
+        return fake_parse_response(request)
+
+    client = Parserator(transport=httpx.MockTransport(handler), coalesce=True)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.parse("Jane", {"name": "string"})))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 2
+    while client.singleflight.coalesced < 7 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert client.singleflight.coalesced == 7
+    assert all(r["parsedData"] == {"name": "name:Jane"} for r in results)
+
+
+def test_different_inputs_are_not_coalesced():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return fake_parse_response(request)
+
+    client = Parserator(transport=httpx.MockTransport(handler), coalesce=True)
+    client.parse("Jane", {"name": "string"})
+    client.parse("John", {"name": "string"})
+
+    assert len(calls) == 2
+    assert client.singleflight.coalesced == 0
+
+
+def test_leader_mutations_do_not_reach_followers(monkeypatch):
+    def slow_deepcopy(value):
+        time.sleep(0.05)
+        return copy.deepcopy(value)
+
+    monkeypatch.setattr(singleflight, "copy", SimpleNamespace(deepcopy=slow_deepcopy))
+    flight = SingleFlight()
+    release = threading.Event()
+    results = []
+
+    def fetch():
+        release.wait(2)
+        return {"items": [1]}
+
+    def call():
+        result = flight.do("key", fetch)
+        result["items"].append("mutated by its caller")
+        results.append(result)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 2
+    while flight.coalesced < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert [result["items"] for result in results] == [[1, "mutated by its caller"]] * 4
+
+
+def test_calls_with_a_deadline_do_not_join_other_flights():
+    calls = []
+    release = threading.Event()
+
+    def handler(request):
+        calls.append(request)
+        release.wait(2)
+        return fake_parse_response(request)
+
+    client = Parserator(transport=httpx.MockTransport(handler), coalesce=True)
+    leader = threading.Thread(target=client.parse, args=("Jane", {"name": "string"}))
+    leader.start()
+    while not calls:
+        time.sleep(0.001)
+    follower = threading.Thread(target=client.parse, args=("Jane", {"name": "string"}), kwargs={"deadline": 5})
+    follower.start()
+    while len(calls) < 2 and follower.is_alive():
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert len(calls) == 2
+    assert client.singleflight.coalesced == 0
+
+
+def test_async_identical_calls_share_one_request():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return fake_parse_response(request)
+
+    async def main():
+        async with AsyncParserator(transport=httpx.MockTransport(handler), coalesce=True) as client:
+            results = await asyncio.gather(*(client.parse("Jane", {"name": "string"}) for _ in range(10)))
+            return client.singleflight.coalesced, results
+
+    coalesced, results = asyncio.run(main())
+    assert len(calls) == 1
+    assert coalesced == 9
+    assert all(r["success"] for r in results)
+
+
+def test_async_leader_mutations_do_not_reach_followers():
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return {"items": [1]}
+
+    async def call(flight):
+        result = await flight.do("key", fetch)
+        result["items"].append("mutated by its caller")
+        return result
+
+    async def main():
+        flight = AsyncSingleFlight()
+        return await asyncio.gather(*(call(flight) for _ in range(4)))
+
+    assert [result["items"] for result in asyncio.run(main())] == [[1, "mutated by its caller"]] * 4
@@ -0,0 +1,57 @@
+"""
+Tests for the stub API used by benchmarks
+"""
+
+import asyncio
+
+from parserator import AsyncParserator, Parserator
+from parserator.testing import StubAPI
+
+
+def test_stub_transport_fills_schema():
+    stub = StubAPI(response_bytes=4)
+    with Parserator(api_key="pk_test_x", transport=stub.transport()) as client:
+        result = client.parse("hello world", {"name": "string", "email": "email"})
+
+    assert result["success"] is True
+    assert result["parsedData"] == {"name": "hello worldxxxx", "email": "hello worldxxxx"}
+    assert stub.requests == 1
+
+
+def test_stub_error_rate_is_reproducible():
+    def failures(seed):
+        stub = StubAPI(error_rate=0.5, seed=seed)
+        with Parserator(api_key="pk_test_x", transport=stub.transport()) as client:
+            return [not client.parse(str(i), {"a": "string"})["success"] for i in range(20)]
+
+    first = failures(7)
+    assert first == failures(7)
+    assert 0 < sum(first) < 20
+
+
+def test_stub_accepts_compressed_bodies():
+    stub = StubAPI()
+    with Parserator(api_key="pk_test_x", transport=stub.transport(),
+                    compression="gzip", compression_threshold=0) as client:
+        result = client.parse("x" * 1000, {"a": "string"})
+
+    assert result["parsedData"] == {"a": "x" * 32}
+
+
+def test_stub_async_transport():
+    stub = StubAPI(latency=0.001)
+
+    async def main():
+        async with AsyncParserator(api_key="pk_test_x", transport=stub.async_transport()) as client:
+            return await client.parse("hi", {"a": "string"})
+
+    assert asyncio.run(main())["parsedData"] == {"a": "hi"}
+
+
+def test_stub_serves_http():
+    stub = StubAPI()
+    with stub.serve() as base_url:
+        with Parserator(api_key="pk_test_x", base_url=base_url) as client:
+            assert client.health_check()["status"] == "healthy"
+            assert client.parse("hi", {"a": "string"})["success"] is True
+    assert stub.requests == 2